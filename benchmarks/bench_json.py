@@ -0,0 +1,90 @@
+"""
+JSON rendering time of the `JSONResponse` backends on realistic payloads.
+
+The `json (str)` row is the former rendering, `json.dumps` then `encode`.
+
+Run: python benchmarks/bench_json.py
+"""
+import dataclasses
+import datetime
+import json
+import timeit
+
+from speedy.utils.serializers import JSON_BACKENDS, get_json_encoder
+
+REPEATS = 5
+
+
+@dataclasses.dataclass
+class Address:
+    city: str
+    street: str
+    zip_code: str
+
+
+@dataclasses.dataclass
+class User:
+    id: int
+    name: str
+    email: str
+    is_active: bool
+    score: float
+    created: datetime.datetime
+    address: Address
+    tags: list[str]
+
+
+def get_user(index: int) -> dict:
+    return {
+        'id': index,
+        'name': f'User {index}',
+        'email': f'user{index}@example.org',
+        'is_active': index % 3 != 0,
+        'score': index * 1.5,
+        'created': f'2024-05-{index % 28 + 1:02d}T12:30:15',
+        'address': {'city': 'Москва', 'street': f'Street {index}', 'zip_code': f'{index:06d}'},
+        'tags': ['admin', 'staff'] if index % 10 == 0 else ['user'],
+    }
+
+
+def get_dataclass_user(index: int) -> User:
+    user = get_user(index)
+    return User(**{
+        **user,
+        'created': datetime.datetime(2024, 5, index % 28 + 1, 12, 30, 15),
+        'address': Address(**user['address']),
+    })
+
+
+PAYLOADS = {
+    'small object': {'status': 'ok', 'id': 42, 'message': 'Created'},
+    'list of 100 users': [get_user(index) for index in range(100)],
+    'page of 1000 users': {'count': 1000, 'next': None, 'results': [get_user(index) for index in range(1000)]},
+    '100 dataclass users': [get_dataclass_user(index) for index in range(100)],
+}
+
+
+def stdlib_str(content) -> bytes:
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(',', ':')).encode('utf-8')
+
+
+def main() -> None:
+    encoders = {backend: get_json_encoder(backend) for backend in JSON_BACKENDS}
+    encoders['json (str)'] = stdlib_str
+    print(f'{"payload":>22} ' + ' '.join(f'{name:>12}' for name in encoders) + '   (us per render)')
+    for name, payload in PAYLOADS.items():
+        timings = []
+        for encoder in encoders.values():
+            try:
+                encoder(payload)
+            except TypeError:
+                timings.append(None)
+                continue
+            number = max(1, 20_000 // len(encoder(payload)))
+            elapsed = min(timeit.repeat(lambda: encoder(payload), number=number, repeat=REPEATS))
+            timings.append(elapsed / number * 1e6)
+        print(f'{name:>22} ' + ' '.join(f'{timing:>12.2f}' if timing is not None else f'{"-":>12}' for timing in timings))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""
+Request overhead of each pass-through middleware layer of the application stack.
+
+Run: python benchmarks/bench_middleware.py
+"""
+import asyncio
+import time
+
+from speedy import Speedy
+from speedy.middleware import Middleware
+from speedy.response import PlainTextResponse
+from speedy.routing import Route
+
+LAYER_COUNTS = (0, 1, 5, 10, 20)
+REQUESTS = 20_000
+
+
+async def endpoint(request):
+    return PlainTextResponse('endpoint')
+
+
+class PassThroughMiddleware:
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        await self.app(scope, receive, send)
+
+
+async def receive() -> dict:
+    return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+
+async def send(message: dict) -> None:
+    pass
+
+
+async def run(app: Speedy) -> float:
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        scope = {'type': 'http', 'method': 'GET', 'path': '/', 'root_path': '', 'query_string': b'', 'headers': []}
+        await app(scope, receive, send)
+    return time.perf_counter() - start
+
+
+async def main() -> None:
+    print(f'{"layers":>8} {"request, us":>12} {"per layer, us":>14}')
+    baseline = None
+    for count in LAYER_COUNTS:
+        app = Speedy(
+            middleware=[Middleware(PassThroughMiddleware) for _ in range(count)],
+            routes=[Route('/', endpoint)]
+        )
+        elapsed = min([await run(app) for _ in range(5)]) / REQUESTS * 1e6
+        if baseline is None:
+            baseline = elapsed
+        per_layer = (elapsed - baseline) / count if count else 0.0
+        print(f'{count:>8} {elapsed:>12.2f} {per_layer:>14.3f}')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,60 @@
+"""
+Route matching latency of the route tree against a linear scan of the routes.
+
+Run: python benchmarks/bench_router.py
+"""
+import random
+import timeit
+
+from speedy import Match
+from speedy.response import PlainTextResponse
+from speedy.routing import Router, Route
+
+ROUTE_COUNTS = (10, 100, 1_000)
+LOOKUPS = 10_000
+
+
+def endpoint(request):
+    return PlainTextResponse('endpoint')
+
+
+def get_routes(count: int) -> list[Route]:
+    routes = []
+    for index in range(count // 2):
+        routes.append(Route(f'/api/resource{index}', endpoint))
+        routes.append(Route(f'/api/resource{index}/{{item_id:int}}/items/{{name}}', endpoint))
+    return routes
+
+
+def get_scopes(count: int) -> list[dict]:
+    scopes = []
+    for _ in range(LOOKUPS):
+        index = random.randrange(count // 2)
+        path = random.choice((f'/api/resource{index}', f'/api/resource{index}/42/items/book'))
+        scopes.append({'type': 'http', 'method': 'GET', 'path': path, 'root_path': ''})
+    return scopes
+
+
+def linear_match(routes: list[Route], scope: dict) -> Route | None:
+    for route in routes:
+        match, _ = route.matches(scope)
+        if match is Match.FULL:
+            return route
+    return None
+
+
+def main() -> None:
+    random.seed(0)
+    print(f'{"routes":>8} {"tree, us":>10} {"linear, us":>12}')
+    for count in ROUTE_COUNTS:
+        routes = get_routes(count)
+        router = Router(routes)
+        scopes = get_scopes(count)
+
+        tree_time = min(timeit.repeat(lambda: [router.match(scope) for scope in scopes], number=1, repeat=5))
+        linear_time = min(timeit.repeat(lambda: [linear_match(routes, scope) for scope in scopes], number=1, repeat=5))
+        print(f'{count:>8} {tree_time / LOOKUPS * 1e6:>10.2f} {linear_time / LOOKUPS * 1e6:>12.2f}')
+
+
+if __name__ == '__main__':
+    main()
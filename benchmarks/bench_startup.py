@@ -0,0 +1,53 @@
+"""
+Router build time from the route definitions against a loaded route snapshot.
+
+Run: python benchmarks/bench_startup.py
+"""
+import re
+import tempfile
+import timeit
+from pathlib import Path
+
+from speedy.response import PlainTextResponse
+from speedy.routing import Router, Route, RouteSnapshot
+
+ROUTE_COUNTS = (100, 1_000, 5_000)
+
+
+def endpoint(request):
+    return PlainTextResponse('endpoint')
+
+
+def get_routes(count: int) -> list[Route]:
+    routes = []
+    for index in range(count // 2):
+        routes.append(Route(f'/api/resource{index}', endpoint))
+        routes.append(Route(f'/api/resource{index}/{{item_id:int}}/items/{{name}}.{{ext}}', endpoint))
+    return routes
+
+
+def build_cold(count: int) -> None:
+    re.purge()
+    Router(get_routes(count))
+
+
+def build_from_snapshot(snapshot_path: Path, count: int) -> None:
+    re.purge()
+    RouteSnapshot(snapshot_path).build(lambda: Router(get_routes(count)))
+
+
+def main() -> None:
+    print(f'{"routes":>8} {"cold, ms":>10} {"snapshot, ms":>14} {"saved":>7}')
+    with tempfile.TemporaryDirectory() as directory:
+        for count in ROUTE_COUNTS:
+            snapshot_path = Path(directory) / f'routes-{count}.snapshot'
+            RouteSnapshot(snapshot_path).dump(Router(get_routes(count)))
+
+            cold_time = min(timeit.repeat(lambda: build_cold(count), number=1, repeat=5))
+            snapshot_time = min(timeit.repeat(lambda: build_from_snapshot(snapshot_path, count), number=1, repeat=5))
+            saved = 1 - snapshot_time / cold_time
+            print(f'{count:>8} {cold_time * 1e3:>10.2f} {snapshot_time * 1e3:>14.2f} {saved:>7.0%}')
+
+
+if __name__ == '__main__':
+    main()
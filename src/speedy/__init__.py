@@ -1,5 +1,5 @@
 from .background import BackgroundTask, BackgroundTasks
-from .enums import MediaType, HttpMethod, ScopeType, RequestEncodingType
+from .enums import MediaType, HttpMethod, ScopeType, RequestEncodingType, Match
 from .app import Speedy
 
 __all__ = (
@@ -9,5 +9,6 @@ __all__ = (
     'BackgroundTask',
     'BackgroundTasks',
     'Speedy',
-    'RequestEncodingType'
+    'RequestEncodingType',
+    'Match'
 )
@@ -1,16 +1,26 @@
-from typing import Sequence
+from typing import Sequence, Any
 
+from speedy.datastructures import URLPath
 from speedy.middleware import Middleware
 from speedy.protocols.app import ASGIApplication
+from speedy.protocols.middleware import MiddlewareProtocol
+from speedy.routing import BaseRoute, Router
 from speedy.types import Scope, ASGIReceiveCallable, ASGISendCallable
 from speedy.types.application import ASGIAppType
 from speedy.types.asgi_types import LifespanScope, LifeSpanReceiveMessage, LifeSpanSendMessage
 
 
 class Speedy(ASGIApplication):
-    def __init__(self, middleware: Sequence[Middleware] | None = None) -> None:
-        self.middleware_stack: ASGIAppType | None = None
+    """ The application, its middleware stack is built once and the `outermost` middleware go first. """
+
+    def __init__(
+            self,
+            middleware: Sequence[Middleware] | None = None,
+            routes: Sequence[BaseRoute] | None = None
+    ) -> None:
+        self.router = Router(routes)
         self.user_middleware = self._get_user_middleware(middleware)
+        self.middleware_stack = self.build_middleware_stack()
 
     async def __call__(
             self,
@@ -19,14 +29,42 @@ class Speedy(ASGIApplication):
             send: ASGISendCallable | LifeSpanSendMessage
     ) -> None:
         scope['app'] = self
-
-        if self.middleware_stack is None:
-            self.middleware_stack = self.build_middleware_stack()
-
         await self.middleware_stack(scope, receive, send)
 
     def build_middleware_stack(self) -> ASGIAppType:
-        return self
+        app: ASGIAppType = self.router
+        middleware_stack = sorted(self.user_middleware, key=lambda item: not getattr(item.cls, 'outermost', False))
+        for middleware in reversed(middleware_stack):
+            app = middleware.build(app)
+        return app
+
+    def add_middleware(self, cls: type[MiddlewareProtocol], *args: Any, **kwargs: Any) -> None:
+        """
+        Add the middleware as the outermost one, after the `outermost` middleware classes.
+
+        Only the new middleware is wrapped around the built stack, so the
+        state of the other middleware, e.g. their caches, is kept.
+        """
+        middleware = Middleware(cls, *args, **kwargs)
+        outer_count = 0 if getattr(cls, 'outermost', False) else sum(
+            1 for item in self.user_middleware if getattr(item.cls, 'outermost', False)
+        )
+        self.user_middleware.insert(0, middleware)
+
+        outer_layer = None
+        app = self.middleware_stack
+        for _ in range(outer_count):
+            outer_layer, app = app, app.app
+        if outer_layer is None:
+            self.middleware_stack = middleware.build(app)
+        else:
+            outer_layer.app = middleware.build(app)
+
+    def route_reverse(self, name: str, /, **path_params: Any) -> URLPath:
+        return self.router.url_path_for(name, **path_params)
+
+    def path_for(self, name: str, /, **path_params: Any) -> str:
+        return self.router.path_for(name, **path_params)
 
     def _get_user_middleware(self, middleware: Sequence[Middleware] | None) -> list[Middleware]:
         if middleware is None:
@@ -1,20 +1,52 @@
 import asyncio
 import contextvars
 import functools
+import threading
+import time
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import TypeVar, ParamSpec, Callable
 
 import sniffio
 
+from speedy.exceptions.base import DeadlineException
+
 T = TypeVar('T')
 P = ParamSpec('P')
 
+DEADLINE: contextvars.ContextVar[float | None] = contextvars.ContextVar('speedy.deadline', default=None)
+
 
 @dataclass
 class _State:
     EXECUTOR: ThreadPoolExecutor | None = None
     LIMITER: ThreadPoolExecutor | None = None
+    QUEUE_SIZE: int = 0
+
+
+_QUEUE_LOCK = threading.Lock()
+
+
+class _QueuedCall:
+    """ Count the synchronous call as queued until a thread starts it or it is cancelled. """
+
+    __slots__ = ('function', 'is_dequeued')
+
+    def __init__(self, function: Callable[[], T]) -> None:
+        self.function = function
+        self.is_dequeued = False
+        with _QUEUE_LOCK:
+            _State.QUEUE_SIZE += 1
+
+    def __call__(self) -> T:
+        self.dequeue()
+        return self.function()
+
+    def dequeue(self) -> None:
+        with _QUEUE_LOCK:
+            if not self.is_dequeued:
+                self.is_dequeued = True
+                _State.QUEUE_SIZE -= 1
 
 
 async def _run_sync_asyncio(
@@ -24,11 +56,15 @@ async def _run_sync_asyncio(
 ) -> T:
     ctx = contextvars.copy_context()
     bound_function = functools.partial(ctx.run, obj, *args, **kwargs)
+    queued_call = _QueuedCall(bound_function)
     get_loop = asyncio.get_running_loop()
-    return await get_loop.run_in_executor(
-        get_asyncio_executor(),
-        bound_function
-    )
+    try:
+        return await get_loop.run_in_executor(
+            get_asyncio_executor(),
+            queued_call
+        )
+    finally:
+        queued_call.dequeue()
 
 
 async def sync_to_thread(
@@ -46,9 +82,68 @@ async def sync_to_thread(
             raise RuntimeError('Unsupported async library')
 
 
+async def sync_to_thread_before_deadline(
+        obj: Callable[P, T],
+        *args: P.args,
+        **kwargs: P.kwargs
+) -> T:
+    """
+    Run a synchronous call to an object in an asynchronous thread
+    unless the deadline of the current request has passed, it is
+    checked before the call is queued and once a thread starts it.
+    """
+    check_deadline()
+    return await sync_to_thread(_run_before_deadline, obj, *args, **kwargs)
+
+
 def get_asyncio_executor() -> ThreadPoolExecutor | None:
     """
     Getting the executor in which to execute synchronous calls
     in asyncio context.
     """
     return _State.EXECUTOR
+
+
+def get_thread_pool_queue_size() -> int:
+    """
+    Getting the number of the `sync_to_thread` calls waiting
+    for a thread of the executor.
+    """
+    return _State.QUEUE_SIZE
+
+
+def get_deadline() -> float | None:
+    """
+    Getting the `time.monotonic` deadline of the current request,
+    `None` is returned if the request has no deadline.
+    """
+    return DEADLINE.get()
+
+
+def get_remaining_time() -> float | None:
+    """
+    Getting the seconds left before the deadline of the current request.
+    """
+    deadline = DEADLINE.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def check_deadline() -> None:
+    """
+    Raising `DeadlineException` if the deadline of the current request
+    has passed, the long synchronous work may call it to stop early.
+    """
+    deadline = DEADLINE.get()
+    if deadline is not None and time.monotonic() >= deadline:
+        raise DeadlineException('The request deadline has passed')
+
+
+def _run_before_deadline(
+        obj: Callable[P, T],
+        *args: P.args,
+        **kwargs: P.kwargs
+) -> T:
+    check_deadline()
+    return obj(*args, **kwargs)
@@ -0,0 +1,131 @@
+import functools
+import hashlib
+from collections.abc import Awaitable, Callable, Mapping
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any
+
+from speedy.connection.request import Request
+from speedy.response import Response
+from speedy.status_code import HTTP_304_NOT_MODIFIED
+from speedy.utils.sync import ensure_async_callable
+
+NOT_MODIFIED_HEADERS = frozenset({
+    'cache-control',
+    'content-location',
+    'date',
+    'etag',
+    'expires',
+    'last-modified',
+    'vary',
+})
+WEAK_PREFIX = 'W/'
+
+Validator = Callable[[Request], Awaitable[Any] | Any]
+
+
+def make_etag(body: bytes) -> str:
+    """ Make a strong entity tag from the hash of the body. """
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def quote_etag(etag: str) -> str:
+    """ Quote the version token as an entity tag, the quoted tags are kept as is. """
+    if etag.startswith(('"', WEAK_PREFIX)):
+        return etag
+    return f'"{etag}"'
+
+
+def format_http_date(value: datetime | float | str) -> str:
+    """ Format a datetime or a timestamp as an HTTP date. """
+    if isinstance(value, str):
+        return value
+    if not isinstance(value, datetime):
+        value = datetime.fromtimestamp(value, timezone.utc)
+    elif value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def is_not_modified(
+        request_headers: Mapping[str, str],
+        etag: str | None = None,
+        last_modified: str | None = None
+) -> bool:
+    """
+    Check the conditional request headers against the validators of the response.
+
+    `If-None-Match` takes precedence over `If-Modified-Since`, the entity
+    tags are compared with the weak comparison.
+    """
+    if_none_match = request_headers.get('if-none-match')
+    if if_none_match is not None:
+        if etag is None:
+            return False
+        if if_none_match.strip() == '*':
+            return True
+        etag = etag.removeprefix(WEAK_PREFIX)
+        return any(tag.strip().removeprefix(WEAK_PREFIX) == etag for tag in if_none_match.split(','))
+
+    if_modified_since = request_headers.get('if-modified-since')
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        return parsedate_to_datetime(last_modified) <= parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+
+
+def not_modified_response(headers: Mapping[str, str]) -> Response:
+    """ Get the `304 Not Modified` response keeping only the headers allowed for it. """
+    return Response(
+        status_code=HTTP_304_NOT_MODIFIED,
+        headers={key: value for key, value in headers.items() if key.lower() in NOT_MODIFIED_HEADERS}
+    )
+
+
+def conditional(
+        etag: Validator | None = None,
+        last_modified: Validator | None = None
+) -> Callable[[Callable[[Request], Any]], Callable[[Request], Awaitable[Any]]]:
+    """
+    Answer `304 Not Modified` before calling the decorated endpoint.
+
+    The `etag` and `last_modified` callables take the request and return
+    a cheap version token and a modification date, the endpoint is only
+    called when the client copy is outdated. The validators are set on
+    the endpoint response unless it sets them itself.
+    """
+    get_etag = ensure_async_callable(etag, before_deadline=True) if etag is not None else None
+    get_last_modified = (
+        ensure_async_callable(last_modified, before_deadline=True) if last_modified is not None else None
+    )
+
+    def decorator(endpoint: Callable[[Request], Any]) -> Callable[[Request], Awaitable[Any]]:
+        call_endpoint = ensure_async_callable(endpoint, before_deadline=True)
+
+        @functools.wraps(endpoint)
+        async def wrapper(request: Request) -> Any:
+            validators = {}
+            if get_etag is not None:
+                value = await get_etag(request)
+                if value is not None:
+                    validators['ETag'] = quote_etag(value)
+            if get_last_modified is not None:
+                value = await get_last_modified(request)
+                if value is not None:
+                    validators['Last-Modified'] = format_http_date(value)
+
+            if request.method in ('GET', 'HEAD') and is_not_modified(
+                    request.headers, validators.get('ETag'), validators.get('Last-Modified')
+            ):
+                return not_modified_response(validators)
+
+            response = await call_endpoint(request)
+            for key, value in validators.items():
+                response.headers.setdefault(key, value)
+            return response
+
+        return wrapper
+
+    return decorator
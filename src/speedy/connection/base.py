@@ -133,8 +133,12 @@ class ASGIConnection(Generic[UserT, AuthT, StateT]):
             self._state = State(self.scope['state'])
         return self._state
 
-    def url_for(self, name: str, **path_params: Any) -> URL:
+    def url_for(self, name: str, /, **path_params: Any) -> URL:
         """ Return the url for a given route handler name. """
+        return URL(self.path_for(name, **path_params))
+
+    def path_for(self, name: str, /, **path_params: Any) -> str:
+        """ Return the path string for a given route handler name without building a URL. """
         app: ASGIApplication = self.scope['app']
-        url_path = app.route_reverse(name, **path_params)
-        return URL(url_path)
+        root_path = self.scope.get('app_root_path', self.scope.get('root_path', ''))
+        return root_path + app.path_for(name, **path_params)
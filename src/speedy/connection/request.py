@@ -1,16 +1,21 @@
 import json
+import time
 from collections.abc import AsyncGenerator
 from typing import Generic, Any
 
 from speedy import RequestEncodingType
 from speedy._multipart import parse_content_header, MultiPartFormParser
 from speedy._parsers import parse_url_encoded_form_data
+from speedy.concurrency import check_deadline
 from speedy.connection.base import ASGIConnection, empty_receive, empty_send
 from speedy.datastructures import FormMultiDict
 from speedy.exceptions import RequestException, InternalServerException
 from speedy.protocols.connection import UserT, AuthT, StateT
+from speedy.timing import TIMING, BODY, FORM
 from speedy.types import Scope, ASGIReceiveCallable, ASGISendCallable, Method
 
+FORM_CONTENT_TYPES = (RequestEncodingType.MULTI_PART, RequestEncodingType.URL_ENCODED)
+
 SERVER_PUSH_HEADERS = {
     'accept',
     'accept-encoding',
@@ -60,13 +65,15 @@ class Request(Generic[UserT, AuthT, StateT], ASGIConnection[UserT, AuthT, StateT
         if not self._is_connected:
             raise InternalServerException('stream consumed')
 
-        while message := await self.receive():
+        while True:
+            check_deadline()
+            message = await self.receive()
             if message['type'] == 'http.request':
                 body = message.get('body', b'')
-                if not message.get('more_body', False):
-                    break
                 if body:
                     yield body
+                if not message.get('more_body', False):
+                    break
             elif message['type'] == 'http.disconnect':
                 raise InternalServerException('client disconnected prematurely')
         self._is_connected = False
@@ -75,7 +82,11 @@ class Request(Generic[UserT, AuthT, StateT], ASGIConnection[UserT, AuthT, StateT
     async def body(self) -> bytes:
         """ Return the body of the request. """
         if self._body is None:
+            timing = TIMING.get()
+            start = time.perf_counter()
             self._body = b''.join([chunk async for chunk in self.stream()])
+            if timing is not None:
+                timing.add(BODY, start)
         return self._body
 
     async def json(self) -> Any:
@@ -89,16 +100,17 @@ class Request(Generic[UserT, AuthT, StateT], ASGIConnection[UserT, AuthT, StateT
         """ Retrieve form data from the request. """
         if self._form is None:
             content_type, options = self.content_type
+            body = await self.body() if content_type in FORM_CONTENT_TYPES else b''
+            timing = TIMING.get()
+            start = time.perf_counter()
             if content_type == RequestEncodingType.MULTI_PART:
                 form_data = MultiPartFormParser(
-                    body=await self.body(),
+                    body=body,
                     boundary=options.get('boundary', '').encode(),
                     multipart_limit=multipart_limit
                 ).parser()
             elif content_type == RequestEncodingType.URL_ENCODED:
-                form_data = parse_url_encoded_form_data(
-                    await self.body()
-                )
+                form_data = parse_url_encoded_form_data(body)
             else:
                 form_data = {}
 
@@ -109,6 +121,8 @@ class Request(Generic[UserT, AuthT, StateT], ASGIConnection[UserT, AuthT, StateT
                 else:
                     items.append((key, value))
             self._form = FormMultiDict(items)
+            if timing is not None:
+                timing.add(FORM, start)
 
         return self._form
 
@@ -1,6 +1,6 @@
 import json
 from collections.abc import AsyncIterator
-from enum import Flag
+from enum import Enum
 from typing import Generic, Any, cast
 
 from speedy.connection.base import ASGIConnection, empty_receive, empty_send
@@ -8,6 +8,7 @@ from speedy.datastructures import Headers
 from speedy.exceptions import WebSocketException, WebSocketDisconnect
 from speedy.protocols.connection import UserT, AuthT, StateT
 from speedy.protocols.websocket import WebSocketMode
+from speedy.status_code import WS_1000_NORMAL_CLOSURE
 from speedy.types import (
     Scope,
     ASGIReceiveCallable,
@@ -18,7 +19,7 @@ from speedy.types import (
 )
 
 
-class WebSocketState(Flag):
+class WebSocketState(Enum):
     INIT = 'INIT'
     CONNECT = 'CONNECT'
     RECEIVE = 'RECEIVE'
@@ -170,3 +171,20 @@ class WebSocket(Generic[UserT, AuthT, StateT], ASGIConnection[UserT, AuthT, Stat
         """ Send data as json. """
         text = json.dumps(data, separators=(',', ':'), ensure_ascii=False)
         await self.send_data(data=text, mode=mode, encoding=encoding)
+
+
+class WebSocketClose:
+    """ An ASGI application which closes the websocket connection. """
+
+    def __init__(self, code: int = WS_1000_NORMAL_CLOSURE, reason: str | None = None) -> None:
+        self.code = code
+        self.reason = reason or ''
+
+    async def __call__(self, scope: Scope, receive: ASGIReceiveCallable, send: ASGISendCallable) -> None:
+        await send(
+            {
+                'type': 'websocket.close',
+                'code': self.code,
+                'reason': self.reason
+            }
+        )
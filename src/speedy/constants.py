@@ -1 +1,7 @@
+ONE_KILOBYTE = 1024
 ONE_MEGABYTE = 1024 * 1024
+
+HTTP_METHODS = ('GET', 'HEAD', 'POST', 'PUT', 'DELETE', 'PATCH', 'OPTIONS', 'TRACE')
+SAFE_METHODS = frozenset({'GET', 'HEAD'})
+
+WILDCARD = '*'
@@ -1,8 +1,9 @@
-# from .http_endpoint import HTTPEndpoint
+from .http_endpoint import HTTPEndpoint
+
 # from .websoket_endpoint import WebSocketEndpoint
 #
 #
-# __all__ = (
-#     'HTTPEndpoint',
-#     'WebSocketEndpoint'
-# )
+__all__ = (
+    'HTTPEndpoint',
+    # 'WebSocketEndpoint'
+)
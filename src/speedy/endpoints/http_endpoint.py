@@ -1,19 +1,40 @@
-from collections.abc import Iterator
-from typing import Callable, Any
+import inspect
+import time
+from collections.abc import Callable
+from typing import Any, ClassVar
 
-from speedy.concurrence import sync_to_thread
+from speedy.concurrency import sync_to_thread_before_deadline
+from speedy.connection.request import Request
 from speedy.constants import HTTP_METHODS
 from speedy.enums import ScopeType
-from speedy.exceptions import HTTPException
-from speedy.protocols import BaseHTTPEndpoint, AbstractResponse, AbstractRequest
-from speedy.request import Request
-from speedy.response import PlainTextResponse
+from speedy.protocols.endpoint import BaseHTTPEndpoint
+from speedy.protocols.request import AbstractRequest
+from speedy.response import Response, PlainTextResponse
 from speedy.status_code import HTTP_405_METHOD_NOT_ALLOWED
+from speedy.timing import TIMING, HANDLER
 from speedy.types import Scope, ASGIReceiveCallable, ASGISendCallable
-from speedy.utils import is_async_callable
+from speedy.utils.predicates import is_async_callable
 
 
 class HTTPEndpoint(BaseHTTPEndpoint):
+    """ Dispatch a request to the method handler named after the HTTP method, `HEAD` falls back to `get`. """
+
+    handlers: ClassVar[dict[str, tuple[Any, bool]]] = {}
+    allowed_methods: ClassVar[tuple[str, ...]] = ()
+    allow: ClassVar[str] = ''
+    method_not_allowed_response: ClassVar[Response | None] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.handlers = cls._get_handlers()
+        cls.allowed_methods = tuple(method for method in HTTP_METHODS if cls._get_handler(method) is not None)
+        cls.allow = ', '.join(cls.allowed_methods)
+        cls.method_not_allowed_response = PlainTextResponse(
+            'Method not allowed',
+            status_code=HTTP_405_METHOD_NOT_ALLOWED,
+            headers={'Allow': cls.allow}
+        )
+
     def __init__(
             self,
             scope: Scope,
@@ -28,33 +49,38 @@ class HTTPEndpoint(BaseHTTPEndpoint):
 
     async def dispatch(self) -> None:
         request = Request(scope=self.scope, receive=self.receive)
-        handler_name = self._get_name_handler(request)
-        handler: Callable[[Request], Any] = getattr(self, handler_name, self.method_not_allowed)
-        is_async = is_async_callable(handler)
-        if is_async:
-            response = await handler(request)
+        handler = self.handlers.get(request.method)
+        if handler is None:
+            response = await self.method_not_allowed(request)
         else:
-            response = await sync_to_thread(handler, request)
+            descriptor, is_async = handler
+            bound_handler: Callable[[Request], Any] = descriptor.__get__(self, type(self))
+            timing = TIMING.get()
+            start = time.perf_counter() if timing is not None else 0.0
+            if is_async:
+                response = await bound_handler(request)
+            else:
+                response = await sync_to_thread_before_deadline(bound_handler, request)
+            if timing is not None:
+                timing.add(HANDLER, start)
         await response(self.scope, self.receive, self.send)
 
-    async def method_not_allowed(self, request: AbstractRequest) -> AbstractResponse:
-        headers = {
-            'Allow': ', '.join(self._get_allowed_methods())
-        }
-        if 'app' in self.scope:
-            raise HTTPException(status_code=HTTP_405_METHOD_NOT_ALLOWED, headers=headers)
-        return PlainTextResponse(
-            'Method not allowed',
-            status_code=HTTP_405_METHOD_NOT_ALLOWED,
-            headers=headers
-        )
+    async def method_not_allowed(self, request: AbstractRequest) -> Response:
+        return self.method_not_allowed_response
 
-    def _get_name_handler(self, request: AbstractRequest) -> str:
-        if request.method == 'HEAD' and not hasattr(self, 'head'):
-            return 'get'
-        return request.method.lower()
-
-    def _get_allowed_methods(self) -> Iterator[str]:
+    @classmethod
+    def _get_handlers(cls) -> dict[str, tuple[Any, bool]]:
+        handlers = {}
         for method in HTTP_METHODS:
-            if getattr(self, method.lower(), None) is not None:
-                yield method
+            name = method
+            handler = cls._get_handler(method)
+            if handler is None and method == 'HEAD':
+                name = 'GET'
+                handler = cls._get_handler(name)
+            if handler is not None:
+                handlers[method] = inspect.getattr_static(cls, name.lower()), is_async_callable(handler)
+        return handlers
+
+    @classmethod
+    def _get_handler(cls, method: str) -> Callable[..., Any] | None:
+        return getattr(cls, method.lower(), None)
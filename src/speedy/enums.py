@@ -40,3 +40,11 @@ class RequestEncodingType(str, Enum):
     MESSAGEPACK = 'application/x-msgpack'
     MULTI_PART = 'multipart/form-data'
     URL_ENCODED = 'application/x-www-form-urlencoded'
+
+
+class Match(Enum):
+    """ An enum for the result of matching a route against a scope. """
+
+    NONE = 0
+    PARTIAL = 1
+    FULL = 2
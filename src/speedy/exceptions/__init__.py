@@ -1,4 +1,12 @@
-from .base import ASGIApplicationException, ConnectionException, ValidationException
+from .base import (
+    ASGIApplicationException,
+    ConnectionException,
+    ValidationException,
+    EmptyException,
+    ConvertorTypeException,
+    MiddlewareException,
+    DeadlineException
+)
 from .connection import (
     SessionException,
     AuthException,
@@ -7,6 +15,7 @@ from .connection import (
     WebSocketException,
     WebSocketDisconnect
 )
+from .route import RouteException, PathException, NoMatchFound
 
 __all__ = (
     'ASGIApplicationException',
@@ -18,4 +27,11 @@ __all__ = (
     'ValidationException',
     'WebSocketException',
     'WebSocketDisconnect',
+    'EmptyException',
+    'ConvertorTypeException',
+    'MiddlewareException',
+    'DeadlineException',
+    'RouteException',
+    'PathException',
+    'NoMatchFound',
 )
@@ -8,3 +8,19 @@ class ConnectionException(Exception):
 
 class ValidationException(Exception):
     pass
+
+
+class EmptyException(ValueError):
+    pass
+
+
+class ConvertorTypeException(ValueError):
+    pass
+
+
+class MiddlewareException(ASGIApplicationException, TypeError):
+    pass
+
+
+class DeadlineException(ASGIApplicationException, TimeoutError):
+    pass
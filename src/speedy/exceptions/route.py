@@ -0,0 +1,10 @@
+class RouteException(Exception):
+    pass
+
+
+class PathException(RouteException, ValueError):
+    pass
+
+
+class NoMatchFound(RouteException):
+    pass
@@ -0,0 +1,11 @@
+from .histogram import Histogram, HistogramSummary
+from .prometheus import PrometheusApp
+from .route import RouteMetrics, get_status_class
+
+__all__ = (
+    'Histogram',
+    'HistogramSummary',
+    'RouteMetrics',
+    'PrometheusApp',
+    'get_status_class'
+)
@@ -0,0 +1,116 @@
+import bisect
+import itertools
+import math
+from array import array
+from collections.abc import Sequence
+from typing import NamedTuple, Self
+
+MICROSECONDS = 1_000_000
+
+
+class HistogramSummary(NamedTuple):
+    """ The latency quantiles of a histogram, in seconds. """
+
+    count: int
+    mean: float
+    p50: float
+    p99: float
+    p999: float
+    max: float
+
+
+class Histogram:
+    """ A fixed memory log-linear latency histogram counted in microseconds. """
+
+    __slots__ = ('sub_bucket_bits', 'max_value', 'counts', 'count', 'total', 'min', 'max')
+
+    def __init__(self, *, sub_bucket_bits: int = 5, max_seconds: float = 3600.0) -> None:
+        if sub_bucket_bits < 1:
+            raise ValueError('Sub bucket bits must be a positive number')
+        if max_seconds <= 0:
+            raise ValueError('Max seconds must be a positive number')
+        max_value = int(max_seconds * MICROSECONDS)
+        max_shift = max(max_value.bit_length() - sub_bucket_bits - 1, 0)
+        self.sub_bucket_bits = sub_bucket_bits
+        self.max_value = max_value
+        self.counts = array('Q', [0]) * ((max_shift + 2) << sub_bucket_bits)
+        self.count = 0
+        self.total = 0
+        self.min = max_value
+        self.max = 0
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(count={self.count}, buckets={len(self.counts)})'
+
+    def record(self, seconds: float) -> None:
+        """ Count the latency. """
+        value = int(seconds * MICROSECONDS)
+        if value < 0:
+            value = 0
+        elif value > self.max_value:
+            value = self.max_value
+        shift = value.bit_length() - self.sub_bucket_bits - 1
+        if shift < 0:
+            shift = 0
+        self.counts[(shift << self.sub_bucket_bits) + (value >> shift)] += 1
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> float:
+        """ Get the latency in seconds under which the `q` part of the latencies are, `0.0` is returned if empty. """
+        if not self.count:
+            return 0.0
+        rank = max(math.ceil(q * self.count), 1)
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if count:
+                seen += count
+                if seen >= rank:
+                    return min(self.get_upper_bound(index), self.max) / MICROSECONDS
+        return self.max / MICROSECONDS
+
+    def get_upper_bound(self, index: int) -> int:
+        """ Get the highest value in microseconds counted in the bucket. """
+        shift = max((index >> self.sub_bucket_bits) - 1, 0)
+        return ((index - (shift << self.sub_bucket_bits) + 1) << shift) - 1
+
+    def get_cumulative_counts(self, bounds: Sequence[float]) -> list[int]:
+        """ Get the number of latencies under each of the sorted bounds in seconds, by the highest value of their bucket. """
+        limits = [bound * MICROSECONDS for bound in bounds]
+        counts = [0] * len(limits)
+        for index, count in enumerate(self.counts):
+            if count:
+                position = bisect.bisect_left(limits, min(self.get_upper_bound(index), self.max))
+                if position < len(counts):
+                    counts[position] += count
+        return list(itertools.accumulate(counts))
+
+    def merge(self, other: Self) -> None:
+        """ Add the counts of the other histogram, e.g. of another worker. """
+        if self.sub_bucket_bits != other.sub_bucket_bits or self.max_value != other.max_value:
+            raise ValueError('Histograms must have the same buckets')
+        counts = self.counts
+        for index, count in enumerate(other.counts):
+            if count:
+                counts[index] += count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def summary(self) -> HistogramSummary:
+        """ Get the count, the mean, the p50, p99 and p999 and the maximum. """
+        if not self.count:
+            return HistogramSummary(0, 0.0, 0.0, 0.0, 0.0, 0.0)
+        return HistogramSummary(
+            self.count,
+            self.total / self.count / MICROSECONDS,
+            self.quantile(0.5),
+            self.quantile(0.99),
+            self.quantile(0.999),
+            self.max / MICROSECONDS
+        )
@@ -0,0 +1,129 @@
+import asyncio
+import time
+from collections.abc import Callable, Iterator, Sequence
+
+from speedy.concurrency import get_thread_pool_queue_size
+from speedy.enums import ScopeType
+from speedy.metrics.histogram import MICROSECONDS
+from speedy.metrics.route import RouteMetrics, RouteKey
+from speedy.status_code import HTTP_200_OK, WS_1000_NORMAL_CLOSURE
+from speedy.types import Scope, ASGIReceiveCallable, ASGISendCallable
+
+CONTENT_TYPE = b'text/plain; version=0.0.4; charset=utf-8'
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+RENDER_BATCH_SIZE = 64
+
+
+def escape_label_value(value: str) -> str:
+    """ Escape the label value of the text exposition format. """
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class PrometheusApp:
+    """ Expose the metrics in the Prometheus text exposition format, rendered once per `ttl` seconds. """
+
+    def __init__(
+            self,
+            metrics: RouteMetrics,
+            *,
+            namespace: str = 'speedy',
+            buckets: Sequence[float] = DEFAULT_BUCKETS,
+            ttl: float = 1.0,
+            clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.metrics = metrics
+        self.namespace = namespace
+        self.buckets = tuple(sorted(buckets))
+        self.bucket_labels = [repr(float(bound)) for bound in self.buckets]
+        self.ttl = ttl
+        self.clock = clock
+        self._payload = b''
+        self._expires = float('-inf')
+        self._render: asyncio.Future[bytes | None] | None = None
+
+    async def __call__(self, scope: Scope, receive: ASGIReceiveCallable, send: ASGISendCallable) -> None:
+        if scope['type'] == ScopeType.WEBSOCKET:
+            await send({'type': 'websocket.close', 'code': WS_1000_NORMAL_CLOSURE})
+            return None
+        if scope['type'] != ScopeType.HTTP:
+            return None
+
+        payload = await self.get_payload()
+        headers = [
+            (b'content-type', CONTENT_TYPE),
+            (b'content-length', str(len(payload)).encode('latin-1')),
+        ]
+        await send({'type': 'http.response.start', 'status': HTTP_200_OK, 'headers': headers})
+        await send({'type': 'http.response.body', 'body': b'' if scope['method'] == 'HEAD' else payload, 'more_body': False})
+
+    async def get_payload(self) -> bytes:
+        """ Get the rendered payload, it is rendered again once it has expired. """
+        if self.clock() < self._expires:
+            return self._payload
+        if self._render is not None:
+            payload = await asyncio.shield(self._render)
+            return payload if payload is not None else await self.get_payload()
+
+        render = self._render = asyncio.get_running_loop().create_future()
+        payload = None
+        try:
+            chunks = []
+            for index, chunk in enumerate(self.iter_chunks(), start=1):
+                chunks.append(chunk)
+                if index % RENDER_BATCH_SIZE == 0:
+                    await asyncio.sleep(0)
+            payload = self._payload = ''.join(chunks).encode('utf-8')
+            self._expires = self.clock() + self.ttl
+        finally:
+            self._render = None
+            render.set_result(payload)
+        return payload
+
+    def iter_chunks(self) -> Iterator[str]:
+        """ Render the metrics, a chunk per series of a route. """
+        name = self.namespace
+        keys = list(self.metrics.histograms)
+        labels = {key: self._get_labels(key) for key in keys}
+
+        yield f'# HELP {name}_requests_total Requests by route and status class.\n'
+        yield f'# TYPE {name}_requests_total counter\n'
+        for key in keys:
+            yield f'{name}_requests_total{{{labels[key]}}} {self.metrics.histograms[key].count}\n'
+
+        yield f'# HELP {name}_request_duration_seconds Request latency by route and status class.\n'
+        yield f'# TYPE {name}_request_duration_seconds histogram\n'
+        for key in keys:
+            yield self._render_histogram(f'{name}_request_duration_seconds', key, labels[key])
+
+        for metric, values, description in (
+                ('request_body_bytes_total', self.metrics.bytes_received, 'Request body bytes'),
+                ('response_body_bytes_total', self.metrics.bytes_sent, 'Response body bytes'),
+        ):
+            yield f'# HELP {name}_{metric} {description} by route and status class.\n'
+            yield f'# TYPE {name}_{metric} counter\n'
+            for key in keys:
+                yield f'{name}_{metric}{{{labels[key]}}} {values[key]}\n'
+
+        yield (
+            f'# HELP {name}_requests_in_flight Requests in flight.\n'
+            f'# TYPE {name}_requests_in_flight gauge\n'
+            f'{name}_requests_in_flight {self.metrics.in_flight}\n'
+            f'# HELP {name}_thread_pool_queue_size Synchronous calls waiting for a thread.\n'
+            f'# TYPE {name}_thread_pool_queue_size gauge\n'
+            f'{name}_thread_pool_queue_size {get_thread_pool_queue_size()}\n'
+        )
+
+    def _get_labels(self, key: RouteKey) -> str:
+        route, status_class = key
+        return f'route="{escape_label_value(route or "")}",status="{status_class}"'
+
+    def _render_histogram(self, name: str, key: RouteKey, labels: str) -> str:
+        histogram = self.metrics.histograms[key]
+        lines = [
+            f'{name}_bucket{{{labels},le="{le}"}} {count}\n'
+            for le, count in zip(self.bucket_labels, histogram.get_cumulative_counts(self.buckets))
+        ]
+        lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}\n')
+        lines.append(f'{name}_sum{{{labels}}} {histogram.total / MICROSECONDS!r}\n')
+        lines.append(f'{name}_count{{{labels}}} {histogram.count}\n')
+        return ''.join(lines)
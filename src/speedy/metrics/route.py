@@ -0,0 +1,85 @@
+import time
+from collections.abc import Iterator
+from typing import Self
+
+from speedy.metrics.histogram import Histogram
+from speedy.timing import RequestTiming
+
+STATUS_CLASSES = ('1xx', '2xx', '3xx', '4xx', '5xx')
+SERVER_ERROR_CLASS = '5xx'
+
+RouteKey = tuple[str | None, str]
+
+
+def get_status_class(status: int | None) -> str:
+    """ Get the status class, a request failed before its response start is a server error. """
+    if status is None or not 100 <= status < 600:
+        return SERVER_ERROR_CLASS
+    return STATUS_CLASSES[status // 100 - 1]
+
+
+class RouteMetrics:
+    """ Latency histograms per route template and status class, the unmatched requests are kept under `None`. """
+
+    def __init__(self, *, sub_bucket_bits: int = 5, max_seconds: float = 3600.0) -> None:
+        self.sub_bucket_bits = sub_bucket_bits
+        self.max_seconds = max_seconds
+        self.in_flight = 0
+        self.histograms: dict[RouteKey, Histogram] = {}
+        self.bytes_received: dict[RouteKey, int] = {}
+        self.bytes_sent: dict[RouteKey, int] = {}
+
+    def __call__(self, timing: RequestTiming) -> None:
+        self.in_flight -= 1
+        duration = timing.duration
+        if duration is None:
+            duration = time.perf_counter() - timing.start
+        self.record(timing.route, timing.status, duration, timing.bytes_received, timing.bytes_sent)
+
+    def __iter__(self) -> Iterator[tuple[RouteKey, Histogram]]:
+        return iter(self.histograms.items())
+
+    def __len__(self) -> int:
+        return len(self.histograms)
+
+    def start(self, timing: RequestTiming) -> None:
+        """ Count the request in flight, it is the `on_start` callback of the `ServerTimingMiddleware`. """
+        self.in_flight += 1
+
+    def record(
+            self,
+            route: str | None,
+            status: int | None,
+            seconds: float,
+            bytes_received: int = 0,
+            bytes_sent: int = 0
+    ) -> None:
+        """ Count the latency and the body bytes of a request of the route. """
+        key = route, get_status_class(status)
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = Histogram(
+                sub_bucket_bits=self.sub_bucket_bits,
+                max_seconds=self.max_seconds
+            )
+            self.bytes_received[key] = 0
+            self.bytes_sent[key] = 0
+        histogram.record(seconds)
+        self.bytes_received[key] += bytes_received
+        self.bytes_sent[key] += bytes_sent
+
+    def get(self, route: str | None, status_class: str) -> Histogram | None:
+        """ Get the histogram of the route and the status class. """
+        return self.histograms.get((route, status_class))
+
+    def merge(self, other: Self) -> None:
+        """ Add the histograms of the other metrics, e.g. of another worker. """
+        for key, histogram in other.histograms.items():
+            own = self.histograms.get(key)
+            if own is None:
+                own = self.histograms[key] = Histogram(sub_bucket_bits=self.sub_bucket_bits, max_seconds=self.max_seconds)
+                self.bytes_received[key] = 0
+                self.bytes_sent[key] = 0
+            own.merge(histogram)
+            self.bytes_received[key] += other.bytes_received[key]
+            self.bytes_sent[key] += other.bytes_sent[key]
@@ -1,8 +1,30 @@
 from .base import Middleware
+from .cache import ResponseCacheMiddleware
+from .coalesce import CoalescingMiddleware
+from .concurrency_limit import ConcurrencyLimitMiddleware
+from .conditional import ConditionalGetMiddleware
+from .cors import CORSMiddleware
 from .errors import ServerErrorMiddleware
+from .gzip import GZipMiddleware
+from .proxy import ProxyHeadersMiddleware
+from .rate_limit import RateLimitMiddleware
+from .timeout import TimeoutMiddleware
+from .timing import ServerTimingMiddleware
+from .trusted_host import TrustedHostMiddleware
 
 
 __all__ = (
     'Middleware',
-    'ServerErrorMiddleware'
+    'ServerErrorMiddleware',
+    'GZipMiddleware',
+    'ConditionalGetMiddleware',
+    'ResponseCacheMiddleware',
+    'RateLimitMiddleware',
+    'TimeoutMiddleware',
+    'ConcurrencyLimitMiddleware',
+    'CoalescingMiddleware',
+    'ServerTimingMiddleware',
+    'CORSMiddleware',
+    'ProxyHeadersMiddleware',
+    'TrustedHostMiddleware'
 )
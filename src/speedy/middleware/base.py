@@ -1,6 +1,10 @@
+import inspect
 from typing import ParamSpec, Iterator, Any
 
+from speedy.exceptions.base import MiddlewareException
 from speedy.protocols.middleware import MiddlewareProtocol
+from speedy.types.application import ASGIAppType
+from speedy.utils.predicates import is_async_callable
 
 P = ParamSpec('P')
 
@@ -24,10 +28,25 @@ class Middleware:
         )
         return f'{_class}({args})'
 
+    def build(self, app: ASGIAppType) -> ASGIAppType:
+        """ Validate the middleware class and its arguments, then wrap the application. """
+        self._validate(app)
+        return self.cls(app, *self.args, **self.kwargs)
+
+    def _validate(self, app: ASGIAppType) -> None:
+        if not inspect.isclass(self.cls) or not issubclass(self.cls, MiddlewareProtocol):
+            raise MiddlewareException(f'{self.cls!r} does not implement the middleware protocol')
+        if not is_async_callable(self.cls.__call__):
+            raise MiddlewareException(f'{self.cls.__name__}.__call__ must be a coroutine function')
+        try:
+            inspect.signature(self.cls).bind(app, *self.args, **self.kwargs)
+        except TypeError as exc:
+            raise MiddlewareException(f'Invalid arguments of {self!r}: {exc}') from exc
+
     def _get_args_to_string(self) -> Iterator[str]:
         for value in self.args:
             yield f'{value!r}'
 
     def _get_option_to_string(self) -> Iterator[str]:
-        for key, value in self.kwargs:
+        for key, value in self.kwargs.items():
             yield f'{key}={value!r}'
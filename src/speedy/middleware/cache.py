@@ -0,0 +1,354 @@
+import asyncio
+import functools
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Collection
+from typing import NamedTuple
+
+from speedy.constants import ONE_MEGABYTE, SAFE_METHODS
+from speedy.enums import ScopeType
+from speedy.status_code import (
+    HTTP_200_OK,
+    HTTP_203_NON_AUTHORITATIVE_INFORMATION,
+    HTTP_204_NO_CONTENT,
+    HTTP_300_MULTIPLE_CHOICES,
+    HTTP_301_MOVED_PERMANENTLY,
+    HTTP_308_PERMANENT_REDIRECT,
+    HTTP_404_NOT_FOUND,
+    HTTP_405_METHOD_NOT_ALLOWED,
+    HTTP_410_GONE,
+    HTTP_414_REQUEST_URI_TOO_LONG,
+)
+from speedy.types import Scope, ASGIReceiveCallable, ASGISendCallable, Message, RawHeaders
+from speedy.types.application import ASGIAppType
+
+DEFAULT_CACHEABLE_STATUS_CODES = frozenset({
+    HTTP_200_OK,
+    HTTP_203_NON_AUTHORITATIVE_INFORMATION,
+    HTTP_204_NO_CONTENT,
+    HTTP_300_MULTIPLE_CHOICES,
+    HTTP_301_MOVED_PERMANENTLY,
+    HTTP_308_PERMANENT_REDIRECT,
+    HTTP_404_NOT_FOUND,
+    HTTP_405_METHOD_NOT_ALLOWED,
+    HTTP_410_GONE,
+    HTTP_414_REQUEST_URI_TOO_LONG,
+})
+NOT_STORED_DIRECTIVES = frozenset({'no-store', 'no-cache', 'private'})
+
+PrimaryKey = tuple[str, bytes, str, str, bytes]
+CacheKey = tuple[PrimaryKey, tuple[bytes | None, ...]]
+
+
+@functools.lru_cache(maxsize=256)
+def parse_cache_control(value: str) -> dict[str, str | None]:
+    """ Parse the `Cache-Control` header value into its directives. """
+    directives: dict[str, str | None] = {}
+    for directive in value.split(','):
+        name, separator, argument = directive.partition('=')
+        name = name.strip().lower()
+        if name:
+            directives[name] = argument.strip().strip('"') if separator else None
+    return directives
+
+
+def get_seconds(directives: dict[str, str | None], name: str) -> float | None:
+    """ Get the number of seconds of the directive, `None` is returned if it is missing or invalid. """
+    value = directives.get(name)
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        return None
+
+
+class ResponseCacheInfo(NamedTuple):
+    """ Statistics of the response cache. """
+
+    hits: int
+    stale_hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size: int
+    max_size: int
+
+
+class CacheEntry:
+    """ A stored response. """
+
+    __slots__ = ('status', 'headers', 'body', 'size', 'created', 'expires', 'stale_until')
+
+    def __init__(
+            self,
+            status: int,
+            headers: RawHeaders,
+            body: bytes,
+            created: float,
+            ttl: float,
+            stale_while_revalidate: float
+    ) -> None:
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.size = len(body) + sum(len(key) + len(value) for key, value in headers)
+        self.created = created
+        self.expires = created + ttl
+        self.stale_until = self.expires + stale_while_revalidate
+
+
+class ResponseCacheMiddleware:
+    """ Keep the cacheable `GET` and `HEAD` responses in memory and replay them, honoring `Cache-Control`. """
+
+    def __init__(
+            self,
+            app: ASGIAppType,
+            *,
+            max_size: int = 64 * ONE_MEGABYTE,
+            max_entry_size: int = ONE_MEGABYTE,
+            ttl: float | None = 60.0,
+            stale_while_revalidate: float = 0.0,
+            cacheable_status_codes: Collection[int] = DEFAULT_CACHEABLE_STATUS_CODES,
+            clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        if max_size <= 0:
+            raise ValueError('Cache size must be a positive number')
+        self.app = app
+        self.max_size = max_size
+        self.max_entry_size = min(max_entry_size, max_size)
+        self.ttl = ttl
+        self.stale_while_revalidate = stale_while_revalidate
+        self.cacheable_status_codes = frozenset(cacheable_status_codes)
+        self.clock = clock
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.size = 0
+        self._entries: OrderedDict[CacheKey, CacheEntry] = OrderedDict()
+        self._vary: dict[PrimaryKey, tuple[bytes, ...]] = {}
+        self._variants: dict[PrimaryKey, set[CacheKey]] = {}
+        self._revalidating: set[CacheKey] = set()
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def __call__(self, scope: Scope, receive: ASGIReceiveCallable, send: ASGISendCallable) -> None:
+        if scope['type'] != ScopeType.HTTP or scope['method'] not in SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return None
+
+        is_bypassed = False
+        host = b''
+        for key, value in scope['headers']:
+            if key == b'host':
+                host = value.lower()
+            elif key == b'authorization':
+                is_bypassed = True
+            elif key == b'cache-control':
+                directives = parse_cache_control(value.decode('latin-1'))
+                is_bypassed = is_bypassed or 'no-cache' in directives or 'no-store' in directives
+        if is_bypassed:
+            await self.app(scope, receive, send)
+            return None
+
+        primary_key = (
+            scope.get('scheme', 'http'), host, scope['method'], scope['path'], scope.get('query_string', b'')
+        )
+        cache_key = self.get_key(primary_key, scope['headers'])
+        entry = self._entries.get(cache_key) if cache_key is not None else None
+        if entry is not None:
+            now = self.clock()
+            if now < entry.expires:
+                self.hits += 1
+                self._entries.move_to_end(cache_key)
+                await self._replay(entry, now, send)
+                return None
+            if now < entry.stale_until:
+                self.stale_hits += 1
+                self._entries.move_to_end(cache_key)
+                self._revalidate(cache_key, primary_key, scope)
+                await self._replay(entry, now, send)
+                return None
+            self._remove(cache_key)
+
+        self.misses += 1
+        responder = CacheResponder(self.max_entry_size, send)
+        await self.app(scope, receive, responder.send)
+        if responder.is_complete:
+            self.store(primary_key, scope['headers'], responder.status, responder.headers, b''.join(responder.chunks))
+
+    def get_key(self, primary_key: PrimaryKey, request_headers: RawHeaders) -> CacheKey | None:
+        """ Get the key of the stored variant of the request, `None` is returned if nothing is stored. """
+        vary = self._vary.get(primary_key)
+        if vary is None:
+            return None
+        if not vary:
+            return primary_key, ()
+        values = dict.fromkeys(vary)
+        for key, value in request_headers:
+            if key in values:
+                values[key] = value if values[key] is None else values[key] + b', ' + value
+        return primary_key, tuple(values.values())
+
+    def store(
+            self,
+            primary_key: PrimaryKey,
+            request_headers: RawHeaders,
+            status: int,
+            headers: RawHeaders,
+            body: bytes
+    ) -> bool:
+        """ Store the response if it is cacheable, `True` is returned if it was stored. """
+        if status not in self.cacheable_status_codes:
+            return False
+
+        directives: dict[str, str | None] = {}
+        vary: set[bytes] = set()
+        stored_headers: RawHeaders = []
+        for key, value in headers:
+            # INFO: The `Age` header is computed on replay, the one of the upstream response is not stored
+            if key == b'age':
+                continue
+            stored_headers.append((key, value))
+            if key == b'cache-control':
+                directives = {**directives, **parse_cache_control(value.decode('latin-1'))}
+            elif key == b'vary':
+                vary.update(name.strip().lower() for name in value.split(b','))
+            elif key == b'set-cookie':
+                return False
+
+        if b'*' in vary or not NOT_STORED_DIRECTIVES.isdisjoint(directives):
+            return False
+        ttl = get_seconds(directives, 's-maxage')
+        if ttl is None:
+            ttl = get_seconds(directives, 'max-age')
+        if ttl is None:
+            ttl = self.ttl
+        if not ttl:
+            return False
+        stale_while_revalidate = get_seconds(directives, 'stale-while-revalidate')
+        if stale_while_revalidate is None:
+            stale_while_revalidate = self.stale_while_revalidate
+
+        entry = CacheEntry(status, stored_headers, body, self.clock(), ttl, stale_while_revalidate)
+        if entry.size > self.max_entry_size:
+            return False
+
+        vary_headers = tuple(sorted(vary - {b''}))
+        previous_vary = self._vary.get(primary_key)
+        if previous_vary is not None and previous_vary != vary_headers:
+            # INFO: The variants keyed by the previous `Vary` headers can not be looked up anymore
+            for variant_key in list(self._variants[primary_key]):
+                self._remove(variant_key)
+        self._vary[primary_key] = vary_headers
+        cache_key = self.get_key(primary_key, request_headers)
+        if cache_key in self._entries:
+            self._remove(cache_key)
+            self._vary[primary_key] = vary_headers
+        self._entries[cache_key] = entry
+        self._variants.setdefault(primary_key, set()).add(cache_key)
+        self.size += entry.size
+        while self.size > self.max_size:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+        return True
+
+    def clear(self) -> None:
+        """ Drop all the entries, the statistics are kept. """
+        self._entries.clear()
+        self._vary.clear()
+        self._variants.clear()
+        self.size = 0
+
+    def cache_info(self) -> ResponseCacheInfo:
+        """ Get the cache statistics. """
+        return ResponseCacheInfo(
+            self.hits, self.stale_hits, self.misses, self.evictions, len(self._entries), self.size, self.max_size
+        )
+
+    async def _replay(self, entry: CacheEntry, now: float, send: ASGISendCallable) -> None:
+        age = str(int(now - entry.created)).encode('latin-1')
+        await send({'type': 'http.response.start', 'status': entry.status, 'headers': [*entry.headers, (b'age', age)]})
+        await send({'type': 'http.response.body', 'body': entry.body, 'more_body': False})
+
+    def _remove(self, cache_key: CacheKey) -> None:
+        entry = self._entries.pop(cache_key)
+        self.size -= entry.size
+        primary_key = cache_key[0]
+        variants = self._variants[primary_key]
+        variants.discard(cache_key)
+        if not variants:
+            del self._variants[primary_key]
+            del self._vary[primary_key]
+
+    def _revalidate(self, cache_key: CacheKey, primary_key: PrimaryKey, scope: Scope) -> None:
+        if cache_key in self._revalidating:
+            return None
+        self._revalidating.add(cache_key)
+        task = asyncio.create_task(self._refresh(cache_key, primary_key, {**scope, 'headers': list(scope['headers'])}))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _refresh(self, cache_key: CacheKey, primary_key: PrimaryKey, scope: Scope) -> None:
+        """ Refresh the stale entry, it is kept until it expires if the application fails. """
+        is_received = False
+
+        async def receive() -> Message:
+            nonlocal is_received
+            if is_received:
+                return {'type': 'http.disconnect'}
+            is_received = True
+            return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+        async def send(message: Message) -> None:
+            pass
+
+        responder = CacheResponder(self.max_entry_size, send)
+        try:
+            await self.app(scope, receive, responder.send)
+        except Exception:
+            return None
+        finally:
+            self._revalidating.discard(cache_key)
+        if responder.is_complete:
+            self.store(primary_key, scope['headers'], responder.status, responder.headers, b''.join(responder.chunks))
+
+
+class CacheResponder:
+    """ Pass the response messages of a single request through, keeping a copy of them. """
+
+    __slots__ = ('max_size', 'app_send', 'status', 'headers', 'chunks', 'size', 'is_complete', 'is_captured')
+
+    def __init__(self, max_size: int, send: ASGISendCallable) -> None:
+        self.max_size = max_size
+        self.app_send = send
+        self.status = 0
+        self.headers: RawHeaders = []
+        self.chunks: list[bytes] = []
+        self.size = 0
+        self.is_complete = False
+        self.is_captured = True
+
+    async def send(self, message: Message) -> None:
+        await self.app_send(message)
+        if not self.is_captured:
+            return None
+
+        message_type = message['type']
+        if message_type == 'http.response.start':
+            self.status = message['status']
+            self.headers = list(message.get('headers', ()))
+        elif message_type == 'http.response.body':
+            body = message.get('body', b'')
+            self.size += len(body)
+            if self.size > self.max_size:
+                self.is_captured = False
+                self.chunks.clear()
+                return None
+            self.chunks.append(body)
+            self.is_complete = not message.get('more_body', False)
+        else:
+            self.is_captured = False
@@ -0,0 +1,92 @@
+import asyncio
+from collections.abc import Collection
+
+from speedy.constants import SAFE_METHODS
+from speedy.enums import ScopeType
+from speedy.types import Scope, ASGIReceiveCallable, ASGISendCallable, Message
+from speedy.types.application import ASGIAppType
+
+CoalescingKey = tuple[str, bytes, str, str, bytes, tuple[bytes | None, ...]]
+
+
+class Flight:
+    """ The response of a request running the application and the number of the requests waiting for it. """
+
+    __slots__ = ('future', 'waiters')
+
+    def __init__(self, future: asyncio.Future[list[Message] | None]) -> None:
+        self.future = future
+        self.waiters = 0
+
+
+class CoalescingMiddleware:
+    """ Run identical concurrent `GET` and `HEAD` requests once and replay the response to the waiting ones. """
+
+    def __init__(self, app: ASGIAppType, *, headers: Collection[str] = ()) -> None:
+        self.app = app
+        self.header_names = tuple(sorted({name.lower().encode('latin-1') for name in headers}))
+        self.coalesced = 0
+        self._flights: dict[CoalescingKey, Flight] = {}
+
+    async def __call__(self, scope: Scope, receive: ASGIReceiveCallable, send: ASGISendCallable) -> None:
+        if scope['type'] != ScopeType.HTTP or scope['method'] not in SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return None
+
+        key = self.get_key(scope)
+        flight = self._flights.get(key)
+        if flight is not None:
+            flight.waiters += 1
+            messages = await asyncio.shield(flight.future)
+            if messages is None:
+                await self.app(scope, receive, send)
+                return None
+            self.coalesced += 1
+            for message in messages:
+                await send({**message})
+            return None
+
+        flight = self._flights[key] = Flight(asyncio.get_running_loop().create_future())
+        messages: list[Message] | None = []
+
+        async def _send(message: Message) -> None:
+            nonlocal messages
+            if messages is not None:
+                if not messages and not flight.waiters:
+                    # INFO: Nobody can join a flight whose response has started, so the messages are not kept
+                    del self._flights[key]
+                    messages = None
+                else:
+                    messages.append({**message})
+            await send(message)
+
+        try:
+            await self.app(scope, receive, _send)
+        except BaseException:
+            messages = None
+            raise
+        finally:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+            flight.future.set_result(messages)
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    def get_key(self, scope: Scope) -> CoalescingKey:
+        """ Get the coalescing key of the request. """
+        host = b''
+        values = dict.fromkeys(self.header_names)
+        for key, value in scope['headers']:
+            if key == b'host':
+                host = value.lower()
+            if key in values:
+                values[key] = value if values[key] is None else values[key] + b', ' + value
+        return (
+            scope.get('scheme', 'http'),
+            host,
+            scope['method'],
+            scope['path'],
+            scope.get('query_string', b''),
+            tuple(values.values())
+        )
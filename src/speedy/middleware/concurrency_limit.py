@@ -0,0 +1,129 @@
+import asyncio
+from collections import deque
+from collections.abc import Mapping
+from typing import ClassVar, NamedTuple
+
+from speedy.enums import ScopeType
+from speedy.middleware.prebuilt import PrebuiltResponse
+from speedy.status_code import HTTP_503_SERVICE_UNAVAILABLE
+from speedy.types import Scope, ASGIReceiveCallable, ASGISendCallable
+from speedy.types.application import ASGIAppType
+
+SERVICE_UNAVAILABLE_BODY = b'Service Unavailable'
+DEFAULT_PRIORITY = 0
+
+
+class ConcurrencyStats(NamedTuple):
+    """ Gauges of the concurrency limit. """
+
+    in_flight: int
+    queued: int
+    shed: int
+    max_concurrency: int
+    max_queue: int
+
+
+class ConcurrencyLimitMiddleware:
+    """ Limit the number of requests in flight, the excess requests are queued by priority lane or shed with `503`. """
+
+    outermost: ClassVar[bool] = True
+
+    def __init__(
+            self,
+            app: ASGIAppType,
+            max_concurrency: int,
+            *,
+            max_queue: int = 0,
+            max_wait: float = 1.0,
+            lifo: bool = False,
+            lanes: Mapping[str, int] | None = None,
+            retry_after: int | None = None
+    ) -> None:
+        if max_concurrency <= 0:
+            raise ValueError('Concurrency limit must be a positive number')
+        if max_queue < 0:
+            raise ValueError('Queue size must not be negative')
+        self.app = app
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.max_wait = max_wait
+        self.lifo = lifo
+        self.in_flight = 0
+        self.queued = 0
+        self.shed = 0
+        self.lanes = sorted((lanes or {}).items(), key=lambda lane: len(lane[0]), reverse=True)
+        self.priorities = sorted({DEFAULT_PRIORITY, *(lanes or {}).values()}, reverse=True)
+        self._waiters: dict[int, deque[asyncio.Future[None]]] = {priority: deque() for priority in self.priorities}
+        headers = [(b'retry-after', str(retry_after).encode('latin-1'))] if retry_after is not None else []
+        self.response = PrebuiltResponse(HTTP_503_SERVICE_UNAVAILABLE, SERVICE_UNAVAILABLE_BODY, headers)
+
+    async def __call__(self, scope: Scope, receive: ASGIReceiveCallable, send: ASGISendCallable) -> None:
+        if scope['type'] != ScopeType.HTTP:
+            await self.app(scope, receive, send)
+            return None
+
+        if self.in_flight < self.max_concurrency:
+            self.in_flight += 1
+        elif not await self._wait(scope):
+            self.shed += 1
+            await self.response.send(send)
+            return None
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self._release()
+
+    def get_priority(self, path: str) -> int:
+        """ Get the priority of the lane of the path. """
+        for prefix, priority in self.lanes:
+            if path.startswith(prefix):
+                return priority
+        return DEFAULT_PRIORITY
+
+    def stats(self) -> ConcurrencyStats:
+        """ Get the gauges. """
+        return ConcurrencyStats(self.in_flight, self.queued, self.shed, self.max_concurrency, self.max_queue)
+
+    async def _wait(self, scope: Scope) -> bool:
+        if self.queued >= self.max_queue:
+            return False
+
+        waiters = self._waiters[self.get_priority(scope['path'])]
+        waiter = asyncio.get_running_loop().create_future()
+        waiters.append(waiter)
+        self.queued += 1
+        try:
+            async with asyncio.timeout(self.max_wait):
+                await waiter
+        except TimeoutError:
+            return self._abandon(waiters, waiter)
+        except asyncio.CancelledError:
+            if self._abandon(waiters, waiter):
+                self._release()
+            raise
+        return True
+
+    def _abandon(self, waiters: deque[asyncio.Future[None]], waiter: asyncio.Future[None]) -> bool:
+        """ Leave the queue, `True` is returned if the slot has been handed over meanwhile. """
+        if waiter.done() and not waiter.cancelled():
+            return True
+        waiter.cancel()
+        try:
+            waiters.remove(waiter)
+        except ValueError:
+            # INFO: The cancelled waiter has been skipped by a release meanwhile
+            pass
+        self.queued -= 1
+        return False
+
+    def _release(self) -> None:
+        for priority in self.priorities:
+            waiters = self._waiters[priority]
+            while waiters:
+                waiter = waiters.pop() if self.lifo else waiters.popleft()
+                if not waiter.done():
+                    waiter.set_result(None)
+                    self.queued -= 1
+                    return None
+        self.in_flight -= 1
@@ -0,0 +1,119 @@
+from enum import Enum
+
+from speedy.conditional import make_etag, is_not_modified, NOT_MODIFIED_HEADERS
+from speedy.constants import SAFE_METHODS
+from speedy.datastructures import MutableHeaders
+from speedy.enums import ScopeType
+from speedy.status_code import HTTP_200_OK, HTTP_304_NOT_MODIFIED
+from speedy.types import Scope, ASGIReceiveCallable, ASGISendCallable, Message
+from speedy.types.application import ASGIAppType
+
+CONDITIONAL_HEADERS = frozenset({b'if-none-match', b'if-modified-since'})
+
+
+class ResponderState(Enum):
+    PASSTHROUGH = 0
+    BUFFERING = 1
+    NOT_MODIFIED = 2
+
+
+class ConditionalGetMiddleware:
+    """ Answer the conditional `GET` and `HEAD` requests with `304 Not Modified`. """
+
+    def __init__(self, app: ASGIAppType, *, add_etag: bool = True, hash_streams: bool = False) -> None:
+        self.app = app
+        self.add_etag = add_etag
+        self.hash_streams = hash_streams
+
+    async def __call__(self, scope: Scope, receive: ASGIReceiveCallable, send: ASGISendCallable) -> None:
+        if scope['type'] != ScopeType.HTTP or scope['method'] not in SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return None
+
+        conditions = {
+            key.decode('latin-1'): value.decode('latin-1')
+            for key, value in scope['headers']
+            if key in CONDITIONAL_HEADERS
+        }
+        if not conditions and not self.add_etag:
+            await self.app(scope, receive, send)
+            return None
+
+        responder = ConditionalResponder(self, conditions, send)
+        await self.app(scope, receive, responder.send)
+
+
+class ConditionalResponder:
+    """ Validate the response messages of a single request against its conditions. """
+
+    __slots__ = ('middleware', 'conditions', 'app_send', 'start_message', 'headers', 'chunks', 'state')
+
+    def __init__(self, middleware: ConditionalGetMiddleware, conditions: dict[str, str], send: ASGISendCallable) -> None:
+        self.middleware = middleware
+        self.conditions = conditions
+        self.app_send = send
+        self.start_message: Message | None = None
+        self.headers: MutableHeaders | None = None
+        self.chunks: list[bytes] = []
+        self.state = ResponderState.PASSTHROUGH
+
+    async def send(self, message: Message) -> None:
+        message_type = message['type']
+        if message_type == 'http.response.start':
+            await self._start(message)
+            return None
+        if message_type != 'http.response.body' or self.state is ResponderState.PASSTHROUGH:
+            await self.app_send(message)
+            return None
+        if self.state is ResponderState.NOT_MODIFIED:
+            return None
+
+        more_body = message.get('more_body', False)
+        if more_body and not self.chunks and not self.middleware.hash_streams:
+            self.state = ResponderState.PASSTHROUGH
+            await self.app_send(self.start_message)
+            await self.app_send(message)
+            return None
+
+        self.chunks.append(message.get('body', b''))
+        if more_body:
+            return None
+
+        body = b''.join(self.chunks)
+        self.headers['etag'] = make_etag(body)
+        if self._is_not_modified():
+            await self._send_not_modified()
+            return None
+        self.start_message['headers'] = self.headers.raw
+        await self.app_send(self.start_message)
+        await self.app_send({'type': 'http.response.body', 'body': body, 'more_body': False})
+
+    async def _start(self, message: Message) -> None:
+        self.start_message = message
+        if message['status'] != HTTP_200_OK:
+            await self.app_send(message)
+            return None
+
+        self.headers = MutableHeaders(raw=list(message.get('headers', ())))
+        if 'etag' in self.headers or not self.middleware.add_etag:
+            if self._is_not_modified():
+                await self._send_not_modified()
+            else:
+                await self.app_send(message)
+            return None
+
+        self.state = ResponderState.BUFFERING
+
+    def _is_not_modified(self) -> bool:
+        if not self.conditions:
+            return False
+        return is_not_modified(self.conditions, self.headers.get('etag'), self.headers.get('last-modified'))
+
+    async def _send_not_modified(self) -> None:
+        self.state = ResponderState.NOT_MODIFIED
+        await self.app_send({
+            'type': 'http.response.start',
+            'status': HTTP_304_NOT_MODIFIED,
+            'headers': [(key, value) for key, value in self.headers.raw if key.decode('latin-1') in NOT_MODIFIED_HEADERS],
+        })
+        await self.app_send({'type': 'http.response.body', 'body': b'', 'more_body': False})
@@ -0,0 +1,196 @@
+import functools
+import re
+from collections.abc import Collection
+
+from speedy.constants import HTTP_METHODS, WILDCARD
+from speedy.enums import ScopeType
+from speedy.middleware.prebuilt import PrebuiltResponse
+from speedy.status_code import HTTP_200_OK, HTTP_400_BAD_REQUEST
+from speedy.types import Scope, ASGIReceiveCallable, ASGISendCallable, Message, RawHeaders
+from speedy.types.application import ASGIAppType
+
+SAFELISTED_HEADERS = frozenset({'accept', 'accept-language', 'content-language', 'content-type'})
+PREFLIGHT_BODY = b'OK'
+DISALLOWED_ORIGIN = PrebuiltResponse(HTTP_400_BAD_REQUEST, b'Disallowed CORS origin')
+DISALLOWED_METHOD = PrebuiltResponse(HTTP_400_BAD_REQUEST, b'Disallowed CORS method')
+DISALLOWED_HEADERS = PrebuiltResponse(HTTP_400_BAD_REQUEST, b'Disallowed CORS headers')
+
+CORSHeaders = tuple[RawHeaders, RawHeaders]
+
+
+@functools.lru_cache(maxsize=256)
+def parse_header_names(value: bytes) -> frozenset[str]:
+    """ Parse the `Access-Control-Request-Headers` header value into the lowercase header names. """
+    return frozenset(name.strip().lower() for name in value.decode('latin-1').split(',')) - {''}
+
+
+def merge_headers(headers: RawHeaders, cors_headers: RawHeaders) -> RawHeaders:
+    """
+    Add the CORS headers to the response headers.
+
+    The CORS headers set by the application are replaced, the `Vary`
+    value is merged into its existing `Vary` header.
+    """
+    names = {key for key, _ in cors_headers}
+    merged: RawHeaders = []
+    vary_index = None
+    for key, value in headers:
+        if key == b'vary':
+            if vary_index is None:
+                vary_index = len(merged)
+        elif key in names:
+            continue
+        merged.append((key, value))
+
+    for key, value in cors_headers:
+        if key != b'vary' or vary_index is None:
+            merged.append((key, value))
+            continue
+        vary = merged[vary_index][1]
+        tokens = {token.strip().lower() for token in vary.split(b',')}
+        if value.lower() not in tokens and b'*' not in tokens:
+            merged[vary_index] = (b'vary', vary + b', ' + value)
+    return merged
+
+
+class CORSMiddleware:
+    """ Add the CORS headers to the responses of the allowed origins and answer their preflight requests. """
+
+    def __init__(
+            self,
+            app: ASGIAppType,
+            *,
+            allow_origins: Collection[str] = (),
+            allow_methods: Collection[str] = ('GET',),
+            allow_headers: Collection[str] = (),
+            allow_credentials: bool = False,
+            allow_origin_regex: str | None = None,
+            expose_headers: Collection[str] = (),
+            max_age: int = 600,
+            origin_cache_size: int = 1024
+    ) -> None:
+        self.app = app
+        self.allow_all_origins = WILDCARD in allow_origins
+        self.allow_all_methods = WILDCARD in allow_methods
+        self.allow_all_headers = WILDCARD in allow_headers
+        self.allow_origins = frozenset(origin.encode('latin-1') for origin in allow_origins if origin != WILDCARD)
+        self.allow_origin_regex = re.compile(allow_origin_regex.encode('latin-1')) if allow_origin_regex else None
+        methods = HTTP_METHODS if self.allow_all_methods else sorted({method.upper() for method in allow_methods})
+        self.allow_methods = frozenset(method.encode('latin-1') for method in methods)
+        self.allow_headers = SAFELISTED_HEADERS | {header.lower() for header in allow_headers if header != WILDCARD}
+        self.is_origin_echoed = not self.allow_all_origins or allow_credentials
+
+        self.simple_headers: RawHeaders = []
+        self.preflight_headers: RawHeaders = [
+            (b'content-type', b'text/plain; charset=utf-8'),
+            (b'content-length', str(len(PREFLIGHT_BODY)).encode('latin-1')),
+            (b'access-control-allow-methods', ', '.join(methods).encode('latin-1')),
+            (b'access-control-max-age', str(max_age).encode('latin-1')),
+        ]
+        if allow_credentials:
+            self.simple_headers.append((b'access-control-allow-credentials', b'true'))
+            self.preflight_headers.append((b'access-control-allow-credentials', b'true'))
+        if expose_headers:
+            self.simple_headers.append((b'access-control-expose-headers', ', '.join(expose_headers).encode('latin-1')))
+        if not self.allow_all_headers:
+            self.preflight_headers.append(
+                (b'access-control-allow-headers', ', '.join(sorted(self.allow_headers)).encode('latin-1'))
+            )
+
+        self._origin_headers: dict[bytes, CORSHeaders] = {
+            origin: self._build_headers(origin) for origin in self.allow_origins
+        }
+        self._any_origin_headers = self._build_headers(b'*')
+        self._match_origin = functools.lru_cache(maxsize=origin_cache_size)(self._match_origin_headers)
+
+    async def __call__(self, scope: Scope, receive: ASGIReceiveCallable, send: ASGISendCallable) -> None:
+        if scope['type'] != ScopeType.HTTP:
+            await self.app(scope, receive, send)
+            return None
+
+        origin = request_method = request_headers = None
+        for key, value in scope['headers']:
+            if key == b'origin':
+                origin = value
+            elif key == b'access-control-request-method':
+                request_method = value
+            elif key == b'access-control-request-headers':
+                request_headers = value
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return None
+
+        if scope['method'] == 'OPTIONS' and request_method is not None:
+            await self._preflight(origin, request_method, request_headers, send)
+            return None
+
+        headers = self.get_headers(origin)
+        if headers is None:
+            await self.app(scope, receive, send)
+            return None
+        await self.app(scope, receive, CORSResponder(headers[0], send).send)
+
+    def get_headers(self, origin: bytes) -> CORSHeaders | None:
+        """ Get the simple and the preflight response headers of the origin, `None` is returned if it is not allowed. """
+        headers = self._origin_headers.get(origin)
+        if headers is not None:
+            return headers
+        if self.allow_all_origins and not self.is_origin_echoed:
+            return self._any_origin_headers
+        if self.allow_all_origins or self.allow_origin_regex is not None:
+            return self._match_origin(origin)
+        return None
+
+    def _match_origin_headers(self, origin: bytes) -> CORSHeaders | None:
+        if self.allow_all_origins or self.allow_origin_regex.fullmatch(origin) is not None:
+            return self._build_headers(origin)
+        return None
+
+    def _build_headers(self, origin: bytes) -> CORSHeaders:
+        if self.is_origin_echoed:
+            origin_headers = [(b'access-control-allow-origin', origin), (b'vary', b'Origin')]
+        else:
+            origin_headers = [(b'access-control-allow-origin', b'*')]
+        return [*origin_headers, *self.simple_headers], [*self.preflight_headers, *origin_headers]
+
+    async def _preflight(
+            self,
+            origin: bytes,
+            request_method: bytes,
+            request_headers: bytes | None,
+            send: ASGISendCallable
+    ) -> None:
+        headers = self.get_headers(origin)
+        if headers is None:
+            await DISALLOWED_ORIGIN.send(send)
+            return None
+        if request_method not in self.allow_methods:
+            await DISALLOWED_METHOD.send(send)
+            return None
+
+        preflight_headers = list(headers[1])
+        if request_headers is not None:
+            if self.allow_all_headers:
+                preflight_headers.append((b'access-control-allow-headers', request_headers))
+            elif not parse_header_names(request_headers) <= self.allow_headers:
+                await DISALLOWED_HEADERS.send(send)
+                return None
+
+        await send({'type': 'http.response.start', 'status': HTTP_200_OK, 'headers': preflight_headers})
+        await send({'type': 'http.response.body', 'body': PREFLIGHT_BODY, 'more_body': False})
+
+
+class CORSResponder:
+    """ Add the CORS headers to the response start of a single request. """
+
+    __slots__ = ('headers', 'app_send')
+
+    def __init__(self, headers: RawHeaders, send: ASGISendCallable) -> None:
+        self.headers = headers
+        self.app_send = send
+
+    async def send(self, message: Message) -> None:
+        if message['type'] == 'http.response.start':
+            message['headers'] = merge_headers(message.get('headers', ()), self.headers)
+        await self.app_send(message)
@@ -1,22 +1,53 @@
+import traceback
+
 from speedy.enums import ScopeType
-from speedy.protocols.middleware import AbstractMiddleware
+from speedy.middleware.prebuilt import PrebuiltResponse
+from speedy.status_code import HTTP_500_INTERNAL_SERVER_ERROR
 from speedy.types import Scope, ASGIReceiveCallable, ASGISendCallable, Message
 from speedy.types.application import ASGIAppType
 
+SERVER_ERROR_BODY = b'Internal Server Error'
+
 
-class ServerErrorMiddleware(AbstractMiddleware):
-    def __init__(self, app: ASGIAppType) -> None:
+class ServerErrorMiddleware:
+    """ Answer the requests failed before their response start with a prebuilt `500`, then raise the error. """
+
+    def __init__(self, app: ASGIAppType, *, debug: bool = False) -> None:
         self.app = app
-        self.started_response = False
+        self.debug = debug
+        self.response = PrebuiltResponse(HTTP_500_INTERNAL_SERVER_ERROR, SERVER_ERROR_BODY)
 
     async def __call__(self, scope: Scope, receive: ASGIReceiveCallable, send: ASGISendCallable) -> None:
         if scope['type'] != ScopeType.HTTP:
             await self.app(scope, receive, send)
             return None
 
-        async def _send(message: Message) -> None:
-            nonlocal send
+        responder = ErrorResponder(send)
+        try:
+            await self.app(scope, receive, responder.send)
+        except Exception as exc:
+            if not responder.is_started:
+                if self.debug:
+                    await self._send_traceback(exc, send)
+                else:
+                    await self.response.send(send)
+            raise
+
+    async def _send_traceback(self, exc: Exception, send: ASGISendCallable) -> None:
+        body = ''.join(traceback.format_exception(exc)).encode('utf-8')
+        await PrebuiltResponse(HTTP_500_INTERNAL_SERVER_ERROR, body).send(send)
+
+
+class ErrorResponder:
+    """ Track the response start of a single request. """
+
+    __slots__ = ('app_send', 'is_started')
+
+    def __init__(self, send: ASGISendCallable) -> None:
+        self.app_send = send
+        self.is_started = False
 
-            if message['type'] == 'http.response.start':
-                self.started_response = True
-            await send(message)  # type: ignore[arg-type]
+    async def send(self, message: Message) -> None:
+        if message['type'] == 'http.response.start':
+            self.is_started = True
+        await self.app_send(message)
@@ -0,0 +1,196 @@
+import functools
+import zlib
+from collections.abc import Collection
+
+from speedy.datastructures import MutableHeaders
+from speedy.enums import ScopeType
+from speedy.status_code import HTTP_206_PARTIAL_CONTENT
+from speedy.types import Scope, ASGIReceiveCallable, ASGISendCallable, Message
+from speedy.types.application import ASGIAppType
+
+GZIP = 'gzip'
+DEFLATE = 'deflate'
+ENCODINGS = (GZIP, DEFLATE)
+DEFAULT_EXCLUDED_MEDIA_TYPES = frozenset({
+    'text/event-stream',
+    'application/gzip',
+    'application/x-gzip',
+    'application/zip',
+    'application/zstd',
+    'application/x-7z-compressed',
+    'application/x-bzip2',
+    'application/x-rar-compressed',
+    'application/octet-stream',
+    'font/woff',
+    'font/woff2',
+    'image/avif',
+    'image/gif',
+    'image/jpeg',
+    'image/png',
+    'image/webp',
+    'audio/*',
+    'video/*',
+})
+
+
+@functools.lru_cache(maxsize=256)
+def get_content_coding(accept_encoding: str) -> str | None:
+    """
+    Select the content coding from the `Accept-Encoding` header value.
+
+    The coding with the highest quality value wins, `gzip` is preferred
+    over `deflate` on a tie, `None` is returned if neither is acceptable.
+    """
+    qualities: dict[str, float] = {}
+    for item in accept_encoding.lower().split(','):
+        coding, _, params = item.partition(';')
+        coding = coding.strip()
+        quality = 1.0
+        for param in params.split(';'):
+            name, _, value = param.partition('=')
+            if name.strip() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding] = quality
+
+    wildcard = qualities.get('*', 0.0)
+    best_coding, best_quality = None, 0.0
+    for coding in ENCODINGS:
+        quality = qualities.get(coding, wildcard)
+        if quality > best_quality:
+            best_coding, best_quality = coding, quality
+    return best_coding
+
+
+class GZipMiddleware:
+    """ Compress the response bodies with `gzip` or `deflate` as negotiated with `Accept-Encoding`. """
+
+    def __init__(
+            self,
+            app: ASGIAppType,
+            minimum_size: int = 500,
+            compress_level: int = 6,
+            excluded_media_types: Collection[str] = DEFAULT_EXCLUDED_MEDIA_TYPES
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.compress_level = compress_level
+        self.excluded_media_types = frozenset(
+            media_type for media_type in excluded_media_types if not media_type.endswith('/*')
+        )
+        self.excluded_media_prefixes = tuple(
+            media_type[:-1] for media_type in excluded_media_types if media_type.endswith('/*')
+        )
+
+    async def __call__(self, scope: Scope, receive: ASGIReceiveCallable, send: ASGISendCallable) -> None:
+        if scope['type'] != ScopeType.HTTP:
+            await self.app(scope, receive, send)
+            return None
+
+        content_coding = None
+        for key, value in scope['headers']:
+            if key == b'accept-encoding':
+                content_coding = get_content_coding(value.decode('latin-1'))
+                break
+
+        if content_coding is None:
+            await self.app(scope, receive, send)
+            return None
+
+        responder = CompressionResponder(self, content_coding, send)
+        await self.app(scope, receive, responder.send)
+
+    def is_excluded(self, content_type: str) -> bool:
+        """ Check that the media type of the content type is not compressed. """
+        media_type = content_type.partition(';')[0].strip().lower()
+        return media_type in self.excluded_media_types or media_type.startswith(self.excluded_media_prefixes)
+
+
+class CompressionResponder:
+    """ Compress the response messages of a single request. """
+
+    __slots__ = ('middleware', 'content_coding', 'app_send', 'start_message', 'compressor', 'is_passthrough')
+
+    def __init__(self, middleware: GZipMiddleware, content_coding: str, send: ASGISendCallable) -> None:
+        self.middleware = middleware
+        self.content_coding = content_coding
+        self.app_send = send
+        self.start_message: Message | None = None
+        self.compressor: 'zlib._Compress | None' = None
+        self.is_passthrough = False
+
+    async def send(self, message: Message) -> None:
+        message_type = message['type']
+        if message_type == 'http.response.start':
+            self.start_message = message
+            self.is_passthrough = self._is_passthrough(message)
+            if self.is_passthrough:
+                await self.app_send(message)
+            return None
+
+        if self.is_passthrough:
+            await self.app_send(message)
+            return None
+
+        if message_type != 'http.response.body':
+            # INFO: The extensions, e.g. `http.response.pathsend`, send the body themselves, so it is not compressed
+            if self.compressor is None:
+                self.is_passthrough = True
+                await self.app_send(self.start_message)
+            await self.app_send(message)
+            return None
+
+        body = message.get('body', b'')
+        more_body = message.get('more_body', False)
+
+        if self.compressor is None:
+            if not more_body and len(body) < self.middleware.minimum_size:
+                self.is_passthrough = True
+                await self.app_send(self.start_message)
+                await self.app_send(message)
+                return None
+
+            self.compressor = self._get_compressor()
+            headers = self._get_encoded_headers()
+            body = self.compressor.compress(body)
+            if more_body:
+                del headers['content-length']
+            else:
+                body += self.compressor.flush()
+                headers['content-length'] = str(len(body))
+            self.start_message['headers'] = headers.raw
+            await self.app_send(self.start_message)
+            await self.app_send({'type': 'http.response.body', 'body': body, 'more_body': more_body})
+            return None
+
+        body = self.compressor.compress(body)
+        if not more_body:
+            body += self.compressor.flush()
+        elif not body:
+            return None
+        await self.app_send({'type': 'http.response.body', 'body': body, 'more_body': more_body})
+
+    def _is_passthrough(self, message: Message) -> bool:
+        if message['status'] == HTTP_206_PARTIAL_CONTENT:
+            return True
+        for key, value in message.get('headers', ()):
+            if key == b'content-encoding':
+                return True
+            if key == b'content-type' and self.middleware.is_excluded(value.decode('latin-1')):
+                return True
+        return False
+
+    def _get_compressor(self) -> 'zlib._Compress':
+        wbits = 16 + zlib.MAX_WBITS if self.content_coding == GZIP else zlib.MAX_WBITS
+        return zlib.compressobj(self.middleware.compress_level, zlib.DEFLATED, wbits)
+
+    def _get_encoded_headers(self) -> MutableHeaders:
+        headers = MutableHeaders(raw=list(self.start_message.get('headers', ())))
+        headers['content-encoding'] = self.content_coding
+        headers.add_vary_header('Accept-Encoding')
+        etag = headers.get('etag')
+        if etag is not None and not etag.startswith('W/'):
+            headers['etag'] = f'W/{etag}'
+        return headers
@@ -0,0 +1,27 @@
+from collections.abc import Iterable
+
+from speedy.types import ASGISendCallable, Message
+
+
+class PrebuiltResponse:
+    """ A `text/plain` response whose messages are built once and sent by the middleware without rendering. """
+
+    __slots__ = ('start_message', 'body_message')
+
+    def __init__(self, status_code: int, body: bytes, headers: Iterable[tuple[bytes, bytes]] = ()) -> None:
+        self.start_message: Message = {
+            'type': 'http.response.start',
+            'status': status_code,
+            'headers': [
+                (b'content-type', b'text/plain; charset=utf-8'),
+                (b'content-length', str(len(body)).encode('latin-1')),
+                *headers,
+            ],
+        }
+        self.body_message: Message = {'type': 'http.response.body', 'body': body, 'more_body': False}
+
+    async def send(self, send: ASGISendCallable) -> None:
+        # INFO: The outer middleware, e.g. `CORSMiddleware` or `ServerTimingMiddleware`, replace or update
+        # the headers of the start message, so it is copied with its headers, the body message is sent as is
+        await send({**self.start_message, 'headers': list(self.start_message['headers'])})
+        await send(self.body_message)
@@ -0,0 +1,88 @@
+import functools
+import ipaddress
+from collections.abc import Collection
+
+from speedy.constants import WILDCARD
+from speedy.enums import ScopeType
+from speedy.types import Scope, ASGIReceiveCallable, ASGISendCallable
+from speedy.types.application import ASGIAppType
+
+HTTP_SCHEMES = frozenset({'http', 'https'})
+SECURE_SCHEMES = frozenset({'https', 'wss'})
+
+
+class TrustedProxies:
+    """ A set of the trusted proxy addresses and networks, the `*` trusts every address. """
+
+    def __init__(self, trusted_hosts: Collection[str], *, cache_size: int = 1024) -> None:
+        self.is_trusting_all = WILDCARD in trusted_hosts
+        self.addresses: set[str] = set()
+        self.networks: list[ipaddress.IPv4Network | ipaddress.IPv6Network] = []
+        for host in trusted_hosts:
+            if host == WILDCARD:
+                continue
+            network = ipaddress.ip_network(host, strict=False)
+            if network.num_addresses == 1:
+                self.addresses.add(str(network.network_address))
+            else:
+                self.networks.append(network)
+        self._is_in_networks = functools.lru_cache(maxsize=cache_size)(self._get_is_in_networks)
+
+    def __contains__(self, host: str) -> bool:
+        if self.is_trusting_all or host in self.addresses:
+            return True
+        return bool(self.networks) and self._is_in_networks(host)
+
+    def _get_is_in_networks(self, host: str) -> bool:
+        try:
+            address = ipaddress.ip_address(host)
+        except ValueError:
+            return False
+        return any(address in network for network in self.networks)
+
+
+class ProxyHeadersMiddleware:
+    """ Take the client address and the scheme from the headers set by the trusted proxies. """
+
+    def __init__(self, app: ASGIAppType, *, trusted_hosts: Collection[str] = ('127.0.0.1',)) -> None:
+        self.app = app
+        self.trusted_proxies = TrustedProxies(trusted_hosts)
+
+    async def __call__(self, scope: Scope, receive: ASGIReceiveCallable, send: ASGISendCallable) -> None:
+        if scope['type'] not in (ScopeType.HTTP, ScopeType.WEBSOCKET):
+            await self.app(scope, receive, send)
+            return None
+
+        client = scope.get('client')
+        if client is None or client[0] not in self.trusted_proxies:
+            await self.app(scope, receive, send)
+            return None
+
+        forwarded_for = forwarded_proto = None
+        for key, value in scope['headers']:
+            if key == b'x-forwarded-for':
+                forwarded_for = value if forwarded_for is None else forwarded_for + b',' + value
+            elif key == b'x-forwarded-proto':
+                forwarded_proto = value
+
+        if forwarded_proto is not None:
+            scheme = forwarded_proto.decode('latin-1').rsplit(',', 1)[-1].strip().lower()
+            if scope['type'] == ScopeType.WEBSOCKET:
+                scope['scheme'] = 'wss' if scheme in SECURE_SCHEMES else 'ws'
+            elif scheme in HTTP_SCHEMES:
+                scope['scheme'] = scheme
+
+        if forwarded_for is not None:
+            host = self.get_client_host(forwarded_for.decode('latin-1'))
+            if host is not None:
+                scope['client'] = (host, 0)
+
+        await self.app(scope, receive, send)
+
+    def get_client_host(self, forwarded_for: str) -> str | None:
+        """ Get the first address from the right of `X-Forwarded-For` which is not a trusted proxy. """
+        hosts = [host.strip() for host in forwarded_for.split(',')]
+        for host in reversed(hosts):
+            if host and host not in self.trusted_proxies:
+                return host
+        return hosts[0] or None
@@ -0,0 +1,141 @@
+import math
+import time
+from collections.abc import Callable, Hashable
+
+from speedy.enums import ScopeType
+from speedy.middleware.prebuilt import PrebuiltResponse
+from speedy.status_code import HTTP_429_TOO_MANY_REQUESTS
+from speedy.types import Scope, ASGIReceiveCallable, ASGISendCallable
+from speedy.types.application import ASGIAppType
+
+TOO_MANY_REQUESTS_BODY = b'Too Many Requests'
+
+KeyFunction = Callable[[Scope], Hashable | None]
+
+
+def get_client_key(scope: Scope) -> Hashable | None:
+    """ Get the client host of the connection. """
+    client = scope.get('client')
+    return client[0] if client else None
+
+
+def get_header_key(name: str) -> KeyFunction:
+    """ Get the key function reading the value of the request header. """
+    header_name = name.lower().encode('latin-1')
+
+    def get_key(scope: Scope) -> Hashable | None:
+        for key, value in scope['headers']:
+            if key == header_name:
+                return value
+        return None
+
+    return get_key
+
+
+class RateLimitMiddleware:
+    """ Limit the request rate of each client with a lazily refilled token bucket, the excess requests get `429`. """
+
+    def __init__(
+            self,
+            app: ASGIAppType,
+            *,
+            rate: float,
+            burst: int | None = None,
+            key: KeyFunction | None = None,
+            header: str | None = None,
+            shards: int = 16,
+            max_keys: int = 1_000_000,
+            sweep_batch: int = 8,
+            clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        if rate <= 0:
+            raise ValueError('Rate must be a positive number')
+        if sweep_batch <= 0:
+            raise ValueError('Sweep batch must be a positive number')
+        if key is not None and header is not None:
+            raise ValueError('Either "key" or "header" can be specified')
+        self.app = app
+        self.rate = rate
+        self.burst = burst if burst is not None else max(math.ceil(rate), 1)
+        self.get_key = key or (get_header_key(header) if header is not None else get_client_key)
+        self.shard_count = shards
+        self.shard_size = max(max_keys // shards, 1)
+        self.idle_timeout = self.burst / rate
+        self.sweep_batch = sweep_batch
+        self.clock = clock
+        self.shards: list[dict[Hashable, tuple[float, float]]] = [{} for _ in range(shards)]
+        self._sweep_index = 0
+        self._responses = [
+            PrebuiltResponse(
+                HTTP_429_TOO_MANY_REQUESTS,
+                TOO_MANY_REQUESTS_BODY,
+                [(b'retry-after', str(max(retry_after, 1)).encode('latin-1'))],
+            )
+            for retry_after in range(math.ceil(1 / rate) + 1)
+        ]
+
+    def __len__(self) -> int:
+        return sum(map(len, self.shards))
+
+    async def __call__(self, scope: Scope, receive: ASGIReceiveCallable, send: ASGISendCallable) -> None:
+        if scope['type'] != ScopeType.HTTP:
+            await self.app(scope, receive, send)
+            return None
+
+        key = self.get_key(scope)
+        if key is None:
+            await self.app(scope, receive, send)
+            return None
+
+        retry_after = self.acquire(key)
+        self.sweep_step()
+
+        if retry_after is None:
+            await self.app(scope, receive, send)
+            return None
+
+        await self._responses[retry_after].send(send)
+
+    def acquire(self, key: Hashable) -> int | None:
+        """ Take a token of the key, the seconds to wait for the next token are returned if there is none. """
+        shard = self.shards[hash(key) % self.shard_count]
+        now = self.clock()
+        bucket = shard.pop(key, None)
+        if bucket is None:
+            tokens = self.burst
+            if len(shard) >= self.shard_size:
+                del shard[next(iter(shard))]
+        else:
+            tokens, last = bucket
+            tokens = min(self.burst, tokens + (now - last) * self.rate)
+
+        if tokens >= 1:
+            shard[key] = tokens - 1, now
+            return None
+        shard[key] = tokens, now
+        return math.ceil((1 - tokens) / self.rate)
+
+    def sweep(self) -> int:
+        """ Drop all the idle buckets, their number is returned. """
+        deadline = self.clock() - self.idle_timeout
+        return sum(self._sweep_shard(shard, deadline, len(shard)) for shard in self.shards)
+
+    def sweep_step(self) -> int:
+        """ Drop at most `sweep_batch` idle buckets of the current shard, their number is returned. """
+        shard = self.shards[self._sweep_index]
+        removed = self._sweep_shard(shard, self.clock() - self.idle_timeout, self.sweep_batch)
+        if removed < self.sweep_batch:
+            # INFO: The shard has no idle bucket left, the next request sweeps the next shard
+            self._sweep_index = (self._sweep_index + 1) % self.shard_count
+        return removed
+
+    @staticmethod
+    def _sweep_shard(shard: dict[Hashable, tuple[float, float]], deadline: float, limit: int) -> int:
+        removed = 0
+        while shard and removed < limit:
+            key = next(iter(shard))
+            if shard[key][1] > deadline:
+                break
+            del shard[key]
+            removed += 1
+        return removed
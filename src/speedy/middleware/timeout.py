@@ -0,0 +1,58 @@
+import asyncio
+import time
+
+from speedy.concurrency import DEADLINE
+from speedy.enums import ScopeType
+from speedy.middleware.prebuilt import PrebuiltResponse
+from speedy.status_code import HTTP_504_GATEWAY_TIMEOUT, HTTP_503_SERVICE_UNAVAILABLE
+from speedy.types import Scope, ASGIReceiveCallable, ASGISendCallable, Message
+from speedy.types.application import ASGIAppType
+
+TIMEOUT_BODIES = {
+    HTTP_503_SERVICE_UNAVAILABLE: b'Service Unavailable',
+    HTTP_504_GATEWAY_TIMEOUT: b'Gateway Timeout',
+}
+
+
+class TimeoutMiddleware:
+    """ Limit the time of a request, its deadline is kept in the `speedy.concurrency.DEADLINE` context variable. """
+
+    def __init__(self, app: ASGIAppType, timeout: float, *, status_code: int = HTTP_504_GATEWAY_TIMEOUT) -> None:
+        if timeout <= 0:
+            raise ValueError('Timeout must be a positive number')
+        if status_code not in TIMEOUT_BODIES:
+            raise ValueError(f'Status code must be one of {sorted(TIMEOUT_BODIES)}')
+        self.app = app
+        self.timeout = timeout
+        self.status_code = status_code
+        self.response = PrebuiltResponse(status_code, TIMEOUT_BODIES[status_code])
+
+    async def __call__(self, scope: Scope, receive: ASGIReceiveCallable, send: ASGISendCallable) -> None:
+        if scope['type'] != ScopeType.HTTP:
+            await self.app(scope, receive, send)
+            return None
+
+        deadline = time.monotonic() + self.timeout
+        outer_deadline = DEADLINE.get()
+        if outer_deadline is not None and outer_deadline < deadline:
+            deadline = outer_deadline
+
+        is_started = False
+
+        async def _send(message: Message) -> None:
+            nonlocal is_started
+            if message['type'] == 'http.response.start':
+                is_started = True
+            await send(message)
+
+        token = DEADLINE.set(deadline)
+        timeout = asyncio.timeout(deadline - time.monotonic())
+        try:
+            async with timeout:
+                await self.app(scope, receive, _send)
+        except TimeoutError:
+            if is_started or not (timeout.expired() or time.monotonic() >= deadline):
+                raise
+            await self.response.send(send)
+        finally:
+            DEADLINE.reset(token)
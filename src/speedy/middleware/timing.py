@@ -0,0 +1,86 @@
+import time
+from collections.abc import Callable
+from typing import Any
+
+from speedy.enums import ScopeType
+from speedy.timing import TIMING, RequestTiming
+from speedy.types import Scope, ASGIReceiveCallable, ASGISendCallable, Message
+from speedy.types.application import ASGIAppType
+from speedy.utils.predicates import is_async_callable
+
+TimingCallback = Callable[[RequestTiming], Any]
+StartCallback = Callable[[RequestTiming], None]
+
+
+class ServerTimingMiddleware:
+    """ Time the phases of a request, the timing is kept in the `speedy.timing.TIMING` context variable. """
+
+    def __init__(
+            self,
+            app: ASGIAppType,
+            *,
+            header: bool = True,
+            callback: TimingCallback | None = None,
+            on_start: StartCallback | None = None
+    ) -> None:
+        self.app = app
+        self.header = header
+        self.callback = callback
+        self.is_async_callback = callback is not None and is_async_callable(callback)
+        # INFO: `on_start` is called synchronously with the timing when the request enters, `callback` once it returns
+        self.on_start = on_start
+
+    async def __call__(self, scope: Scope, receive: ASGIReceiveCallable, send: ASGISendCallable) -> None:
+        if scope['type'] != ScopeType.HTTP:
+            await self.app(scope, receive, send)
+            return None
+
+        timing = RequestTiming(scope['method'], scope['path'])
+        responder = TimingResponder(timing, self.header, receive, send)
+        if self.on_start is not None:
+            self.on_start(timing)
+        token = TIMING.set(timing)
+        try:
+            await self.app(scope, responder.receive, responder.send)
+        finally:
+            TIMING.reset(token)
+            if self.callback is not None:
+                if self.is_async_callback:
+                    await self.callback(timing)
+                else:
+                    self.callback(timing)
+
+
+class TimingResponder:
+    """ Record the response start and end and count the body bytes of a single request. """
+
+    __slots__ = ('timing', 'header', 'app_receive', 'app_send')
+
+    def __init__(self, timing: RequestTiming, header: bool, receive: ASGIReceiveCallable, send: ASGISendCallable) -> None:
+        self.timing = timing
+        self.header = header
+        self.app_receive = receive
+        self.app_send = send
+
+    async def receive(self) -> Message:
+        message = await self.app_receive()
+        if message['type'] == 'http.request':
+            self.timing.bytes_received += len(message.get('body', b''))
+        return message
+
+    async def send(self, message: Message) -> None:
+        message_type = message['type']
+        if message_type == 'http.response.start':
+            timing = self.timing
+            timing.response_start = time.perf_counter()
+            timing.status = message['status']
+            if self.header:
+                message['headers'] = [
+                    *message.get('headers', ()),
+                    (b'server-timing', timing.get_server_timing().encode('latin-1'))
+                ]
+        await self.app_send(message)
+        if message_type == 'http.response.body':
+            self.timing.bytes_sent += len(message.get('body', b''))
+            if not message.get('more_body', False):
+                self.timing.response_end = time.perf_counter()
@@ -0,0 +1,68 @@
+import fnmatch
+import functools
+import re
+from collections.abc import Collection
+
+from speedy.constants import WILDCARD
+from speedy.enums import ScopeType
+from speedy.middleware.prebuilt import PrebuiltResponse
+from speedy.status_code import HTTP_400_BAD_REQUEST, WS_1008_POLICY_VIOLATION
+from speedy.types import Scope, ASGIReceiveCallable, ASGISendCallable
+from speedy.types.application import ASGIAppType
+from speedy.utils.helpers import strip_port
+
+INVALID_HOST_BODY = b'Invalid host header'
+
+
+def get_hostname(host: bytes) -> str:
+    """ Get the lowercase hostname of the `Host` header value, without the port. """
+    return strip_port(host.decode('latin-1'))
+
+
+class TrustedHostMiddleware:
+    """ Answer the requests with a `Host` header not in `allowed_hosts`, e.g. `*.example.org`, with `400`. """
+
+    def __init__(
+            self,
+            app: ASGIAppType,
+            *,
+            allowed_hosts: Collection[str] = (WILDCARD,),
+            cache_size: int = 1024
+    ) -> None:
+        self.app = app
+        self.is_allowing_all = WILDCARD in allowed_hosts
+        self.exact_hosts = frozenset(host.lower() for host in allowed_hosts if WILDCARD not in host)
+        patterns = [fnmatch.translate(host.lower()) for host in allowed_hosts if WILDCARD in host and host != WILDCARD]
+        self.host_pattern = re.compile('|'.join(patterns)) if patterns else None
+        self._is_matching = functools.lru_cache(maxsize=cache_size)(self._get_is_matching)
+        self.response = PrebuiltResponse(HTTP_400_BAD_REQUEST, INVALID_HOST_BODY)
+
+    async def __call__(self, scope: Scope, receive: ASGIReceiveCallable, send: ASGISendCallable) -> None:
+        if self.is_allowing_all or scope['type'] not in (ScopeType.HTTP, ScopeType.WEBSOCKET):
+            await self.app(scope, receive, send)
+            return None
+
+        host = None
+        for key, value in scope['headers']:
+            if key == b'host':
+                host = value
+                break
+
+        if host is not None and self.is_allowed(host):
+            await self.app(scope, receive, send)
+            return None
+
+        if scope['type'] == ScopeType.WEBSOCKET:
+            await send({'type': 'websocket.close', 'code': WS_1008_POLICY_VIOLATION})
+            return None
+        await self.response.send(send)
+
+    def is_allowed(self, host: bytes) -> bool:
+        """ Check the `Host` header value. """
+        hostname = get_hostname(host)
+        if hostname in self.exact_hosts:
+            return True
+        return self.host_pattern is not None and self._is_matching(hostname)
+
+    def _get_is_matching(self, hostname: str) -> bool:
+        return self.host_pattern.fullmatch(hostname) is not None
@@ -20,4 +20,7 @@ class ASGIApplication(ABC):
     def build_middleware_stack(self) -> ASGIAppType: ...
 
     @abstractmethod
-    def route_reverse(self, name: str, **path_params: Any) -> 'URLPath': ...
+    def route_reverse(self, name: str, /, **path_params: Any) -> 'URLPath': ...
+
+    @abstractmethod
+    def path_for(self, name: str, /, **path_params: Any) -> str: ...
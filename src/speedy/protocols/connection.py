@@ -59,4 +59,7 @@ class Connection(Protocol[UserT, AuthT, StateT]):
     def state(self) -> StateT: ...
 
     @abstractmethod
-    def url_for(self, name: str, **path_params: Any) -> URL: ...
+    def url_for(self, name: str, /, **path_params: Any) -> URL: ...
+
+    @abstractmethod
+    def path_for(self, name: str, /, **path_params: Any) -> str: ...
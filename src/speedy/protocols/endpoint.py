@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+from speedy.protocols.request import AbstractRequest
+
+
+class BaseHTTPEndpoint(ABC):
+    @abstractmethod
+    async def dispatch(self) -> None: ...
+
+    @abstractmethod
+    async def method_not_allowed(self, request: AbstractRequest) -> Any: ...
@@ -6,7 +6,7 @@ from speedy.protocols.connection import Connection, UserT, AuthT, StateT
 from speedy.types import Method
 
 
-class AbstractRequest(Protocol[UserT, AuthT, StateT], Connection[UserT, AuthT, StateT]):
+class AbstractRequest(Connection[UserT, AuthT, StateT], Protocol[UserT, AuthT, StateT]):
     @property
     @abstractmethod
     def method(self) -> Method: ...
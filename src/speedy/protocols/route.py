@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+from speedy.enums import Match
+from speedy.types import Scope, ASGIReceiveCallable, ASGISendCallable
+
+
+class AbstractRoute(ABC):
+    @abstractmethod
+    def matches(self, scope: Scope) -> tuple[Match, Scope]: ...
+
+    @abstractmethod
+    async def handle(self, scope: Scope, receive: ASGIReceiveCallable, send: ASGISendCallable) -> None: ...
+
+    @abstractmethod
+    def path_for(self, name: str, /, **path_params: Any) -> str: ...
@@ -9,7 +9,7 @@ from speedy.types import ASGIReceiveCallable, ASGISendCallable
 WebSocketMode = Literal['text', 'bytes']
 
 
-class AbstractWebSocket(Protocol[UserT, AuthT, StateT], Connection[UserT, AuthT, StateT]):
+class AbstractWebSocket(Connection[UserT, AuthT, StateT], Protocol[UserT, AuthT, StateT]):
     @abstractmethod
     def receive_wrapper(self, receive: ASGIReceiveCallable) -> ASGIReceiveCallable: ...
 
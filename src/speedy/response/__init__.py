@@ -1,12 +1,16 @@
 from .base import Response
+from .file import FileResponse
 from .html import HTMLResponse
 from .json import JSONResponse
 from .plaint_text import PlainTextResponse
+from .streaming import StreamingResponse
 
 
 __all__ = (
     'Response',
+    'FileResponse',
     'HTMLResponse',
     'JSONResponse',
-    'PlainTextResponse'
+    'PlainTextResponse',
+    'StreamingResponse'
 )
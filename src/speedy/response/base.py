@@ -12,6 +12,8 @@ ZERO_VALUE = 0
 
 
 class Response(Generic[T]):
+    media_type: MediaType | str | None = None
+
     def __init__(
             self,
             content: T | None = None,
@@ -23,12 +25,13 @@ class Response(Generic[T]):
             encoding: str = 'utf-8'
     ) -> None:
         self.background = background
-        self.headers: MutableHeaders = self._init_headers(headers)
-        self.media_type = media_type
+        if media_type is not None:
+            self.media_type = media_type
         self.status_code = status_code
         self.encoding = encoding
-        self.cookies = self._init_cookie(cookie)
         self.body = self.render(content)
+        self.headers: MutableHeaders = self._init_headers(headers)
+        self.cookies = self._init_cookie(cookie)
 
     async def __call__(self, scope: Scope, recieve: ASGIReceiveCallable, send: ASGISendCallable) -> None:
         prefix = 'websocket.' if scope['type'] == 'websocket' else ''
@@ -122,14 +125,14 @@ class Response(Generic[T]):
         is_content_length = 'content-length' in keys
         is_content_type = 'content-type' in keys
 
-        if self.body is not None and is_content_length and not (
+        if self.body is not None and not is_content_length and not (
                 self.status_code < HTTP_200_OK or self.status_code in (HTTP_204_NO_CONTENT, HTTP_304_NOT_MODIFIED)
         ):
             content_length = str(len(self.body))
             raw_headers['Content-Length'] = content_length
 
         content_type = self._get_content_type()
-        if content_type is not None and is_content_type:
+        if content_type is not None and not is_content_type:
             if content_type.startswith('text/') and 'charset=' not in content_type.lower():
                 content_type += f'; charset={self.encoding}'
             raw_headers['Content-Type'] = content_type
@@ -137,7 +140,7 @@ class Response(Generic[T]):
 
     def _get_content_type(self) -> str | None:
         if isinstance(self.media_type, MediaType):
-            return self.media_type.name
+            return self.media_type.value
         return self.media_type
 
     def _init_cookie(self, cookie: Sequence[Cookie] | Mapping[str, str]) -> list[Cookie]:
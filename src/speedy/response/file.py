@@ -0,0 +1,385 @@
+import asyncio
+import mimetypes
+import os
+import secrets
+import stat
+import time
+from collections.abc import Callable, Mapping
+from typing import Any, BinaryIO
+from urllib.parse import quote
+
+# INFO: `speedy.conditional` imports this package, its functions are looked up once it is initialized
+import speedy.conditional as conditional
+from speedy import BackgroundTask, BackgroundTasks, MediaType
+from speedy.concurrency import sync_to_thread
+from speedy.constants import ONE_KILOBYTE
+from speedy.datastructures import Headers
+from speedy.response.base import Response
+from speedy.response.plaint_text import PlainTextResponse
+from speedy.status_code import (
+    HTTP_200_OK,
+    HTTP_206_PARTIAL_CONTENT,
+    HTTP_404_NOT_FOUND,
+    HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+)
+from speedy.types import Scope, ASGIReceiveCallable, ASGISendCallable
+
+PATHSEND = 'http.response.pathsend'
+ZEROCOPYSEND = 'http.response.zerocopysend'
+MAX_RANGES = 16
+CONDITIONAL_HEADERS = frozenset({b'range', b'if-range', b'if-none-match', b'if-modified-since'})
+
+ByteRange = tuple[int, int]
+
+
+def parse_range_header(value: str, size: int) -> list[ByteRange] | None:
+    """
+    Parse the `Range` header value into the sorted and merged `(start, end)` byte ranges, the end is exclusive.
+
+    `None` is returned if the header is invalid or has more than
+    `MAX_RANGES` ranges, so it is ignored, and an empty list if no range
+    is satisfiable.
+    """
+    unit, _, specs = value.partition('=')
+    if unit.strip().lower() != 'bytes' or not specs:
+        return None
+
+    ranges = []
+    for spec in specs.split(','):
+        first, separator, last = spec.strip().partition('-')
+        if not separator:
+            return None
+        try:
+            if not first:
+                length = int(last)
+                if length > 0 and size > 0:
+                    ranges.append((max(size - length, 0), size))
+                continue
+            start = int(first)
+            end = int(last) + 1 if last else size
+        except ValueError:
+            return None
+        if start < 0 or (last and end <= start):
+            return None
+        if start < size:
+            ranges.append((start, min(end, size)))
+
+    merged: list[ByteRange] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = merged[-1][0], max(merged[-1][1], end)
+        else:
+            merged.append((start, end))
+    if len(merged) > MAX_RANGES:
+        return None
+    return merged
+
+
+def get_content_disposition(disposition_type: str, filename: str) -> str:
+    """ Get the `Content-Disposition` header value, the non ASCII file names are encoded. """
+    quoted = quote(filename)
+    if quoted != filename:
+        return f"{disposition_type}; filename*=utf-8''{quoted}"
+    return f'{disposition_type}; filename="{filename}"'
+
+
+class StatCache:
+    """ Keep the `os.stat` results of the existing files for `ttl` seconds. """
+
+    def __init__(self, ttl: float = 1.0, max_size: int = 1024, clock: Callable[[], float] = time.monotonic) -> None:
+        self.ttl = ttl
+        self.max_size = max_size
+        self.clock = clock
+        self._results: dict[str, tuple[float, os.stat_result]] = {}
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def get(self, path: str) -> os.stat_result | None:
+        """ Get the kept result of the file, `None` is returned if it is missing or expired. """
+        result = self._results.get(path)
+        if result is None:
+            return None
+        expires, stat_result = result
+        if self.clock() >= expires:
+            del self._results[path]
+            return None
+        return stat_result
+
+    def set(self, path: str, stat_result: os.stat_result) -> None:
+        """ Keep the result of the file. """
+        self._results.pop(path, None)
+        if len(self._results) >= self.max_size:
+            del self._results[next(iter(self._results))]
+        self._results[path] = self.clock() + self.ttl, stat_result
+
+    async def stat(self, path: str) -> os.stat_result:
+        """ Get the result of the file, `os.stat` runs in a thread if it is not kept. """
+        stat_result = self.get(path)
+        if stat_result is None:
+            stat_result = await sync_to_thread(os.stat, path)
+            self.set(path, stat_result)
+        return stat_result
+
+    def clear(self) -> None:
+        """ Drop all the results. """
+        self._results.clear()
+
+
+def open_file(path: str) -> tuple[BinaryIO, os.stat_result]:
+    """ Open the file and get the `os.fstat` result of the opened file. """
+    file = open(path, 'rb')
+    try:
+        return file, os.fstat(file.fileno())
+    except BaseException:
+        file.close()
+        raise
+
+
+def get_etag(stat_result: os.stat_result) -> str:
+    """ Get the `ETag` header value of the file from its modification time and size. """
+    return f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+
+
+def is_same_file(stat_result: os.stat_result, other: os.stat_result) -> bool:
+    """ Check that the results describe the same version of the same file. """
+    return (
+            stat_result.st_ino == other.st_ino
+            and stat_result.st_size == other.st_size
+            and stat_result.st_mtime_ns == other.st_mtime_ns
+    )
+
+
+def read_chunk(file: BinaryIO, offset: int, size: int) -> bytes:
+    """ Read the chunk of the file at the offset. """
+    file.seek(offset)
+    return file.read(size)
+
+
+class FileResponse(Response[None]):
+    """ Send a file with the server extensions, or in chunks read in a thread, the byte ranges are supported. """
+
+    stat_cache = StatCache()
+
+    def __init__(
+            self,
+            path: str | os.PathLike[str],
+            background: BackgroundTask | BackgroundTasks | None = None,
+            headers: Headers | Mapping[str, str] | None = None,
+            media_type: MediaType | str | None = None,
+            status_code: int = HTTP_200_OK,
+            *,
+            filename: str | None = None,
+            content_disposition_type: str = 'attachment',
+            chunk_size: int = 64 * ONE_KILOBYTE
+    ) -> None:
+        if chunk_size <= 0:
+            raise ValueError('Chunk size must be a positive number')
+        self.path = os.fspath(path)
+        self.filename = filename
+        self.chunk_size = chunk_size
+        if media_type is None:
+            media_type = mimetypes.guess_type(filename or self.path)[0] or 'text/plain'
+        super().__init__(
+            None,
+            background=background,
+            headers=headers,
+            media_type=media_type,
+            status_code=status_code
+        )
+        self.headers.setdefault('accept-ranges', 'bytes')
+        if filename is not None:
+            self.headers.setdefault('content-disposition', get_content_disposition(content_disposition_type, filename))
+
+    def render(self, content: Any) -> None:
+        return None
+
+    async def __call__(self, scope: Scope, receive: ASGIReceiveCallable, send: ASGISendCallable) -> None:
+        try:
+            stat_result = await self.stat_cache.stat(self.path)
+        except (FileNotFoundError, NotADirectoryError):
+            stat_result = None
+        if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
+            await self._send_not_found(scope, receive, send)
+            return None
+
+        request_headers = {
+            key.decode('latin-1'): value.decode('latin-1')
+            for key, value in scope['headers']
+            if key in CONDITIONAL_HEADERS
+        }
+        is_get = scope['method'] in ('GET', 'HEAD') and self.status_code == HTTP_200_OK
+        if is_get and conditional.is_not_modified(
+                request_headers,
+                self.headers.get('etag', get_etag(stat_result)),
+                self.headers.get('last-modified', conditional.format_http_date(stat_result.st_mtime))
+        ):
+            self._set_validators(stat_result)
+            await conditional.not_modified_response(self.headers)(scope, receive, send)
+            return None
+
+        send_body = scope['method'] != 'HEAD'
+        extensions = scope.get('extensions') or {}
+        file = None
+        if send_body and (PATHSEND not in extensions or (is_get and 'range' in request_headers)):
+            # INFO: The body is read from the opened file, so its headers must not come from an outdated result
+            try:
+                file, file_stat_result = await sync_to_thread(open_file, self.path)
+            except (FileNotFoundError, NotADirectoryError):
+                await self._send_not_found(scope, receive, send)
+                return None
+            if not is_same_file(stat_result, file_stat_result):
+                stat_result = file_stat_result
+                self.stat_cache.set(self.path, stat_result)
+
+        try:
+            await self._send_file(send, extensions, file, stat_result, request_headers, is_get, send_body)
+        finally:
+            if file is not None:
+                # INFO: Closing a regular file does not block, the call can not be cancelled or refused mid-way
+                file.close()
+
+        if self.background is not None:
+            await self.background()
+
+    async def _send_file(
+            self,
+            send: ASGISendCallable,
+            extensions: Mapping[str, Any],
+            file: BinaryIO | None,
+            stat_result: os.stat_result,
+            request_headers: Mapping[str, str],
+            is_get: bool,
+            send_body: bool
+    ) -> None:
+        size = stat_result.st_size
+        self._set_validators(stat_result)
+        ranges = self._get_ranges(request_headers, size) if is_get else None
+
+        if ranges is None:
+            self.headers['content-length'] = str(size)
+            await send({'type': 'http.response.start', 'status': self.status_code, 'headers': self.headers.raw})
+            if not send_body:
+                await send({'type': 'http.response.body', 'body': b'', 'more_body': False})
+            elif file is None:
+                await send({'type': PATHSEND, 'path': os.path.abspath(self.path)})
+            else:
+                await self._send_ranges(send, extensions, file, [(0, size)])
+        elif not ranges:
+            await self._send_range_not_satisfiable(size, send)
+        elif len(ranges) == 1:
+            start, end = ranges[0]
+            self.status_code = HTTP_206_PARTIAL_CONTENT
+            self.headers['content-range'] = f'bytes {start}-{end - 1}/{size}'
+            self.headers['content-length'] = str(end - start)
+            await send({'type': 'http.response.start', 'status': self.status_code, 'headers': self.headers.raw})
+            if file is not None:
+                await self._send_ranges(send, extensions, file, ranges)
+            else:
+                await send({'type': 'http.response.body', 'body': b'', 'more_body': False})
+        else:
+            await self._send_multipart(send, extensions, file, ranges, size)
+
+    def _set_validators(self, stat_result: os.stat_result) -> None:
+        self.headers.setdefault('last-modified', conditional.format_http_date(stat_result.st_mtime))
+        self.headers.setdefault('etag', get_etag(stat_result))
+
+    async def _send_not_found(self, scope: Scope, receive: ASGIReceiveCallable, send: ASGISendCallable) -> None:
+        await PlainTextResponse('Not Found', status_code=HTTP_404_NOT_FOUND)(scope, receive, send)
+
+    def _get_ranges(self, request_headers: Mapping[str, str], size: int) -> list[ByteRange] | None:
+        range_header = request_headers.get('range')
+        if range_header is None:
+            return None
+        if_range = request_headers.get('if-range')
+        if if_range is not None and if_range not in (self.headers.get('etag'), self.headers.get('last-modified')):
+            return None
+        return parse_range_header(range_header, size)
+
+    async def _send_range_not_satisfiable(self, size: int, send: ASGISendCallable) -> None:
+        headers = [(b'content-range', f'bytes */{size}'.encode('latin-1')), (b'content-length', b'0')]
+        await send({'type': 'http.response.start', 'status': HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE, 'headers': headers})
+        await send({'type': 'http.response.body', 'body': b'', 'more_body': False})
+
+    async def _send_multipart(
+            self,
+            send: ASGISendCallable,
+            extensions: Mapping[str, Any],
+            file: BinaryIO | None,
+            ranges: list[ByteRange],
+            size: int
+    ) -> None:
+        boundary = secrets.token_hex(16)
+        content_type = self.headers.get('content-type', 'application/octet-stream')
+        part_headers = [
+            (
+                f'--{boundary}\r\n'
+                f'Content-Type: {content_type}\r\n'
+                f'Content-Range: bytes {start}-{end - 1}/{size}\r\n\r\n'
+            ).encode('latin-1')
+            for start, end in ranges
+        ]
+        closing = f'\r\n--{boundary}--\r\n'.encode('latin-1')
+        content_length = (
+                sum(len(part) for part in part_headers)
+                + sum(end - start for start, end in ranges)
+                + 2 * (len(ranges) - 1)
+                + len(closing)
+        )
+
+        self.status_code = HTTP_206_PARTIAL_CONTENT
+        self.headers['content-type'] = f'multipart/byteranges; boundary={boundary}'
+        self.headers['content-length'] = str(content_length)
+        await send({'type': 'http.response.start', 'status': self.status_code, 'headers': self.headers.raw})
+        if file is None:
+            await send({'type': 'http.response.body', 'body': b'', 'more_body': False})
+            return None
+        await self._send_ranges(send, extensions, file, ranges, part_headers, closing)
+
+    async def _send_ranges(
+            self,
+            send: ASGISendCallable,
+            extensions: Mapping[str, Any],
+            file: BinaryIO,
+            ranges: list[ByteRange],
+            part_headers: list[bytes] | None = None,
+            closing: bytes = b''
+    ) -> None:
+        """ Send the byte ranges, each one after its part headers, and the closing part of the body. """
+        for index, (start, end) in enumerate(ranges):
+            if part_headers is not None:
+                separator = b'\r\n' if index else b''
+                await send({'type': 'http.response.body', 'body': separator + part_headers[index], 'more_body': True})
+            if ZEROCOPYSEND in extensions:
+                await send({
+                    'type': ZEROCOPYSEND,
+                    'file': file,
+                    'offset': start,
+                    'count': end - start,
+                    'more_body': True,
+                })
+            else:
+                await self._send_chunks(send, file, start, end)
+        await send({'type': 'http.response.body', 'body': closing, 'more_body': False})
+
+    async def _send_chunks(self, send: ASGISendCallable, file: BinaryIO, start: int, end: int) -> None:
+        offset = start
+        read = asyncio.ensure_future(sync_to_thread(read_chunk, file, offset, min(self.chunk_size, end - offset)))
+        try:
+            while True:
+                chunk = await read
+                if not chunk:
+                    break
+                offset += len(chunk)
+                if offset < end:
+                    read = asyncio.ensure_future(
+                        sync_to_thread(read_chunk, file, offset, min(self.chunk_size, end - offset))
+                    )
+                await send({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+                if offset >= end:
+                    break
+        finally:
+            if not read.done():
+                read.cancel()
+                # INFO: The file must not be closed while the read-ahead is running in the thread
+                await asyncio.gather(read, return_exceptions=True)
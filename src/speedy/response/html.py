@@ -0,0 +1,6 @@
+from speedy.enums import MediaType
+from speedy.response.base import Response
+
+
+class HTMLResponse(Response[str]):
+    media_type = MediaType.HTML
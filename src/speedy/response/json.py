@@ -0,0 +1,23 @@
+from typing import Any, ClassVar
+
+from speedy.enums import MediaType
+from speedy.response.base import Response
+from speedy.utils.serializers import DEFAULT_JSON_BACKEND, JSONEncoder, get_json_encoder
+
+
+class JSONResponse(Response[Any]):
+    """ Serialize the content into UTF-8 JSON bytes with the encoder selected once per class. """
+
+    media_type = MediaType.JSON
+    backend: ClassVar[str] = DEFAULT_JSON_BACKEND
+    sort_keys: ClassVar[bool] = False
+    non_str_keys: ClassVar[bool] = False
+    encoder: ClassVar[JSONEncoder] = staticmethod(get_json_encoder(DEFAULT_JSON_BACKEND))
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.encoder = staticmethod(get_json_encoder(cls.backend, sort_keys=cls.sort_keys, non_str_keys=cls.non_str_keys))
+
+    def render(self, content: Any) -> bytes:
+        """ Serialize the content into a JSON bytes string. """
+        return self.encoder(content)
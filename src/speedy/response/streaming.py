@@ -0,0 +1,130 @@
+import asyncio
+import itertools
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator, Mapping
+from typing import Any
+
+from speedy import BackgroundTask, BackgroundTasks, MediaType
+from speedy.concurrency import sync_to_thread
+from speedy.constants import ONE_KILOBYTE
+from speedy.datastructures import Headers
+from speedy.response.base import Response
+from speedy.status_code import HTTP_200_OK
+from speedy.types import Scope, ASGIReceiveCallable, ASGISendCallable
+
+Content = str | bytes
+ContentStream = AsyncIterable[Content] | Iterable[Content]
+
+
+def get_batch(iterator: Iterator[Content], batch_size: int) -> list[Content]:
+    """ Pull the next chunks of the synchronous iterator, an empty list is returned once it is exhausted. """
+    return list(itertools.islice(iterator, batch_size))
+
+
+class StreamingResponse(Response[ContentStream]):
+    """ Send the chunks of an iterator as the response body until the client disconnects. """
+
+    def __init__(
+            self,
+            content: ContentStream,
+            background: BackgroundTask | BackgroundTasks | None = None,
+            headers: Headers | Mapping[str, str] | None = None,
+            media_type: MediaType | str | None = None,
+            status_code: int = HTTP_200_OK,
+            encoding: str = 'utf-8',
+            *,
+            buffer_size: int = 64 * ONE_KILOBYTE,
+            batch_size: int = 64
+    ) -> None:
+        if buffer_size <= 0:
+            raise ValueError('Buffer size must be a positive number')
+        if batch_size <= 0:
+            raise ValueError('Batch size must be a positive number')
+        self.body_iterator = content
+        self.buffer_size = buffer_size
+        self.batch_size = batch_size
+        super().__init__(
+            None,
+            background=background,
+            headers=headers,
+            media_type=media_type,
+            status_code=status_code,
+            encoding=encoding
+        )
+
+    def render(self, content: Any) -> None:
+        return None
+
+    async def __call__(self, scope: Scope, receive: ASGIReceiveCallable, send: ASGISendCallable) -> None:
+        streamer = asyncio.create_task(self._stream(send))
+        listener = asyncio.create_task(self._listen_for_disconnect(receive))
+        try:
+            await asyncio.wait((streamer, listener), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in (streamer, listener):
+                task.cancel()
+            await asyncio.gather(streamer, listener, return_exceptions=True)
+
+        if streamer.cancelled():
+            return None
+        streamer.result()
+        if self.background is not None:
+            await self.background()
+
+    async def _listen_for_disconnect(self, receive: ASGIReceiveCallable) -> None:
+        while True:
+            message = await receive()
+            if message['type'] == 'http.disconnect':
+                return None
+
+    async def _stream(self, send: ASGISendCallable) -> None:
+        await send({'type': 'http.response.start', 'status': self.status_code, 'headers': self.headers.raw})
+
+        buffer: list[bytes] = []
+        size = 0
+        chunks = self._iter_chunks()
+        try:
+            async for chunk in chunks:
+                if not isinstance(chunk, bytes):
+                    chunk = chunk.encode(self.encoding)
+                if not buffer and len(chunk) >= self.buffer_size:
+                    await send({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+                    continue
+                buffer.append(chunk)
+                size += len(chunk)
+                if size >= self.buffer_size:
+                    await send({'type': 'http.response.body', 'body': b''.join(buffer), 'more_body': True})
+                    buffer.clear()
+                    size = 0
+        finally:
+            await chunks.aclose()
+
+        await send({'type': 'http.response.body', 'body': b''.join(buffer), 'more_body': False})
+
+    async def _iter_chunks(self) -> AsyncIterator[Content]:
+        if isinstance(self.body_iterator, AsyncIterable):
+            iterator = aiter(self.body_iterator)
+            try:
+                async for chunk in iterator:
+                    yield chunk
+            finally:
+                aclose = getattr(iterator, 'aclose', None)
+                if aclose is not None:
+                    await aclose()
+            return
+
+        iterator = iter(self.body_iterator)
+        is_pulling = False
+        try:
+            while True:
+                is_pulling = True
+                batch = await sync_to_thread(get_batch, iterator, self.batch_size)
+                is_pulling = False
+                if not batch:
+                    break
+                for chunk in batch:
+                    yield chunk
+        finally:
+            close = getattr(iterator, 'close', None)
+            # INFO: A generator still running in the thread can not be closed
+            if close is not None and not is_pulling:
+                close()
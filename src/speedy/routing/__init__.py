@@ -1,7 +1,15 @@
 from .base import BaseRoute
+from .host import Host
+from .mount import Mount
 from .route import Route
+from .router import Router
+from .snapshot import RouteSnapshot
 
 __all__ = (
     'BaseRoute',
-    'Route'
+    'Host',
+    'Mount',
+    'Route',
+    'Router',
+    'RouteSnapshot'
 )
@@ -1,10 +1,12 @@
+import contextvars
 import re
 from abc import ABC
+from collections.abc import Iterable, Mapping, Sequence
 from dataclasses import dataclass
 from typing import Any, Self, Pattern
 
 from speedy import Match
-from speedy.connection.websockets import WebSocketClose
+from speedy.connection.websocket import WebSocketClose
 from speedy.exceptions.base import ConvertorTypeException
 from speedy.protocols.route import AbstractRoute
 from speedy.response import PlainTextResponse
@@ -15,13 +17,14 @@ from speedy.types.asgi_types import (
     ASGISendCallable
 )
 from speedy.utils.convertors import CONVERTOR_TYPES, Convertor
+from speedy.utils.helpers import strip_port
 
 
 class BaseRoute(AbstractRoute, ABC):
     async def __call__(self, scope: Scope, receive: ASGIReceiveCallable, send: ASGISendCallable) -> None:
         match, child_scope = self.matches(scope)
 
-        match Match:
+        match match:
             case Match.NONE:
                 if scope['type'] == 'http':
                     await self._send_response_not_found(scope, receive, send)
@@ -48,32 +51,87 @@ class BaseRoute(AbstractRoute, ABC):
         await websocket_close(scope, receive, send)
 
 
+class PathFormatter:
+    """ Build a path from the literal parts of a template and the converted parameters. """
+
+    __slots__ = ('prefix', 'params', 'param_names')
+
+    def __init__(self, parts: Sequence[str], params: Iterable[tuple[str, Convertor[Any]]]) -> None:
+        self.prefix = parts[0]
+        self.params = tuple(
+            (name, convertor, part)
+            for (name, convertor), part in zip(params, parts[1:])
+        )
+        self.param_names = frozenset(name for name, _, _ in self.params)
+
+    def __call__(self, path_params: Mapping[str, Any]) -> str:
+        if not self.params:
+            return self.prefix
+        chunks = [self.prefix]
+        for name, convertor, part in self.params:
+            chunks.append(convertor.to_string(path_params[name]))
+            chunks.append(part)
+        return ''.join(chunks)
+
+    def accepts(self, path_params: Mapping[str, Any]) -> bool:
+        """ Check that the path params are exactly the template parameters. """
+        return path_params.keys() == self.param_names
+
+
+Segments = tuple[tuple[str, tuple[str, ...]], ...]
+
+
 @dataclass
 class Path:
-    path_regex: Pattern[str]
+    regex: str
     path_format: str
     param_convertors: dict[str, Any]
+    path_parts: tuple[str, ...]
+    path_formatter: PathFormatter | None = None
+    segments: Segments | None = None
 
 
 PARAM_REGEX = re.compile("{([a-zA-Z_][a-zA-Z0-9_]*)(:[a-zA-Z_][a-zA-Z0-9_]*)?}")
+PRELOADED_PATHS: contextvars.ContextVar[dict[str, Path] | None] = contextvars.ContextVar(
+    'speedy.preloaded_paths', default=None
+)
 
 
 class CompilePath:
+    """ Compile a path or host template, the regex is only compiled on first use. """
+
+    _template: str
     _path: Path
+    _path_regex: Pattern[str] | None
 
     def __new__(cls, path: str) -> Self:
         instance = super().__new__(cls)
-        path_regex, path_format, param_convertors = instance._compile_path(path)
+        instance._template = path
+        instance._path_regex = None
+        preloaded = PRELOADED_PATHS.get()
+        compiled_path = preloaded.get(path) if preloaded is not None else None
+        if compiled_path is not None:
+            instance._path = compiled_path
+            return instance
+
+        regex, path_format, param_convertors, path_parts = instance._compile_path(path)
         instance._path = Path(
-            path_regex=path_regex,
+            regex=regex,
             path_format=path_format,
-            param_convertors=param_convertors
+            param_convertors=param_convertors,
+            path_parts=path_parts
         )
         return instance
 
+    @property
+    def path(self) -> Path:
+        return self._path
+
     @property
     def path_regex(self) -> Pattern[str]:
-        return self._path.path_regex
+        if self._path_regex is None:
+            self._path_regex = re.compile(self._path.regex)
+        return self._path_regex
 
     @property
     def path_format(self) -> str:
@@ -83,11 +141,30 @@ class CompilePath:
     def param_convertors(self) -> dict[str, Any]:
         return self._path.param_convertors
 
-    def _compile_path(self, path: str) -> tuple[Pattern[str], str, dict[str, Convertor[Any]]]:
+    @property
+    def path_formatter(self) -> PathFormatter:
+        """ The formatter of the path template, built on first use. """
+        if self._path.path_formatter is None:
+            self._path.path_formatter = PathFormatter(self._path.path_parts, self._path.param_convertors.items())
+        return self._path.path_formatter
+
+    @property
+    def segments(self) -> Segments:
+        """ The segments of the path template with the names of their parameters, split on first use. """
+        if self._path.segments is None:
+            self._path.segments = tuple(
+                (segment, tuple(match.group(1) for match in PARAM_REGEX.finditer(segment)) if '{' in segment else ())
+                for segment in self._template[1:].split('/')
+            )
+        return self._path.segments
+
+    def _compile_path(self, path: str) -> tuple[str, str, dict[str, Convertor[Any]], tuple[str, ...]]:
         is_host = not path.startswith('/')
 
-        path_regex = '^'
+        # INFO: The host names are case-insensitive, the `host` header is lowercased by `get_host`
+        path_regex = '(?i)^' if is_host else '^'
         path_format = ''
+        path_parts = []
         duplicated_params = set()
 
         index = 0
@@ -101,7 +178,8 @@ class CompilePath:
             path_regex += f'(?P<{param_name}>{convertor.regex})'
 
             path_format += path[index: match.start()]
-            path_format += f'{param_name}'
+            path_format += f'{{{param_name}}}'
+            path_parts.append(path[index: match.start()])
 
             self._add_duplicated_params(duplicated_params, param_convertors, param_name)
             param_convertors[param_name] = convertor
@@ -111,12 +189,12 @@ class CompilePath:
 
         path_regex = self._correct_path_regex(index, is_host, path, path_regex)
         path_format += path[index:]
-        return re.compile(path_regex), path_format, param_convertors
+        path_parts.append(path[index:])
+        return path_regex, path_format, param_convertors, tuple(path_parts)
 
     def _correct_path_regex(self, index: int, is_host: bool, path: str, path_regex: str) -> str:
         if is_host:
-            hostname = path[index:].split(':')[0]
-            path_regex += re.escape(hostname) + '$'
+            path_regex += re.escape(strip_port(path[index:])) + '$'
         else:
             path_regex += re.escape(path[index:]) + '$'
         return path_regex
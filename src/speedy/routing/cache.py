@@ -0,0 +1,71 @@
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import NamedTuple, Any
+
+from speedy.enums import Match
+from speedy.routing.base import BaseRoute
+from speedy.types import Scope
+from speedy.utils.helpers import get_host, get_route_path
+
+CacheKey = tuple[str | None, str, str, str]
+
+
+class CacheInfo(NamedTuple):
+    """ Statistics of the route cache. """
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class RouteCache:
+    """ LRU cache of the resolved routes keyed by method, host, root path and route path. """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        if maxsize <= 0:
+            raise ValueError('Cache size must be a positive number')
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[CacheKey, tuple[Match, BaseRoute, Scope]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_key(self, scope: Scope) -> CacheKey:
+        """ Get the cache key of the scope. """
+        return scope.get('method'), get_host(scope), scope.get('root_path', ''), get_route_path(scope)
+
+    def get(self, key: CacheKey) -> tuple[Match, BaseRoute, Scope] | None:
+        """ Get the resolved route, `None` is returned on a miss. """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def set(self, key: CacheKey, match: Match, route: BaseRoute, child_scope: Scope) -> tuple[Match, BaseRoute, Scope]:
+        """ Store the resolved route, evicting the least recently used one if the cache is full. """
+        entry = match, route, self._freeze_child_scope(child_scope)
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return entry
+
+    def clear(self) -> None:
+        """ Drop all the entries, the statistics are kept. """
+        self._entries.clear()
+
+    def cache_info(self) -> CacheInfo:
+        """ Get the cache statistics. """
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+    def _freeze_child_scope(self, child_scope: Scope) -> Scope:
+        path_params: dict[str, Any] | None = child_scope.get('path_params')
+        if path_params is None:
+            return child_scope
+        return {**child_scope, 'path_params': MappingProxyType(path_params)}
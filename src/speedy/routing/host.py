@@ -0,0 +1,67 @@
+from typing import Any
+
+from speedy.enums import Match, ScopeType
+from speedy.exceptions.route import PathException, NoMatchFound
+from speedy.routing.base import BaseRoute, CompilePath
+from speedy.types import Scope, ASGIReceiveCallable, ASGISendCallable
+from speedy.types.application import ASGIAppType
+from speedy.utils.helpers import get_host
+
+
+class Host(BaseRoute):
+    """ Dispatch to the application by the `host` header, e.g. `{tenant}.example.com`. """
+
+    def __init__(self, host: str, app: ASGIAppType, *, name: str | None = None) -> None:
+        if host.startswith('/'):
+            raise PathException('Host must not start with "/"')
+        self.host = host
+        self.app = app
+        self.name = name
+        self.compiled_host = CompilePath(host)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(host={self.host!r}, name={self.name!r}, app={self.app!r})'
+
+    def matches(self, scope: Scope) -> tuple[Match, Scope]:
+        if scope['type'] not in (ScopeType.HTTP, ScopeType.WEBSOCKET):
+            return Match.NONE, {}
+
+        match = self.compiled_host.path_regex.match(get_host(scope))
+        if match is None:
+            return Match.NONE, {}
+
+        param_convertors = self.compiled_host.param_convertors
+        path_params = {
+            key: param_convertors[key].convert(value)
+            for key, value in match.groupdict().items()
+        }
+        return Match.FULL, self.get_child_scope(scope, path_params)
+
+    def match_scope(self, scope: Scope) -> Match:
+        """ Match the scope type, the host is expected to be matched already. """
+        if scope['type'] not in (ScopeType.HTTP, ScopeType.WEBSOCKET):
+            return Match.NONE
+        return Match.FULL
+
+    def get_child_scope(self, scope: Scope, path_params: dict[str, Any]) -> Scope:
+        """ Get the scope values to be set for the matched host. """
+        return {
+            'endpoint': self.app,
+            'path_params': {**scope.get('path_params', {}), **path_params}
+        }
+
+    async def handle(self, scope: Scope, receive: ASGIReceiveCallable, send: ASGISendCallable) -> None:
+        await self.app(scope, receive, send)
+
+    def path_for(self, name: str, /, **path_params: Any) -> str:
+        if self.name is not None:
+            if not name.startswith(f'{self.name}:'):
+                raise NoMatchFound(f'No route exists for name "{name}" and params {sorted(path_params)}')
+            name = name[len(self.name) + 1:]
+
+        path_for = getattr(self.app, 'path_for', None)
+        if path_for is None:
+            raise NoMatchFound(f'No route exists for name "{name}" and params {sorted(path_params)}')
+
+        host_params = self.compiled_host.path_formatter.param_names
+        return path_for(name, **{key: value for key, value in path_params.items() if key not in host_params})
@@ -0,0 +1,122 @@
+from collections.abc import Sequence
+from typing import Any
+
+from speedy.enums import Match, ScopeType
+from speedy.exceptions.route import PathException, NoMatchFound
+from speedy.routing.base import BaseRoute, CompilePath, PARAM_REGEX
+from speedy.routing.tree import SEPARATOR
+from speedy.types import Scope, ASGIReceiveCallable, ASGISendCallable
+from speedy.types.application import ASGIAppType
+from speedy.utils.helpers import get_route_path
+
+
+class Mount(BaseRoute):
+    """ Dispatch the paths under the prefix to a sub application or router. """
+
+    def __init__(
+            self,
+            path: str,
+            app: ASGIAppType | None = None,
+            *,
+            routes: Sequence[BaseRoute] | None = None,
+            name: str | None = None
+    ) -> None:
+        if path != '' and not path.startswith(SEPARATOR):
+            raise PathException('Routed paths must start with "/"')
+        if path.endswith(SEPARATOR):
+            raise PathException('Mount paths must not end with "/"')
+        if (app is None) == (routes is None):
+            raise ValueError('Either "app" or "routes" must be specified')
+
+        if app is None:
+            # INFO: Bypassing cyclical imports
+            from speedy.routing.router import Router
+
+            app = Router(routes)
+
+        self.path = path
+        self.app = app
+        self.name = name
+        self.is_static = PARAM_REGEX.search(path) is None
+        self.compiled_path = CompilePath(path + '/{path:path}')
+        self.path_format = self.compiled_path.path_format.removesuffix('/{path}')
+        self.path_formatter = CompilePath(path or SEPARATOR).path_formatter
+        self._root_paths: dict[str, str] = {}
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(path={self.path!r}, name={self.name!r}, app={self.app!r})'
+
+    @property
+    def routes(self) -> list[BaseRoute]:
+        return getattr(self.app, 'routes', [])
+
+    def matches(self, scope: Scope) -> tuple[Match, Scope]:
+        if scope['type'] not in (ScopeType.HTTP, ScopeType.WEBSOCKET):
+            return Match.NONE, {}
+
+        route_path = get_route_path(scope)
+        if self.is_static:
+            if route_path != self.path and not route_path.startswith(self.path + SEPARATOR):
+                return Match.NONE, {}
+            return Match.FULL, self.get_child_scope(scope)
+
+        match = self.compiled_path.path_regex.match(route_path)
+        if match is None:
+            return Match.NONE, {}
+
+        path_params = match.groupdict()
+        remaining_path = SEPARATOR + path_params.pop('path')
+        param_convertors = self.compiled_path.param_convertors
+        path_params = {key: param_convertors[key].convert(value) for key, value in path_params.items()}
+        matched_path = route_path[:len(route_path) - len(remaining_path)]
+        return Match.FULL, self.get_child_scope(scope, path_params, matched_path)
+
+    def match_scope(self, scope: Scope) -> Match:
+        """ Match the scope type, the prefix is expected to be matched already. """
+        if scope['type'] not in (ScopeType.HTTP, ScopeType.WEBSOCKET):
+            return Match.NONE
+        return Match.FULL
+
+    def get_child_scope(
+            self,
+            scope: Scope,
+            path_params: dict[str, Any] | None = None,
+            matched_path: str | None = None
+    ) -> Scope:
+        """ Get the scope values to be set for the sub application. """
+        root_path = scope.get('root_path', '')
+        if matched_path is None:
+            child_root_path = self._root_paths.get(root_path)
+            if child_root_path is None:
+                child_root_path = self._root_paths[root_path] = root_path + self.path
+        else:
+            child_root_path = root_path + matched_path
+
+        child_scope = {
+            'endpoint': self.app,
+            'root_path': child_root_path,
+            'app_root_path': scope.get('app_root_path', root_path),
+        }
+        if path_params:
+            child_scope['path_params'] = {**scope.get('path_params', {}), **path_params}
+        return child_scope
+
+    async def handle(self, scope: Scope, receive: ASGIReceiveCallable, send: ASGISendCallable) -> None:
+        await self.app(scope, receive, send)
+
+    def path_for(self, name: str, /, **path_params: Any) -> str:
+        if self.name is not None:
+            if not name.startswith(f'{self.name}:'):
+                raise NoMatchFound(f'No route exists for name "{name}" and params {sorted(path_params)}')
+            name = name[len(self.name) + 1:]
+
+        path_for = getattr(self.app, 'path_for', None)
+        if path_for is None:
+            raise NoMatchFound(f'No route exists for name "{name}" and params {sorted(path_params)}')
+
+        mount_params = {key: value for key, value in path_params.items() if key in self.path_formatter.param_names}
+        if not self.path_formatter.accepts(mount_params):
+            raise NoMatchFound(f'No route exists for name "{name}" and params {sorted(path_params)}')
+
+        path = path_for(name, **{key: value for key, value in path_params.items() if key not in mount_params})
+        return self.path_formatter(mount_params).rstrip(SEPARATOR) + path
@@ -0,0 +1,134 @@
+import inspect
+import time
+from collections.abc import Callable, Collection
+from typing import Any
+
+from speedy.connection.request import Request
+from speedy.enums import Match, ScopeType
+from speedy.exceptions.route import PathException, NoMatchFound
+from speedy.middleware.coalesce import CoalescingMiddleware
+from speedy.response import PlainTextResponse
+from speedy.routing.base import BaseRoute, CompilePath
+from speedy.status_code import HTTP_405_METHOD_NOT_ALLOWED
+from speedy.timing import TIMING, HANDLER
+from speedy.types import Scope, ASGIReceiveCallable, ASGISendCallable
+from speedy.types.application import ASGIAppType
+from speedy.utils.helpers import get_route_path, get_endpoint_name
+from speedy.utils.sync import ensure_async_callable
+
+
+def request_response(func: Callable[[Request], Any]) -> ASGIAppType:
+    """ Wrap an endpoint function taking a request and returning a response into an ASGI application. """
+    func = ensure_async_callable(func, before_deadline=True)
+
+    async def app(scope: Scope, receive: ASGIReceiveCallable, send: ASGISendCallable) -> None:
+        request = Request(scope, receive, send)
+        timing = TIMING.get()
+        if timing is None:
+            response = await func(request)
+        else:
+            start = time.perf_counter()
+            response = await func(request)
+            timing.add(HANDLER, start)
+        await response(scope, receive, send)
+
+    return app
+
+
+def endpoint_app(endpoint: type) -> ASGIAppType:
+    """ Wrap an endpoint class into an ASGI application. """
+
+    async def app(scope: Scope, receive: ASGIReceiveCallable, send: ASGISendCallable) -> None:
+        await endpoint(scope, receive, send).dispatch()
+
+    return app
+
+
+class Route(BaseRoute):
+    """ Dispatch the path to the endpoint. """
+
+    def __init__(
+            self,
+            path: str,
+            endpoint: Callable[..., Any],
+            *,
+            methods: Collection[str] | None = None,
+            name: str | None = None,
+            coalesce: bool | Collection[str] = False
+    ) -> None:
+        if not path.startswith('/'):
+            raise PathException('Routed paths must start with "/"')
+        self.path = path
+        self.endpoint = endpoint
+        self.name = get_endpoint_name(endpoint) if name is None else name
+        self.compiled_path = CompilePath(path)
+
+        if inspect.isclass(endpoint):
+            self.app = endpoint_app(endpoint)
+            self.methods = self._get_methods(methods)
+        else:
+            self.app = request_response(endpoint)
+            self.methods = self._get_methods(methods or ('GET',))
+
+        # INFO: `coalesce` is `True` or the names of the request headers which are part of the coalescing key
+        if coalesce:
+            self.app = CoalescingMiddleware(self.app, headers=() if coalesce is True else coalesce)
+
+    def __repr__(self) -> str:
+        methods = sorted(self.methods or [])
+        return f'{type(self).__name__}(path={self.path!r}, name={self.name!r}, methods={methods!r})'
+
+    def matches(self, scope: Scope) -> tuple[Match, Scope]:
+        if scope['type'] != ScopeType.HTTP:
+            return Match.NONE, {}
+
+        match = self.compiled_path.path_regex.match(get_route_path(scope))
+        if match is None:
+            return Match.NONE, {}
+
+        param_convertors = self.compiled_path.param_convertors
+        path_params = {
+            key: param_convertors[key].convert(value)
+            for key, value in match.groupdict().items()
+        }
+        return self.match_scope(scope), self.get_child_scope(scope, path_params)
+
+    def match_scope(self, scope: Scope) -> Match:
+        """ Match the scope type and method, the path is expected to be matched already. """
+        if scope['type'] != ScopeType.HTTP:
+            return Match.NONE
+        if self.methods is None or scope['method'] in self.methods:
+            return Match.FULL
+        return Match.PARTIAL
+
+    def get_child_scope(self, scope: Scope, path_params: dict[str, Any]) -> Scope:
+        """ Get the scope values to be set for the matched route. """
+        return {
+            'endpoint': self.endpoint,
+            'path_params': {**scope.get('path_params', {}), **path_params}
+        }
+
+    async def handle(self, scope: Scope, receive: ASGIReceiveCallable, send: ASGISendCallable) -> None:
+        if self.methods is not None and scope['method'] not in self.methods:
+            response = PlainTextResponse(
+                'Method Not Allowed',
+                status_code=HTTP_405_METHOD_NOT_ALLOWED,
+                headers={'Allow': ', '.join(sorted(self.methods))}
+            )
+            await response(scope, receive, send)
+            return None
+        await self.app(scope, receive, send)
+
+    def path_for(self, name: str, /, **path_params: Any) -> str:
+        path_formatter = self.compiled_path.path_formatter
+        if name != self.name or not path_formatter.accepts(path_params):
+            raise NoMatchFound(f'No route exists for name "{name}" and params {sorted(path_params)}')
+        return path_formatter(path_params)
+
+    def _get_methods(self, methods: Collection[str] | None) -> set[str] | None:
+        if methods is None:
+            return None
+        _methods = {method.upper() for method in methods}
+        if 'GET' in _methods:
+            _methods.add('HEAD')
+        return _methods
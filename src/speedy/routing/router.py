@@ -0,0 +1,297 @@
+import time
+from collections.abc import Callable, Collection, Iterator, Sequence
+from typing import Any
+
+from speedy.connection.websocket import WebSocketClose
+from speedy.datastructures import URLPath
+from speedy.enums import Match, ScopeType
+from speedy.exceptions.route import NoMatchFound
+from speedy.response import PlainTextResponse
+from speedy.routing.base import BaseRoute
+from speedy.routing.cache import RouteCache
+from speedy.routing.host import Host
+from speedy.routing.mount import Mount
+from speedy.routing.route import Route
+from speedy.routing.tree import RouteTree, SEPARATOR
+from speedy.status_code import HTTP_404_NOT_FOUND, WS_1000_NORMAL_CLOSURE
+from speedy.timing import TIMING, ROUTE
+from speedy.types import Scope, ASGIReceiveCallable, ASGISendCallable
+from speedy.utils.helpers import get_route_path, get_host, strip_port
+
+
+class Router:
+    """
+    Dispatch requests to the registered routes.
+
+    The routes are resolved by group, not one by one in registration order:
+
+    - Path routes: static paths are resolved with a single dict lookup, the
+      parameterised paths by the route tree, where a literal segment wins
+      over a parameter, e.g. `/users/me` over `/users/{id}` whatever their
+      order, so the lookup cost depends on the path depth rather than the
+      number of routes.
+    - Mounts: the static prefixes are looked up in a prefix table at every
+      segment boundary of the path and the longest prefix wins, e.g.
+      `/api/v1` over `/api`, then the parameterised mounts are tried and
+      the root `''` mount last.
+    - Hosts: the exact hosts are resolved with a dict lookup before the host
+      patterns, e.g. `api.example.com` over `{sub}.example.com`.
+    - Other routes are tried one by one.
+
+    Registration order only decides between the groups: the group of the
+    earliest registered route that matches wins, a group registered after
+    the match found is not searched at all.
+
+    With `cache_size` the resolved routes are kept in an LRU cache keyed
+    by method, host, root path and route path, the cache is cleared when a
+    route is added. Only the matched routes are cached, so the routes must
+    resolve on the method, host and path alone.
+    """
+
+    def __init__(self, routes: Sequence[BaseRoute] | None = None, *, cache_size: int | None = None) -> None:
+        self.routes: list[BaseRoute] = []
+        self.cache = RouteCache(cache_size) if cache_size is not None else None
+        self._named_routes: dict[str, list[Route]] = {}
+        self._static_routes: dict[str, list[Route]] = {}
+        self._tree = RouteTree()
+        self._mounts: dict[str, list[Mount]] = {}
+        self._mount_patterns: list[Mount] = []
+        self._exact_hosts: dict[str, list[Host]] = {}
+        self._host_patterns: list[Host] = []
+        self._other_routes: list[BaseRoute] = []
+        self._nested_routes: list[BaseRoute] = []
+        self._indexes: dict[int, int] = {}
+        self._mounts_start: int | None = None
+        self._hosts_start: int | None = None
+        self._others_start: int | None = None
+
+        for route in routes or ():
+            self.add(route)
+
+    async def __call__(self, scope: Scope, receive: ASGIReceiveCallable, send: ASGISendCallable) -> None:
+        if scope['type'] == ScopeType.LIFESPAN:
+            await self.lifespan(scope, receive, send)
+            return None
+
+        timing = TIMING.get()
+        if timing is None:
+            match, route, child_scope = self.match(scope)
+        else:
+            start = time.perf_counter()
+            match, route, child_scope = self.match(scope)
+            timing.add(ROUTE, start)
+            if isinstance(route, Route):
+                timing.route = (timing.route or '') + route.compiled_path.path_format
+            elif isinstance(route, Mount):
+                timing.route = (timing.route or '') + route.path_format
+
+        if match is Match.NONE:
+            await self.not_found(scope, receive, send)
+            return None
+
+        scope.update(child_scope)
+        await route.handle(scope, receive, send)
+
+    def add(self, route: BaseRoute) -> None:
+        """ Register a route. """
+        index = len(self.routes)
+        self._indexes[id(route)] = index
+        if isinstance(route, Route):
+            self._named_routes.setdefault(route.name, []).append(route)
+            if not route.compiled_path.param_convertors:
+                self._static_routes.setdefault(route.path, []).append(route)
+            else:
+                self._tree.insert(route)
+        elif isinstance(route, Mount):
+            if self._mounts_start is None:
+                self._mounts_start = index
+            if route.is_static:
+                self._mounts.setdefault(route.path, []).append(route)
+            else:
+                self._mount_patterns.append(route)
+        elif isinstance(route, Host):
+            if self._hosts_start is None:
+                self._hosts_start = index
+            if not route.compiled_host.param_convertors:
+                self._exact_hosts.setdefault(strip_port(route.host), []).append(route)
+            else:
+                self._host_patterns.append(route)
+        else:
+            if self._others_start is None:
+                self._others_start = index
+            self._other_routes.append(route)
+
+        if not isinstance(route, Route):
+            self._nested_routes.append(route)
+        self.routes.append(route)
+
+        if self.cache is not None:
+            self.cache.clear()
+
+    def add_route(
+            self,
+            path: str,
+            endpoint: Callable[..., Any],
+            *,
+            methods: Collection[str] | None = None,
+            name: str | None = None,
+            coalesce: bool | Collection[str] = False
+    ) -> None:
+        """ Register an endpoint for the path. """
+        self.add(Route(path, endpoint, methods=methods, name=name, coalesce=coalesce))
+
+    def route(
+            self,
+            path: str,
+            *,
+            methods: Collection[str] | None = None,
+            name: str | None = None,
+            coalesce: bool | Collection[str] = False
+    ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        """ Register the decorated endpoint for the path. """
+
+        def decorator(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+            self.add_route(path, endpoint, methods=methods, name=name, coalesce=coalesce)
+            return endpoint
+
+        return decorator
+
+    def match(self, scope: Scope) -> tuple[Match, BaseRoute | None, Scope]:
+        """
+        Find the route for the scope.
+
+        The first fully matched route is returned, otherwise the first route
+        matched by path only, e.g. with a not allowed method.
+        """
+        if self.cache is None:
+            return self._match(scope)
+
+        key = self.cache.get_key(scope)
+        entry = self.cache.get(key)
+        if entry is not None:
+            return entry
+
+        match, route, child_scope = self._match(scope)
+        if match is Match.NONE:
+            return match, route, child_scope
+        return self.cache.set(key, match, route, child_scope)
+
+    def path_for(self, name: str, /, **path_params: Any) -> str:
+        """ Build the path of the named route. """
+        for route in self._named_routes.get(name, ()):
+            path_formatter = route.compiled_path.path_formatter
+            if path_formatter.accepts(path_params):
+                return path_formatter(path_params)
+
+        for route in self._nested_routes:
+            try:
+                return route.path_for(name, **path_params)
+            except NoMatchFound:
+                pass
+        raise NoMatchFound(f'No route exists for name "{name}" and params {sorted(path_params)}')
+
+    def url_path_for(self, name: str, /, **path_params: Any) -> URLPath:
+        """ Build the URL path of the named route. """
+        return URLPath(self.path_for(name, **path_params), base='')
+
+    async def lifespan(self, scope: Scope, receive: ASGIReceiveCallable, send: ASGISendCallable) -> None:
+        """ Complete the startup and the shutdown of the lifespan protocol. """
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await send({'type': 'lifespan.shutdown.complete'})
+                return None
+
+    async def not_found(self, scope: Scope, receive: ASGIReceiveCallable, send: ASGISendCallable) -> None:
+        """ Respond to the scope which has no route. """
+        if scope['type'] == ScopeType.WEBSOCKET:
+            websocket_close = WebSocketClose(WS_1000_NORMAL_CLOSURE)
+            await websocket_close(scope, receive, send)
+            return None
+        response = PlainTextResponse('Not Found', status_code=HTTP_404_NOT_FOUND)
+        await response(scope, receive, send)
+
+    def _match(self, scope: Scope) -> tuple[Match, BaseRoute | None, Scope]:
+        route_path = get_route_path(scope)
+        full: tuple[BaseRoute, Scope] | None = None
+        partial: tuple[BaseRoute, Scope] | None = None
+
+        for route, path_params in self._iter_path_routes(route_path):
+            match = route.match_scope(scope)
+            if match is Match.FULL:
+                full = route, route.get_child_scope(scope, path_params)
+                break
+            if match is Match.PARTIAL and partial is None:
+                partial = route, route.get_child_scope(scope, path_params)
+
+        if self._is_searched(self._mounts_start, full):
+            full = self._get_earliest(full, self._match_mount(scope, route_path))
+        if self._is_searched(self._hosts_start, full):
+            full = self._get_earliest(full, self._match_host(scope))
+        if self._is_searched(self._others_start, full):
+            for route in self._other_routes:
+                match, child_scope = route.matches(scope)
+                if match is Match.FULL:
+                    full = self._get_earliest(full, (route, child_scope))
+                    break
+                if match is Match.PARTIAL:
+                    partial = self._get_earliest(partial, (route, child_scope))
+
+        if full is not None:
+            return Match.FULL, *full
+        if partial is not None:
+            return Match.PARTIAL, *partial
+        return Match.NONE, None, {}
+
+    def _iter_path_routes(self, route_path: str) -> Iterator[tuple[Route, dict[str, Any]]]:
+        for route in self._static_routes.get(route_path, ()):
+            yield route, {}
+        yield from self._tree.lookup(route_path)
+
+    def _match_mount(self, scope: Scope, route_path: str) -> tuple[BaseRoute, Scope] | None:
+        if self._mounts:
+            index = len(route_path)
+            while index > 0:
+                for route in self._mounts.get(route_path[:index], ()):
+                    if route.match_scope(scope) is Match.FULL:
+                        return route, route.get_child_scope(scope)
+                index = route_path.rfind(SEPARATOR, 0, index)
+
+        for route in self._mount_patterns:
+            match, child_scope = route.matches(scope)
+            if match is Match.FULL:
+                return route, child_scope
+
+        for route in self._mounts.get('', ()):
+            if route.match_scope(scope) is Match.FULL:
+                return route, route.get_child_scope(scope)
+        return None
+
+    def _match_host(self, scope: Scope) -> tuple[BaseRoute, Scope] | None:
+        for route in self._exact_hosts.get(get_host(scope), ()):
+            if route.match_scope(scope) is Match.FULL:
+                return route, route.get_child_scope(scope, {})
+
+        for route in self._host_patterns:
+            match, child_scope = route.matches(scope)
+            if match is Match.FULL:
+                return route, child_scope
+        return None
+
+    def _is_searched(self, group_start: int | None, found: tuple[BaseRoute, Scope] | None) -> bool:
+        """ Check that a group of routes may hold a match registered before the one found. """
+        return group_start is not None and (found is None or group_start < self._indexes[id(found[0])])
+
+    def _get_earliest(
+            self,
+            found: tuple[BaseRoute, Scope] | None,
+            candidate: tuple[BaseRoute, Scope] | None
+    ) -> tuple[BaseRoute, Scope] | None:
+        """ Get the match of the route registered first. """
+        if found is None:
+            return candidate
+        if candidate is None or self._indexes[id(found[0])] < self._indexes[id(candidate[0])]:
+            return found
+        return candidate
@@ -0,0 +1,167 @@
+import contextlib
+import hashlib
+import json
+import os
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path as FilePath
+from typing import Any
+
+from speedy.routing.base import BaseRoute, CompilePath, Path, PRELOADED_PATHS
+from speedy.routing.host import Host
+from speedy.routing.mount import Mount
+from speedy.routing.route import Route
+from speedy.routing.router import Router
+from speedy.routing.tree import SEPARATOR
+from speedy.utils.convertors import CONVERTOR_TYPES
+
+SNAPSHOT_VERSION = 4
+
+
+def get_convertors_fingerprint() -> str:
+    """ Get the fingerprint of the registered path convertors. """
+    convertors = sorted(
+        (name, type(convertor).__qualname__, convertor.regex)
+        for name, convertor in CONVERTOR_TYPES.items()
+    )
+    return hashlib.sha256(json.dumps(convertors).encode()).hexdigest()
+
+
+def get_definitions_hash(routes: Iterable[BaseRoute]) -> str:
+    """ Get the hash of the route definitions, including the nested routes. """
+    definitions = json.dumps(list(_get_definitions(routes)), sort_keys=True)
+    return hashlib.sha256(definitions.encode()).hexdigest()
+
+
+def _get_definitions(routes: Iterable[BaseRoute]) -> Iterator[list[Any]]:
+    for route in routes:
+        if isinstance(route, Route):
+            yield ['route', route.path, route.name, sorted(route.methods or ())]
+        elif isinstance(route, Mount):
+            yield ['mount', route.path, route.name, list(_get_definitions(route.routes))]
+        elif isinstance(route, Host):
+            yield ['host', route.host, route.name, list(_get_definitions(getattr(route.app, 'routes', ())))]
+        else:
+            yield [type(route).__qualname__, repr(route)]
+
+
+def _get_compiled_paths(routes: Iterable[BaseRoute]) -> Iterator[tuple[str, CompilePath]]:
+    for route in routes:
+        if isinstance(route, Route):
+            yield route.path, route.compiled_path
+        elif isinstance(route, Mount):
+            yield route.path + '/{path:path}', route.compiled_path
+            yield route.path or SEPARATOR, CompilePath(route.path or SEPARATOR)
+            yield from _get_compiled_paths(route.routes)
+        elif isinstance(route, Host):
+            yield route.host, route.compiled_host
+            yield from _get_compiled_paths(getattr(route.app, 'routes', ()))
+
+
+class RouteSnapshot:
+    """ Versioned cache file of the compiled route templates. """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = FilePath(path)
+        self.definitions_hash: str | None = None
+        self.paths: dict[str, Path] = {}
+
+    def load(self, definitions_hash: str | None = None) -> bool:
+        """
+        Load the compiled templates into the snapshot.
+
+        `False` is returned if the file is missing, outdated or does not
+        match the given definitions hash.
+        """
+        self.paths = {}
+        try:
+            snapshot = json.loads(self.path.read_bytes())
+        except (OSError, ValueError):
+            return False
+
+        if (
+                not isinstance(snapshot, dict)
+                or snapshot.get('version') != SNAPSHOT_VERSION
+                or snapshot.get('convertors') != get_convertors_fingerprint()
+                or definitions_hash is not None and snapshot.get('definitions_hash') != definitions_hash
+        ):
+            return False
+
+        # INFO: The segments are stored as the parameter names of each segment of the template,
+        # the path formatter is built on first use as most of the routes are never reversed
+        for template, (regex, path_format, params, parts, segment_names) in snapshot['paths'].items():
+            self.paths[template] = Path(
+                regex=regex,
+                path_format=path_format,
+                param_convertors={name: CONVERTOR_TYPES[convertor_type] for name, convertor_type in params},
+                path_parts=tuple(parts),
+                segments=tuple(zip(template[1:].split(SEPARATOR), map(tuple, segment_names))) if segment_names else None
+            )
+        self.definitions_hash = snapshot['definitions_hash']
+        return True
+
+    @contextlib.contextmanager
+    def preload(self) -> Iterator[None]:
+        """ Take the templates of the routes created in the block from the snapshot. """
+        token = PRELOADED_PATHS.set(self.paths)
+        try:
+            yield
+        finally:
+            PRELOADED_PATHS.reset(token)
+
+    def build(self, get_router: Callable[[], Router]) -> Router:
+        """
+        Build the router from the snapshot, which is rewritten if it is missing or outdated.
+
+        A router built from an outdated snapshot is dropped and built again
+        without it, so an outdated snapshot is never used.
+        """
+        if not self.load():
+            router = get_router()
+            self.dump(router)
+            return router
+
+        with self.preload():
+            router = get_router()
+        if not self.is_current(router):
+            router = get_router()
+            self.dump(router)
+        self.paths = {}
+        return router
+
+    def dump(self, router: Router) -> None:
+        """ Write the compiled templates of the router routes. """
+        convertor_types = {id(convertor): name for name, convertor in CONVERTOR_TYPES.items()}
+        paths = {}
+        for template, compiled_path in _get_compiled_paths(router.routes):
+            path = compiled_path.path
+            segments = compiled_path.segments if template.startswith(SEPARATOR) else ()
+            paths[template] = [
+                path.regex,
+                path.path_format,
+                [[name, convertor_types[id(convertor)]] for name, convertor in path.param_convertors.items()],
+                list(path.path_parts),
+                [list(names) for _, names in segments],
+            ]
+
+        definitions_hash = get_definitions_hash(router.routes)
+        snapshot = {
+            'version': SNAPSHOT_VERSION,
+            'convertors': get_convertors_fingerprint(),
+            'definitions_hash': definitions_hash,
+            'paths': paths,
+        }
+        temporary_path = self.path.with_name(f'{self.path.name}.{os.getpid()}.tmp')
+        temporary_path.write_text(json.dumps(snapshot, separators=(',', ':')))
+        os.replace(temporary_path, self.path)
+        self.definitions_hash = definitions_hash
+
+    def is_current(self, router: Router) -> bool:
+        """ Check that the snapshot matches the route definitions of the router. """
+        return self.definitions_hash == get_definitions_hash(router.routes)
+
+    def sync(self, router: Router) -> bool:
+        """ Rewrite the snapshot if the routes have changed, `True` is returned if it was rewritten. """
+        if self.is_current(router):
+            return False
+        self.dump(router)
+        return True
@@ -0,0 +1,149 @@
+import re
+from collections.abc import Iterator
+from typing import Any, Pattern
+
+from speedy.routing.base import PARAM_REGEX
+from speedy.routing.route import Route
+from speedy.utils.convertors import Convertor, PathConvertor
+
+SEPARATOR = '/'
+
+
+def split_path(path: str) -> list[str]:
+    """ Split a path starting with a separator into its segments. """
+    return path[1:].split(SEPARATOR)
+
+
+def is_static_path(path: str) -> bool:
+    """ Check that the path has no parameters. """
+    return PARAM_REGEX.search(path) is None
+
+
+class RouteNode:
+    """ A node of the route tree keyed on literal path segments. """
+
+    __slots__ = ('static', 'params', 'tails', 'routes')
+
+    def __init__(self) -> None:
+        self.static: dict[str, RouteNode] = {}
+        self.params: dict[str, ParamNode] = {}
+        self.tails: list[Route] = []
+        self.routes: list[Route] = []
+
+
+class ParamNode(RouteNode):
+    """ A node of the route tree matching a path segment with parameters. """
+
+    __slots__ = ('segment', 'param_name', 'convertor', 'pattern', 'param_convertors')
+
+    def __init__(self, segment: str, param_convertors: dict[str, Convertor[Any]]) -> None:
+        super().__init__()
+        self.segment = segment
+        self.param_name: str | None = None
+        self.convertor: Convertor[Any] | None = None
+        self.pattern: Pattern[str] | None = None
+        self.param_convertors = param_convertors
+
+        match = PARAM_REGEX.fullmatch(segment)
+        if match is not None:
+            self.param_name = match.group(1)
+            self.convertor = param_convertors[self.param_name]
+
+    def match(self, segment: str) -> dict[str, Any] | None:
+        """ Match a path segment and convert its parameters. """
+        if self.convertor is not None:
+            value = self.convertor.match(segment)
+            if value is None:
+                return None
+            return {self.param_name: value}
+
+        # INFO: The segment regex is built and compiled on first match, most of the nodes are never reached at startup
+        if self.pattern is None:
+            self.pattern = re.compile(self._get_segment_regex())
+        match = self.pattern.fullmatch(segment)
+        if match is None:
+            return None
+        return {
+            key: self.param_convertors[key].convert(value)
+            for key, value in match.groupdict().items()
+        }
+
+    def _get_segment_regex(self) -> str:
+        segment = self.segment
+        segment_regex = ''
+        index = 0
+        for match in PARAM_REGEX.finditer(segment):
+            param_name = match.group(1)
+            segment_regex += re.escape(segment[index: match.start()])
+            segment_regex += f'(?P<{param_name}>{self.param_convertors[param_name].regex})'
+            index = match.end()
+        segment_regex += re.escape(segment[index:])
+        return segment_regex
+
+
+class RouteTree:
+    """ Prefix tree of the parameterised routes. """
+
+    def __init__(self) -> None:
+        self.root = RouteNode()
+
+    def insert(self, route: Route) -> None:
+        """ Insert the route into the tree. """
+        node = self.root
+        param_convertors = route.compiled_path.param_convertors
+
+        for segment, param_names in route.compiled_path.segments:
+            if not param_names:
+                node = node.static.setdefault(segment, RouteNode())
+                continue
+
+            if any(isinstance(param_convertors[name], PathConvertor) for name in param_names):
+                node.tails.append(route)
+                return None
+
+            if segment not in node.params:
+                node.params[segment] = ParamNode(segment, param_convertors)
+            node = node.params[segment]
+
+        node.routes.append(route)
+
+    def lookup(self, path: str) -> Iterator[tuple[Route, dict[str, Any]]]:
+        """
+        Find the routes matching the path and their converted parameters.
+
+        Literal segments take precedence over parameters, the routes
+        with a `path` parameter are tried last.
+        """
+        return self._lookup(self.root, path, split_path(path), 0, {})
+
+    def _lookup(
+            self,
+            node: RouteNode,
+            path: str,
+            segments: list[str],
+            index: int,
+            path_params: dict[str, Any]
+    ) -> Iterator[tuple[Route, dict[str, Any]]]:
+        if index == len(segments):
+            for route in node.routes:
+                yield route, path_params
+        else:
+            segment = segments[index]
+
+            child = node.static.get(segment)
+            if child is not None:
+                yield from self._lookup(child, path, segments, index + 1, path_params)
+
+            for param_node in node.params.values():
+                params = param_node.match(segment)
+                if params is not None:
+                    yield from self._lookup(param_node, path, segments, index + 1, {**path_params, **params})
+
+        for route in node.tails:
+            match = route.compiled_path.path_regex.match(path)
+            if match is not None:
+                param_convertors = route.compiled_path.param_convertors
+                yield route, {
+                    key: param_convertors[key].convert(value)
+                    for key, value in match.groupdict().items()
+                }
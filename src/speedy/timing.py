@@ -0,0 +1,69 @@
+import contextvars
+import time
+
+ROUTE = 'route'
+BODY = 'body'
+FORM = 'form'
+HANDLER = 'handler'
+APP = 'app'
+
+
+class RequestTiming:
+    """ The `time.perf_counter` timestamps and the summed up durations of the phases of a request. """
+
+    __slots__ = (
+        'method',
+        'path',
+        'route',
+        'status',
+        'start',
+        'response_start',
+        'response_end',
+        'phases',
+        'bytes_received',
+        'bytes_sent'
+    )
+
+    def __init__(self, method: str, path: str, start: float | None = None) -> None:
+        self.method = method
+        self.path = path
+        self.route: str | None = None
+        self.status: int | None = None
+        self.start = time.perf_counter() if start is None else start
+        self.response_start: float | None = None
+        self.response_end: float | None = None
+        self.phases: dict[str, float] = {}
+        self.bytes_received = 0
+        self.bytes_sent = 0
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(method={self.method!r}, path={self.path!r}, phases={self.phases!r})'
+
+    def add(self, phase: str, start: float) -> None:
+        """ Add the time passed since the `time.perf_counter` start to the phase. """
+        self.phases[phase] = self.phases.get(phase, 0.0) + time.perf_counter() - start
+
+    @property
+    def duration(self) -> float | None:
+        """ The seconds from the start to the response end, `None` is returned if the response has not ended. """
+        if self.response_end is None:
+            return None
+        return self.response_end - self.start
+
+    def get_server_timing(self) -> str:
+        """ Get the `Server-Timing` header value of the phases, the `app` metric lasts until the response start. """
+        metrics = [f'{phase};dur={duration * 1000:.3f}' for phase, duration in self.phases.items()]
+        if self.response_start is not None:
+            metrics.append(f'{APP};dur={(self.response_start - self.start) * 1000:.3f}')
+        return ', '.join(metrics)
+
+
+TIMING: contextvars.ContextVar[RequestTiming | None] = contextvars.ContextVar('speedy.timing', default=None)
+
+
+def get_timing() -> RequestTiming | None:
+    """
+    Getting the timing of the current request,
+    `None` is returned if the request is not timed.
+    """
+    return TIMING.get()
@@ -14,7 +14,7 @@ from .asgi_types import (
     ASGIReceiveEvent,
     WebSocketSendEvent,
 )
-from .structure_type import RawHeaders, ScopeHeaders, StateType
+from .structure_type import RawHeaders, ScopeHeaders, StateType, Message
 
 __all__ = (
     'Scope',
@@ -34,4 +34,5 @@ __all__ = (
     'ASGISendEvent',
     'ASGIReceiveEvent',
     'WebSocketSendEvent',
+    'Message',
 )
@@ -8,3 +8,5 @@ RawHeaders: TypeAlias = list[tuple[bytes, bytes]]
 ScopeHeaders: TypeAlias = MutableMapping[str, Any]
 
 StateType: TypeAlias = dict[str, Any]
+
+Message: TypeAlias = MutableMapping[str, Any]
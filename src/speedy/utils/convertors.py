@@ -1,4 +1,5 @@
 import math
+import re
 import uuid
 from typing import ClassVar
 
@@ -6,6 +7,9 @@ from speedy.exceptions.base import EmptyException
 from speedy.exceptions.route import PathException
 
 ZERO = 0
+UUID_LENGTH = 36
+UUID_SEPARATOR_INDEXES = (8, 13, 18, 23)
+UUID_CHARACTERS = frozenset('0123456789abcdef-')
 
 
 class Convertor[T]:
@@ -14,6 +18,12 @@ class Convertor[T]:
     def convert(self, value: str) -> T:
         raise NotImplementedError()
 
+    def match(self, value: str) -> T | None:
+        """ Validate and convert a path segment, `None` is returned if the segment does not match. """
+        if re.fullmatch(self.regex, value) is None:
+            return None
+        return self.convert(value)
+
     def to_string(self, value: T) -> str:
         raise NotImplementedError()
 
@@ -24,6 +34,11 @@ class StringConvertor(Convertor[str]):
     def convert(self, value: str) -> str:
         return value
 
+    def match(self, value: str) -> str | None:
+        if not value or '/' in value:
+            return None
+        return value
+
     def to_string(self, value: str) -> str:
         value = str(value)
         if '/' in value:
@@ -39,6 +54,9 @@ class PathConvertor(Convertor[str]):
     def convert(self, value: str) -> str:
         return str(value)
 
+    def match(self, value: str) -> str:
+        return value
+
     def to_string(self, value: str) -> str:
         return str(value)
 
@@ -49,6 +67,11 @@ class IntegerConvertor(Convertor[int]):
     def convert(self, value: str) -> int:
         return int(value)
 
+    def match(self, value: str) -> int | None:
+        if not (value.isascii() and value.isdigit()):
+            return None
+        return int(value)
+
     def to_string(self, value: int) -> str:
         value = int(value)
         if value < ZERO:
@@ -62,6 +85,14 @@ class FloatConvertor(Convertor[float]):
     def convert(self, value: str) -> float:
         return float(value)
 
+    def match(self, value: str) -> float | None:
+        integer, separator, fraction = value.partition('.')
+        if not (integer.isascii() and integer.isdigit()):
+            return None
+        if separator and not (fraction.isascii() and fraction.isdigit()):
+            return None
+        return float(value)
+
     def to_string(self, value: float) -> str:
         value = float(value)
         if value < ZERO:
@@ -79,6 +110,16 @@ class UUIDConvertor(Convertor[uuid.UUID]):
     def convert(self, value: str) -> uuid.UUID:
         return uuid.UUID(value)
 
+    def match(self, value: str) -> uuid.UUID | None:
+        if len(value) != UUID_LENGTH or not UUID_CHARACTERS.issuperset(value):
+            return None
+        if any(value[index] != '-' for index in UUID_SEPARATOR_INDEXES):
+            return None
+        try:
+            return uuid.UUID(value)
+        except ValueError:
+            return None
+
     def to_string(self, value: uuid.UUID) -> str:
         return str(value)
 
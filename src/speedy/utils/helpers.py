@@ -1,6 +1,5 @@
 import functools
 import inspect
-import re
 from collections.abc import Callable
 from typing import TypeVar, cast, Any
 
@@ -23,14 +22,40 @@ def unwrap_partial(value: T) -> T:
 
 
 def get_route_path(scope: Scope) -> str:
-    """ Get route path. """
+    """ Get the path without the root path. """
+    path = scope['path']
     root_path = scope.get('root_path', '')
-    root_path = re.sub(r'^' + root_path, '', scope['path'])
-    return root_path
+    if not root_path or not path.startswith(root_path):
+        return path
+    if len(path) == len(root_path):
+        return ''
+    if path[len(root_path)] == '/':
+        return path[len(root_path):]
+    return path
+
+
+def strip_port(host: str) -> str:
+    """ Get the lowercase host name without the port, the IPv6 literals keep their brackets. """
+    host = host.lower()
+    hostname, separator, port = host.rpartition(':')
+    if separator and port.isdigit() and (hostname.endswith(']') or ':' not in hostname):
+        return hostname
+    return host
+
+
+def get_host(scope: Scope) -> str:
+    """ Get the lowercase host name without port from the `host` header or the server address. """
+    for key, value in scope.get('headers', ()):
+        if key == b'host':
+            return strip_port(value.decode('latin-1'))
+    server = scope.get('server')
+    if server is None:
+        return ''
+    return server[0]
 
 
 def get_endpoint_name(endpoint: Callable[..., Any]) -> str:
     """ Get endpoint name. """
-    if inspect.iscoroutine(endpoint) or inspect.isclass(endpoint):
+    if inspect.isroutine(endpoint) or inspect.isclass(endpoint):
         return endpoint.__name__
     return endpoint.__class__.__name__
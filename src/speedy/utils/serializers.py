@@ -0,0 +1,135 @@
+import dataclasses
+import datetime
+import enum
+import functools
+import json
+import math
+import uuid
+from collections.abc import Callable
+from decimal import Decimal
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover
+    ujson = None
+
+ORJSON = 'orjson'
+UJSON = 'ujson'
+STDLIB = 'json'
+JSON_BACKENDS = tuple(
+    backend for backend, module in ((ORJSON, orjson), (UJSON, ujson), (STDLIB, json)) if module is not None
+)
+DEFAULT_JSON_BACKEND = JSON_BACKENDS[0]
+
+JSONEncoder = Callable[[Any], bytes]
+
+
+def default(obj: Any) -> Any:
+    """ Convert the objects the JSON backends do not support natively. """
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    if isinstance(obj, (uuid.UUID, Decimal)):
+        return str(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
+def replace_non_finite(obj: Any) -> Any:
+    """ Replace the non finite floats with `None`, the objects converted by `default` included. """
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if obj is None or isinstance(obj, (str, int)):
+        return obj
+    if isinstance(obj, dict):
+        return {key: replace_non_finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [replace_non_finite(value) for value in obj]
+    return replace_non_finite(default(obj))
+
+
+@functools.lru_cache
+def get_json_encoder(
+        backend: str = DEFAULT_JSON_BACKEND,
+        *,
+        sort_keys: bool = False,
+        non_str_keys: bool = False
+) -> JSONEncoder:
+    """
+    Get the function serializing an object into compact UTF-8 JSON bytes.
+
+    The backend is the fastest one installed unless it is given: `orjson`,
+    `ujson` or the standard `json`. The dataclasses, the datetimes, the
+    enums, the UUIDs, the decimals and the sets are supported by all of
+    them, the decimals are written as strings except by `ujson`. All the
+    backends allow the numbers, the booleans and `None` as keys and the
+    integers beyond 64 bits, `orjson` falls back to the standard `json`
+    for them. The non finite floats are written as `null` as `orjson`
+    does, the other backends replace them and encode the object again
+    once they reject it. `non_str_keys` allows the keys of any type
+    supported as a value with `orjson`.
+    """
+    if backend not in JSON_BACKENDS:
+        raise ValueError(f'JSON backend must be one of {JSON_BACKENDS}')
+
+    if backend == ORJSON:
+        option = 0
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if non_str_keys:
+            option |= orjson.OPT_NON_STR_KEYS
+        fallback = get_json_encoder(STDLIB, sort_keys=sort_keys)
+
+        def encode(obj: Any) -> bytes:
+            try:
+                return orjson.dumps(obj, default=default, option=option)
+            except TypeError:
+                # INFO: The non str keys and the big integers are supported by the standard `json`
+                return fallback(obj)
+
+        return encode
+
+    if backend == UJSON:
+        def dumps(obj: Any) -> bytes:
+            return ujson.dumps(
+                obj,
+                ensure_ascii=False,
+                escape_forward_slashes=False,
+                sort_keys=sort_keys,
+                allow_nan=False,
+                default=default
+            ).encode('utf-8')
+
+        def encode(obj: Any) -> bytes:
+            try:
+                return dumps(obj)
+            except OverflowError:
+                return dumps(replace_non_finite(obj))
+
+        return encode
+
+    encoder = json.JSONEncoder(
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(',', ':'),
+        sort_keys=sort_keys,
+        default=default
+    )
+
+    def encode(obj: Any) -> bytes:
+        try:
+            return encoder.encode(obj).encode('utf-8')
+        except ValueError:
+            return encoder.encode(replace_non_finite(obj)).encode('utf-8')
+
+    return encode
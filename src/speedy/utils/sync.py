@@ -1,23 +1,24 @@
 from typing import TypeVar, ParamSpec, Awaitable, Callable
 
-from speedy.concurrency import sync_to_thread
+from speedy.concurrency import sync_to_thread, sync_to_thread_before_deadline
 from speedy.utils.predicates import is_async_callable
 
 P = ParamSpec('P')
 T = TypeVar('T')
 
 
-def ensure_async_callable(func: Callable[P, T]) -> Callable[P, Awaitable[T]]:
+def ensure_async_callable(func: Callable[P, T], *, before_deadline: bool = False) -> Callable[P, Awaitable[T]]:
     """ Provide possibility of async object invocation. """
     if is_async_callable(func):
         return func
-    return AsyncCallable(func)
+    return AsyncCallable(func, before_deadline=before_deadline)
 
 
 class AsyncCallable:
     """ Wrapper a given callable to be called in a thread pool. """
-    def __init__(self, function: Callable[P, T]) -> None:
+    def __init__(self, function: Callable[P, T], *, before_deadline: bool = False) -> None:
         self.function = function
+        self.run_in_thread = sync_to_thread_before_deadline if before_deadline else sync_to_thread
 
     def __call__(self, *args: P.args, **kwargs: P.kwargs) -> Awaitable[T]:
-        return sync_to_thread(self.function, *args, **kwargs)
+        return self.run_in_thread(self.function, *args, **kwargs)
@@ -0,0 +1,20 @@
+import pytest
+
+from speedy.connection.request import Request
+from speedy.types import Message
+
+
+@pytest.mark.parametrize(
+    'messages, body', (
+            ([{'type': 'http.request', 'body': b'body', 'more_body': False}], b'body'),
+            ([{'type': 'http.request', 'body': b'bo', 'more_body': True},
+              {'type': 'http.request', 'body': b'dy', 'more_body': False}], b'body'),
+            ([{'type': 'http.request'}], b''),
+    )
+)
+async def test_request_body(messages: list[Message], body: bytes) -> None:
+    async def receive() -> Message:
+        return messages.pop(0)
+
+    request = Request({'type': 'http', 'method': 'POST', 'path': '/', 'headers': []}, receive)
+    assert await request.body() == body
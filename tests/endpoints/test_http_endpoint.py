@@ -0,0 +1,83 @@
+import pytest
+
+from speedy.endpoints import HTTPEndpoint
+from speedy.response import PlainTextResponse
+from speedy.routing import Router, Route
+from tests.helpers import make_scope, call_app
+
+
+class UserEndpoint(HTTPEndpoint):
+    async def get(self, request):
+        return PlainTextResponse(f'user {request.path_params["user_id"]}')
+
+    def post(self, request):
+        return PlainTextResponse('created', status_code=201)
+
+    @staticmethod
+    async def delete(request):
+        return PlainTextResponse('deleted')
+
+
+def test_http_endpoint_handlers() -> None:
+    assert list(UserEndpoint.handlers) == ['GET', 'HEAD', 'POST', 'DELETE']
+    assert UserEndpoint.handlers['HEAD'] == UserEndpoint.handlers['GET']
+    assert UserEndpoint.handlers['GET'][1] is True
+    assert UserEndpoint.handlers['POST'][1] is False
+    assert UserEndpoint.allowed_methods == ('GET', 'POST', 'DELETE')
+    assert UserEndpoint.allow == 'GET, POST, DELETE'
+    assert HTTPEndpoint.handlers == {}
+
+
+def test_http_endpoint_handlers_inherited() -> None:
+    class AdminEndpoint(UserEndpoint):
+        async def put(self, request):
+            return PlainTextResponse('updated')
+
+    assert AdminEndpoint.allowed_methods == ('GET', 'POST', 'PUT', 'DELETE')
+    assert UserEndpoint.allowed_methods == ('GET', 'POST', 'DELETE')
+
+
+@pytest.mark.parametrize(
+    'method, status, body', (
+            ('GET', 200, b'user 1'),
+            ('HEAD', 200, b'user 1'),
+            ('POST', 201, b'created'),
+            ('DELETE', 200, b'deleted'),
+            ('PUT', 405, b'Method not allowed'),
+    )
+)
+async def test_http_endpoint_dispatch(method: str, status: int, body: bytes) -> None:
+    router = Router([Route('/users/{user_id:int}', UserEndpoint)])
+
+    messages = await call_app(router, make_scope('/users/1', method=method))
+
+    assert messages[0]['status'] == status
+    assert messages[1]['body'] == body
+    if status == 405:
+        assert (b'allow', b'GET, POST, DELETE') in messages[0]['headers']
+
+
+def test_http_endpoint_handlers_wrapped_and_aliased() -> None:
+    def decorator(handler):
+        async def wrapper(self, request):
+            return await handler(self, request)
+
+        return wrapper
+
+    async def shared(self, request):
+        return PlainTextResponse('shared')
+
+    class SharedEndpoint(HTTPEndpoint):
+        get = shared
+        post = decorator(shared)
+
+    assert SharedEndpoint.handlers['GET'][0] is shared
+    assert SharedEndpoint.handlers['HEAD'][0] is shared
+    assert SharedEndpoint.handlers['POST'][0].__name__ == 'wrapper'
+
+
+def test_http_endpoint_method_not_allowed_response() -> None:
+    response = UserEndpoint.method_not_allowed_response
+
+    assert response.status_code == 405
+    assert response.headers['allow'] == 'GET, POST, DELETE'
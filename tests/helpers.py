@@ -0,0 +1,56 @@
+import asyncio
+from typing import Any
+
+from speedy.types import Message, ASGIReceiveCallable
+
+
+class Clock:
+    """ The clock of the time-based tests, it is moved by setting `now`. """
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_scope(path: str = '/', method: str = 'GET', headers: list | None = None, **values: Any) -> dict:
+    """ Build the HTTP scope, the other scope values are set with the keyword arguments. """
+    return {
+        'type': 'http',
+        'method': method,
+        'path': path,
+        'root_path': '',
+        'query_string': b'',
+        'headers': headers or [],
+        **values,
+    }
+
+
+async def call_app(
+        app,
+        scope: dict | None = None,
+        body: bytes = b'',
+        receive: ASGIReceiveCallable | None = None,
+        messages: list[Message] | None = None
+) -> list[Message]:
+    """
+    Call the ASGI application with the request body, the sent messages are returned.
+
+    Once the body is received, the client stays connected, so `receive` waits.
+    """
+    messages = messages if messages is not None else []
+    is_received = False
+
+    async def receive_body() -> Message:
+        nonlocal is_received
+        if is_received:
+            await asyncio.Event().wait()
+        is_received = True
+        return {'type': 'http.request', 'body': body, 'more_body': False}
+
+    async def send(message: Message) -> None:
+        messages.append(message)
+
+    await app(scope if scope is not None else make_scope(), receive or receive_body, send)
+    return messages
@@ -0,0 +1,97 @@
+import pickle
+import random
+
+import pytest
+
+from speedy.metrics import Histogram, RouteMetrics, get_status_class
+from speedy.middleware import ServerTimingMiddleware
+from speedy.response import PlainTextResponse
+from speedy.routing import Router, Route, Mount
+from speedy.types import Message
+
+
+@pytest.mark.parametrize('value', (0, 1, 63, 64, 65, 1000, 123_456, 3_600_000_000))
+def test_histogram_bucket_bounds(value: int) -> None:
+    histogram = Histogram()
+    histogram.record(value / 1_000_000)
+    [index] = [index for index, count in enumerate(histogram.counts) if count]
+
+    assert value <= histogram.get_upper_bound(index)
+    assert histogram.get_upper_bound(index) - value <= value / 32
+    assert index == 0 or histogram.get_upper_bound(index - 1) < value
+
+
+def test_histogram_quantiles() -> None:
+    histogram = Histogram()
+    values = [random.uniform(0.0001, 2.0) for _ in range(10_000)]
+    for value in values:
+        histogram.record(value)
+    values.sort()
+
+    summary = histogram.summary()
+
+    assert summary.count == 10_000
+    assert summary.mean == pytest.approx(sum(values) / len(values), rel=0.001)
+    assert summary.max == pytest.approx(values[-1], abs=1e-6)
+    for q, quantile in ((0.5, summary.p50), (0.99, summary.p99), (0.999, summary.p999)):
+        assert quantile == pytest.approx(values[int(q * len(values)) - 1], rel=1 / 32)
+
+
+def test_histogram_limits() -> None:
+    histogram = Histogram(max_seconds=1.0)
+    histogram.record(-1.0)
+    histogram.record(10.0)
+
+    assert histogram.quantile(0.5) == 0.0
+    assert histogram.quantile(1.0) == 1.0
+    assert Histogram().summary().p99 == 0.0
+
+
+def test_histogram_merge() -> None:
+    first, second = Histogram(), Histogram()
+    first.record(0.001)
+    second.record(0.002)
+    second.record(0.003)
+
+    first.merge(pickle.loads(pickle.dumps(second)))
+
+    assert first.count == 3
+    assert first.quantile(0.0) == pytest.approx(0.001, rel=1 / 32)
+    assert first.quantile(1.0) == 0.003
+    with pytest.raises(ValueError):
+        first.merge(Histogram(sub_bucket_bits=4))
+
+
+@pytest.mark.parametrize('status, status_class', ((101, '1xx'), (200, '2xx'), (304, '3xx'), (404, '4xx'), (503, '5xx'), (None, '5xx')))
+def test_get_status_class(status: int | None, status_class: str) -> None:
+    assert get_status_class(status) == status_class
+
+
+async def test_route_metrics() -> None:
+    async def endpoint(request) -> PlainTextResponse:
+        return PlainTextResponse('ok')
+
+    metrics = RouteMetrics()
+    router = Router([Mount('/api/{version}', routes=[Route('/users/{id:int}', endpoint)])])
+    app = ServerTimingMiddleware(router, header=False, callback=metrics, on_start=metrics.start)
+
+    async def receive() -> Message:
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(message: Message) -> None:
+        pass
+
+    for path in ('/api/v1/users/1', '/api/v2/users/2', '/api/v1/users/x', '/missing'):
+        scope = {'type': 'http', 'method': 'GET', 'path': path, 'root_path': '', 'query_string': b'', 'headers': []}
+        await app(scope, receive, send)
+
+    assert metrics.get('/api/{version}/users/{id}', '2xx').count == 2
+    assert metrics.get('/api/{version}', '4xx').count == 1
+    assert metrics.get(None, '4xx').count == 1
+    assert len(metrics) == 3
+
+    other = RouteMetrics()
+    other.record('/api/{version}/users/{id}', 500, 0.01)
+    metrics.merge(other)
+
+    assert metrics.get('/api/{version}/users/{id}', '5xx').count == 1
@@ -0,0 +1,102 @@
+import asyncio
+
+from speedy.concurrency import get_thread_pool_queue_size
+from speedy.metrics import PrometheusApp, RouteMetrics
+from speedy.middleware import ServerTimingMiddleware
+from speedy.response import PlainTextResponse
+from speedy.routing import Router, Route, Mount
+from tests.helpers import Clock, make_scope, call_app
+
+
+async def echo(request) -> PlainTextResponse:
+    return PlainTextResponse(await request.body())
+
+
+async def test_prometheus_app() -> None:
+    metrics = RouteMetrics()
+    exporter = PrometheusApp(metrics, buckets=(0.5, 0.001))
+    router = Router([Route('/echo/{name}', echo, methods=['POST']), Mount('/metrics', exporter)])
+    app = ServerTimingMiddleware(router, header=False, callback=metrics, on_start=metrics.start)
+
+    await call_app(app, make_scope('/echo/a', 'POST'), b'hello')
+    await call_app(app, make_scope('/echo/b', 'POST'), b'hi')
+    messages = await call_app(app, make_scope('/metrics'))
+
+    headers = dict(messages[0]['headers'])
+    assert headers[b'content-type'] == b'text/plain; version=0.0.4; charset=utf-8'
+    assert headers[b'content-length'] == str(len(messages[1]['body'])).encode()
+    lines = messages[1]['body'].decode().splitlines()
+    labels = 'route="/echo/{name}",status="2xx"'
+    assert f'speedy_requests_total{{{labels}}} 2' in lines
+    assert f'speedy_request_duration_seconds_bucket{{{labels},le="0.5"}} 2' in lines
+    assert f'speedy_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in lines
+    assert f'speedy_request_duration_seconds_count{{{labels}}} 2' in lines
+    assert f'speedy_request_body_bytes_total{{{labels}}} 7' in lines
+    assert f'speedy_response_body_bytes_total{{{labels}}} 7' in lines
+    assert 'speedy_requests_in_flight 1' in lines
+    assert 'speedy_thread_pool_queue_size 0' in lines
+    assert '# TYPE speedy_request_duration_seconds histogram' in lines
+    buckets = [line for line in lines if line.startswith('speedy_request_duration_seconds_bucket')]
+    assert [bucket.split('le=')[1].split('}')[0] for bucket in buckets] == ['"0.001"', '"0.5"', '"+Inf"']
+    assert metrics.in_flight == 0
+
+
+async def test_prometheus_app_cache() -> None:
+    clock = Clock()
+    metrics = RouteMetrics()
+    app = PrometheusApp(metrics, ttl=1.0, clock=clock)
+
+    first = (await call_app(app, make_scope()))[1]['body']
+    metrics.record('/', 200, 0.01)
+    cached = (await call_app(app, make_scope()))[1]['body']
+    clock.now = 1.0
+    rendered = (await call_app(app, make_scope()))[1]['body']
+    head = await call_app(app, make_scope(method='HEAD'))
+
+    assert first == cached
+    assert b'speedy_requests_total{route="/",status="2xx"} 1' in rendered
+    assert head[1]['body'] == b''
+    assert dict(head[0]['headers'])[b'content-length'] == str(len(rendered)).encode()
+
+
+async def test_prometheus_app_single_render() -> None:
+    metrics = RouteMetrics()
+    for index in range(200):
+        metrics.record(f'/items/{index}', 200, 0.01)
+    app = PrometheusApp(metrics, namespace='app')
+    calls = 0
+    iter_chunks = app.iter_chunks
+
+    def count_calls():
+        nonlocal calls
+        calls += 1
+        return iter_chunks()
+
+    app.iter_chunks = count_calls
+
+    payloads = await asyncio.gather(*(app.get_payload() for _ in range(5)))
+
+    assert calls == 1
+    assert len(set(payloads)) == 1
+    assert b'app_requests_total{route="/items/199",status="2xx"} 1' in payloads[0]
+
+
+async def test_prometheus_app_label_escaping() -> None:
+    metrics = RouteMetrics()
+    metrics.record('/a"b\\c', 404, 0.01)
+    metrics.record(None, 404, 0.01)
+
+    payload = await PrometheusApp(metrics).get_payload()
+
+    assert b'route="/a\\"b\\\\c",status="4xx"' in payload
+    assert b'speedy_requests_total{route="",status="4xx"} 1' in payload
+
+
+async def test_get_thread_pool_queue_size() -> None:
+    assert get_thread_pool_queue_size() == 0
+
+
+async def test_prometheus_app_websocket() -> None:
+    messages = await call_app(PrometheusApp(RouteMetrics()), make_scope(type='websocket'))
+
+    assert messages == [{'type': 'websocket.close', 'code': 1000}]
@@ -0,0 +1,193 @@
+import asyncio
+
+import pytest
+
+from speedy.middleware import ResponseCacheMiddleware
+from speedy.middleware.cache import ResponseCacheInfo, parse_cache_control
+from tests.helpers import Clock, make_scope, call_app
+
+
+class CountingApp:
+    def __init__(self, headers: list | None = None, status: int = 200, body: bytes = b'body') -> None:
+        self.calls = 0
+        self.headers = headers or []
+        self.status = status
+        self.body = body
+
+    async def __call__(self, scope, receive, send) -> None:
+        self.calls += 1
+        await send({'type': 'http.response.start', 'status': self.status, 'headers': list(self.headers)})
+        await send({'type': 'http.response.body', 'body': self.body + str(self.calls).encode(), 'more_body': False})
+
+
+@pytest.mark.parametrize(
+    'value, directives', (
+            ('max-age=60', {'max-age': '60'}),
+            ('public, max-age=60, stale-while-revalidate="30"',
+             {'public': None, 'max-age': '60', 'stale-while-revalidate': '30'}),
+            ('No-Store', {'no-store': None}),
+            ('', {}),
+    )
+)
+def test_parse_cache_control(value: str, directives: dict) -> None:
+    assert parse_cache_control(value) == directives
+
+
+async def test_response_cache_hit_and_expiry() -> None:
+    clock = Clock()
+    app = CountingApp()
+    middleware = ResponseCacheMiddleware(app, ttl=10, clock=clock)
+
+    first = await call_app(middleware, make_scope())
+    clock.now = 5
+    second = await call_app(middleware, make_scope())
+    third = await call_app(middleware, make_scope(query_string=b'page=2'))
+    clock.now = 11
+    fourth = await call_app(middleware, make_scope())
+
+    assert [first[1]['body'], second[1]['body'], third[1]['body'], fourth[1]['body']] == [
+        b'body1', b'body1', b'body2', b'body3'
+    ]
+    assert (b'age', b'5') in second[0]['headers']
+    assert app.calls == 3
+    assert middleware.cache_info() == ResponseCacheInfo(
+        hits=1, stale_hits=0, misses=3, evictions=0, entries=2, size=10, max_size=64 * 1024 * 1024
+    )
+
+
+async def test_response_cache_vary() -> None:
+    app = CountingApp(headers=[(b'vary', b'Accept-Language')])
+    middleware = ResponseCacheMiddleware(app)
+
+    english = [(b'accept-language', b'en')]
+    german = [(b'accept-language', b'de')]
+    bodies = [
+        (await call_app(middleware, make_scope(headers=headers)))[1]['body']
+        for headers in (english, german, english, german, [])
+    ]
+
+    assert bodies == [b'body1', b'body2', b'body1', b'body2', b'body3']
+    assert app.calls == 3
+
+
+@pytest.mark.parametrize(
+    'headers, status, request_headers, method', (
+            ([(b'cache-control', b'no-store')], 200, [], 'GET'),
+            ([(b'cache-control', b'private, max-age=60')], 200, [], 'GET'),
+            ([(b'cache-control', b'max-age=0')], 200, [], 'GET'),
+            ([(b'vary', b'*')], 200, [], 'GET'),
+            ([(b'set-cookie', b'session=1')], 200, [], 'GET'),
+            ([], 500, [], 'GET'),
+            ([], 200, [(b'authorization', b'Bearer token')], 'GET'),
+            ([], 200, [(b'cache-control', b'no-cache')], 'GET'),
+            ([], 200, [], 'POST'),
+    )
+)
+async def test_response_cache_not_stored(
+        headers: list,
+        status: int,
+        request_headers: list,
+        method: str
+) -> None:
+    app = CountingApp(headers=headers, status=status)
+    middleware = ResponseCacheMiddleware(app)
+
+    await call_app(middleware, make_scope(headers=request_headers, method=method))
+    await call_app(middleware, make_scope(headers=request_headers, method=method))
+
+    assert app.calls == 2
+    assert len(middleware) == 0
+
+
+async def test_response_cache_max_age_overrides_ttl() -> None:
+    clock = Clock()
+    app = CountingApp(headers=[(b'cache-control', b'public, s-maxage=100, max-age=1')])
+    middleware = ResponseCacheMiddleware(app, ttl=None, clock=clock)
+
+    await call_app(middleware, make_scope())
+    clock.now = 50
+    await call_app(middleware, make_scope())
+
+    assert app.calls == 1
+
+
+async def test_response_cache_eviction() -> None:
+    app = CountingApp(body=b'x' * 10)
+    middleware = ResponseCacheMiddleware(app, max_size=25)
+
+    for path in ('/a', '/b', '/a', '/c'):
+        await call_app(middleware, make_scope(path))
+
+    assert middleware.cache_info().evictions == 1
+    assert middleware.size == 22
+    await call_app(middleware, make_scope('/a'))
+    assert app.calls == 3
+    await call_app(middleware, make_scope('/b'))
+    assert app.calls == 4
+
+
+async def test_response_cache_stale_while_revalidate() -> None:
+    clock = Clock()
+    app = CountingApp(headers=[(b'cache-control', b'max-age=10, stale-while-revalidate=20')])
+    middleware = ResponseCacheMiddleware(app, clock=clock)
+
+    await call_app(middleware, make_scope())
+    clock.now = 15
+    stale = await call_app(middleware, make_scope())
+    await call_app(middleware, make_scope())
+    await asyncio.gather(*middleware._tasks)
+    fresh = await call_app(middleware, make_scope())
+
+    assert stale[1]['body'] == b'body1'
+    assert fresh[1]['body'] == b'body2'
+    assert app.calls == 2
+    assert middleware.cache_info().stale_hits == 2
+
+    clock.now = 100
+    await call_app(middleware, make_scope())
+    assert app.calls == 3
+
+
+async def test_response_cache_key_host() -> None:
+    app = CountingApp()
+    middleware = ResponseCacheMiddleware(app)
+
+    first = await call_app(middleware, make_scope(headers=[(b'host', b'tenant-a.example.com')]))
+    second = await call_app(middleware, make_scope(headers=[(b'host', b'tenant-b.example.com')]))
+    third = await call_app(middleware, make_scope(headers=[(b'host', b'tenant-a.example.com')], scheme='https'))
+
+    assert [first[1]['body'], second[1]['body'], third[1]['body']] == [b'body1', b'body2', b'body3']
+    assert len(middleware) == 3
+
+
+async def test_response_cache_vary_pruned_on_eviction() -> None:
+    middleware = ResponseCacheMiddleware(CountingApp(body=b'x' * 10), max_size=50)
+
+    for index in range(1000):
+        await call_app(middleware, make_scope(query_string=str(index).encode()))
+
+    assert len(middleware) == 3
+    assert len(middleware._vary) == len(middleware._variants) == 3
+
+
+async def test_response_cache_replaces_upstream_age() -> None:
+    middleware = ResponseCacheMiddleware(CountingApp(headers=[(b'age', b'100')]), clock=Clock())
+
+    await call_app(middleware, make_scope())
+    messages = await call_app(middleware, make_scope())
+
+    assert [value for key, value in messages[0]['headers'] if key == b'age'] == [b'0']
+
+
+async def test_response_cache_vary_change() -> None:
+    app = CountingApp(headers=[(b'vary', b'Accept-Language')], body=b'x' * 10)
+    middleware = ResponseCacheMiddleware(app)
+
+    for language in (b'en', b'de'):
+        await call_app(middleware, make_scope(headers=[(b'accept-language', language)]))
+    app.headers = [(b'vary', b'Accept-Encoding')]
+    await call_app(middleware, make_scope(headers=[(b'accept-language', b'fr')]))
+
+    assert len(middleware) == 1
+    assert middleware.size == 11 + len(b'vary') + len(b'Accept-Encoding')
+    assert list(middleware._variants.values()) == [{next(iter(middleware._entries))}]
@@ -0,0 +1,127 @@
+import asyncio
+
+import pytest
+
+from speedy.middleware import CoalescingMiddleware
+from speedy.response import PlainTextResponse
+from speedy.routing import Router, Route
+from tests.helpers import make_scope, call_app
+
+
+class SlowApp:
+    def __init__(self, fail: bool = False) -> None:
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.fail = fail
+
+    async def __call__(self, scope, receive, send) -> None:
+        self.calls += 1
+        calls = self.calls
+        await self.release.wait()
+        if self.fail and calls == 1:
+            raise RuntimeError('failed')
+        await send({'type': 'http.response.start', 'status': 200, 'headers': [(b'x-call', str(calls).encode())]})
+        await send({'type': 'http.response.body', 'body': b'chunk', 'more_body': True})
+        await send({'type': 'http.response.body', 'body': b'', 'more_body': False})
+
+
+async def run_concurrently(app, scopes: list[dict], release: asyncio.Event) -> list:
+    tasks = [asyncio.create_task(call_app(app, scope)) for scope in scopes]
+    await asyncio.sleep(0)
+    release.set()
+    return await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def test_coalescing_middleware() -> None:
+    app = SlowApp()
+    middleware = CoalescingMiddleware(app)
+
+    results = await run_concurrently(middleware, [make_scope() for _ in range(5)], app.release)
+
+    assert app.calls == 1
+    assert middleware.coalesced == 4
+    assert len(middleware) == 0
+    assert all(messages == results[0] for messages in results)
+    assert [message['type'] for message in results[1]] == [
+        'http.response.start', 'http.response.body', 'http.response.body'
+    ]
+
+    await call_app(middleware, make_scope())
+    assert app.calls == 2
+
+
+@pytest.mark.parametrize(
+    'scopes, calls', (
+            ([{'path': '/a'}, {'path': '/b'}], 2),
+            ([{'query_string': b'a=1'}, {'query_string': b'a=2'}], 2),
+            ([{'method': 'GET'}, {'method': 'HEAD'}], 2),
+            ([{'method': 'POST'}, {'method': 'POST'}], 2),
+            ([{'headers': [(b'accept', b'text/html')]}, {'headers': [(b'accept', b'application/json')]}], 2),
+            ([{'headers': [(b'user-agent', b'a')]}, {'headers': [(b'user-agent', b'b')]}], 1),
+            ([{'headers': [(b'host', b'a.example.com')]}, {'headers': [(b'host', b'b.example.com')]}], 2),
+            ([{'headers': [(b'host', b'a.example.com')]}, {'headers': [(b'host', b'A.example.com')]}], 1),
+            ([{}, {'scheme': 'https'}], 2),
+    )
+)
+async def test_coalescing_middleware_keys(scopes: list[dict], calls: int) -> None:
+    app = SlowApp()
+    middleware = CoalescingMiddleware(app, headers=['Accept'])
+
+    await run_concurrently(middleware, [make_scope(**values) for values in scopes], app.release)
+
+    assert app.calls == calls
+
+
+async def test_coalescing_middleware_leader_failure() -> None:
+    app = SlowApp(fail=True)
+    middleware = CoalescingMiddleware(app)
+
+    results = await run_concurrently(middleware, [make_scope(), make_scope()], app.release)
+
+    assert isinstance(results[0], RuntimeError)
+    assert results[1][0]['status'] == 200
+    assert app.calls == 2
+    assert len(middleware) == 0
+
+
+async def test_route_coalesce() -> None:
+    calls: list[int] = []
+    release = asyncio.Event()
+
+    async def endpoint(request):
+        calls.append(1)
+        await release.wait()
+        return PlainTextResponse('endpoint')
+
+    router = Router([Route('/', endpoint, coalesce=True), Route('/plain', endpoint)])
+
+    results = await run_concurrently(router, [make_scope(), make_scope()], release)
+    assert len(calls) == 1
+    assert results[1][1]['body'] == b'endpoint'
+
+    await run_concurrently(router, [make_scope('/plain'), make_scope('/plain')], release)
+    assert len(calls) == 3
+
+
+async def test_coalescing_middleware_without_waiters() -> None:
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def app(scope, receive, send) -> None:
+        await send({'type': 'http.response.start', 'status': 200, 'headers': []})
+        started.set()
+        await release.wait()
+        await send({'type': 'http.response.body', 'body': b'body', 'more_body': False})
+
+    middleware = CoalescingMiddleware(app)
+    first = asyncio.create_task(call_app(middleware, make_scope()))
+    await started.wait()
+
+    assert len(middleware) == 0
+    started.clear()
+    second = asyncio.create_task(call_app(middleware, make_scope()))
+    await started.wait()
+    release.set()
+
+    assert await first == await second
+    assert middleware.coalesced == 0
@@ -0,0 +1,123 @@
+import asyncio
+
+import pytest
+
+from speedy import Speedy
+from speedy.middleware import ConcurrencyLimitMiddleware, GZipMiddleware, Middleware
+from speedy.middleware.concurrency_limit import ConcurrencyStats
+from tests.helpers import make_scope, call_app
+
+
+class BlockingApp:
+    def __init__(self) -> None:
+        self.release = asyncio.Event()
+        self.order: list[str] = []
+
+    async def __call__(self, scope, receive, send) -> None:
+        self.order.append(scope['path'])
+        await self.release.wait()
+        await send({'type': 'http.response.start', 'status': 200, 'headers': []})
+        await send({'type': 'http.response.body', 'body': b'ok', 'more_body': False})
+
+
+async def settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def test_concurrency_limit_sheds_without_queue() -> None:
+    app = BlockingApp()
+    middleware = ConcurrencyLimitMiddleware(app, 1, retry_after=2)
+
+    first = asyncio.create_task(call_app(middleware))
+    await settle()
+    rejected = await call_app(middleware)
+
+    assert rejected[0]['status'] == 503
+    assert (b'retry-after', b'2') in rejected[0]['headers']
+    assert rejected[1]['body'] == b'Service Unavailable'
+    assert middleware.stats() == ConcurrencyStats(in_flight=1, queued=0, shed=1, max_concurrency=1, max_queue=0)
+
+    app.release.set()
+    assert (await first)[0]['status'] == 200
+    assert middleware.stats().in_flight == 0
+
+
+@pytest.mark.parametrize('lifo, order', ((False, ['/0', '/1', '/2']), (True, ['/0', '/2', '/1'])))
+async def test_concurrency_limit_queue_order(lifo: bool, order: list[str]) -> None:
+    app = BlockingApp()
+    middleware = ConcurrencyLimitMiddleware(app, 1, max_queue=2, lifo=lifo)
+
+    tasks = []
+    for index in range(3):
+        tasks.append(asyncio.create_task(call_app(middleware, make_scope(f'/{index}'))))
+        await settle()
+    assert middleware.stats().queued == 2
+    assert (await call_app(middleware))[0]['status'] == 503
+
+    app.release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert [messages[0]['status'] for messages in results] == [200, 200, 200]
+    assert app.order == order
+    assert middleware.stats() == ConcurrencyStats(in_flight=0, queued=0, shed=1, max_concurrency=1, max_queue=2)
+
+
+async def test_concurrency_limit_priority_lanes() -> None:
+    app = BlockingApp()
+    middleware = ConcurrencyLimitMiddleware(app, 1, max_queue=3, lanes={'/api': 1, '/api/admin': 2})
+
+    tasks = []
+    for path in ('/first', '/static', '/api/items', '/api/admin/users'):
+        tasks.append(asyncio.create_task(call_app(middleware, make_scope(path))))
+        await settle()
+
+    app.release.set()
+    await asyncio.gather(*tasks)
+
+    assert app.order == ['/first', '/api/admin/users', '/api/items', '/static']
+
+
+async def test_concurrency_limit_max_wait() -> None:
+    app = BlockingApp()
+    middleware = ConcurrencyLimitMiddleware(app, 1, max_queue=1, max_wait=0.01)
+
+    first = asyncio.create_task(call_app(middleware))
+    await settle()
+    waited = await call_app(middleware)
+
+    assert waited[0]['status'] == 503
+    assert middleware.stats().queued == 0
+    app.release.set()
+    await first
+    assert middleware.stats().in_flight == 0
+
+
+async def test_concurrency_limit_cancelled_waiter() -> None:
+    app = BlockingApp()
+    middleware = ConcurrencyLimitMiddleware(app, 1, max_queue=1)
+
+    first = asyncio.create_task(call_app(middleware))
+    await settle()
+    waiting = asyncio.create_task(call_app(middleware))
+    await settle()
+    waiting.cancel()
+    await settle()
+
+    assert middleware.stats().queued == 0
+    app.release.set()
+    await first
+    assert middleware.stats().in_flight == 0
+
+
+def test_concurrency_limit_is_outermost() -> None:
+    app = Speedy(middleware=[Middleware(GZipMiddleware), Middleware(ConcurrencyLimitMiddleware, 10)])
+
+    assert isinstance(app.middleware_stack, ConcurrencyLimitMiddleware)
+    assert isinstance(app.middleware_stack.app, GZipMiddleware)
+
+
+@pytest.mark.parametrize('options', ({'max_concurrency': 0}, {'max_concurrency': 1, 'max_queue': -1}))
+def test_concurrency_limit_invalid(options: dict) -> None:
+    with pytest.raises(ValueError):
+        ConcurrencyLimitMiddleware(BlockingApp(), **options)
@@ -0,0 +1,76 @@
+import pytest
+
+from speedy.conditional import make_etag
+from speedy.middleware import ConditionalGetMiddleware
+from tests.helpers import make_scope, call_app
+
+BODY = b'body'
+ETAG = make_etag(BODY).encode()
+
+
+def get_app(chunks: list[bytes], headers: list | None = None, status: int = 200):
+    async def app(scope, receive, send) -> None:
+        await send({
+            'type': 'http.response.start',
+            'status': status,
+            'headers': [(b'content-type', b'text/plain'), (b'cache-control', b'max-age=60'), *(headers or [])],
+        })
+        for index, chunk in enumerate(chunks):
+            await send({'type': 'http.response.body', 'body': chunk, 'more_body': index < len(chunks) - 1})
+
+    return app
+
+
+async def test_conditional_middleware_adds_etag() -> None:
+    messages = await call_app(ConditionalGetMiddleware(get_app([BODY])), make_scope())
+
+    assert messages[0]['status'] == 200
+    assert dict(messages[0]['headers'])[b'etag'] == ETAG
+    assert messages[1]['body'] == BODY
+
+
+@pytest.mark.parametrize(
+    'chunks, headers, request_headers, options', (
+            ([BODY], [], [(b'if-none-match', ETAG)], {}),
+            ([b'bo', b'dy'], [], [(b'if-none-match', ETAG)], {'hash_streams': True}),
+            ([BODY], [(b'etag', b'"v1"')], [(b'if-none-match', b'W/"v1"')], {}),
+            ([b'bo', b'dy'], [(b'etag', b'"v1"')], [(b'if-none-match', b'"v1"')], {}),
+            ([BODY], [(b'last-modified', b'Wed, 21 Oct 2015 07:28:00 GMT')],
+             [(b'if-modified-since', b'Wed, 21 Oct 2015 07:28:00 GMT')], {'add_etag': False}),
+    )
+)
+async def test_conditional_middleware_not_modified(
+        chunks: list[bytes],
+        headers: list,
+        request_headers: list,
+        options: dict
+) -> None:
+    middleware = ConditionalGetMiddleware(get_app(chunks, headers), **options)
+    messages = await call_app(middleware, make_scope(headers=request_headers))
+
+    response_headers = dict(messages[0]['headers'])
+    assert messages[0]['status'] == 304
+    assert b'content-type' not in response_headers
+    assert response_headers[b'cache-control'] == b'max-age=60'
+    assert [message['body'] for message in messages[1:]] == [b'']
+
+
+@pytest.mark.parametrize(
+    'chunks, status, request_headers, method', (
+            ([BODY], 200, [(b'if-none-match', b'"other"')], 'GET'),
+            ([BODY], 404, [(b'if-none-match', ETAG)], 'GET'),
+            ([BODY], 200, [(b'if-none-match', ETAG)], 'POST'),
+            ([b'bo', b'dy'], 200, [(b'if-none-match', ETAG)], 'GET'),
+    )
+)
+async def test_conditional_middleware_passthrough(
+        chunks: list[bytes],
+        status: int,
+        request_headers: list,
+        method: str
+) -> None:
+    middleware = ConditionalGetMiddleware(get_app(chunks, status=status))
+    messages = await call_app(middleware, make_scope(method=method, headers=request_headers))
+
+    assert messages[0]['status'] == status
+    assert b''.join(message['body'] for message in messages[1:]) == b''.join(chunks)
@@ -0,0 +1,146 @@
+import pytest
+
+from speedy.middleware import CORSMiddleware
+from speedy.middleware.cors import merge_headers
+from tests.helpers import make_scope, call_app
+
+
+def get_preflight_scope(origin: bytes, method: bytes = b'GET', request_headers: bytes | None = None) -> dict:
+    headers = [(b'origin', origin), (b'access-control-request-method', method)]
+    if request_headers is not None:
+        headers.append((b'access-control-request-headers', request_headers))
+    return make_scope(method='OPTIONS', headers=headers)
+
+
+class App:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def __call__(self, scope, receive, send) -> None:
+        self.calls += 1
+        await send({'type': 'http.response.start', 'status': 200, 'headers': [(b'content-length', b'2')]})
+        await send({'type': 'http.response.body', 'body': b'ok', 'more_body': False})
+
+
+async def test_cors_middleware_simple_request() -> None:
+    middleware = CORSMiddleware(
+        App(),
+        allow_origins=['https://example.org'],
+        allow_credentials=True,
+        expose_headers=['X-Total']
+    )
+
+    messages = await call_app(middleware, make_scope(headers=[(b'origin', b'https://example.org')]))
+    disallowed = await call_app(middleware, make_scope(headers=[(b'origin', b'https://evil.org')]))
+    no_origin = await call_app(middleware, make_scope())
+
+    assert messages[0]['headers'] == [
+        (b'content-length', b'2'),
+        (b'access-control-allow-origin', b'https://example.org'),
+        (b'vary', b'Origin'),
+        (b'access-control-allow-credentials', b'true'),
+        (b'access-control-expose-headers', b'X-Total'),
+    ]
+    assert disallowed[0]['headers'] == [(b'content-length', b'2')]
+    assert no_origin[0]['headers'] == [(b'content-length', b'2')]
+
+
+async def test_cors_middleware_preflight() -> None:
+    app = App()
+    middleware = CORSMiddleware(
+        app,
+        allow_origins=['https://example.org'],
+        allow_methods=['GET', 'post'],
+        allow_headers=['X-Token'],
+        max_age=60
+    )
+
+    scope = get_preflight_scope(b'https://example.org', b'POST', b'X-Token, Content-Type')
+    messages = await call_app(middleware, scope)
+    messages[0]['headers'].clear()
+    repeated = await call_app(middleware, get_preflight_scope(b'https://example.org'))
+
+    assert app.calls == 0
+    assert messages[0]['status'] == 200
+    assert messages[1]['body'] == b'OK'
+    headers = dict(repeated[0]['headers'])
+    assert headers[b'access-control-allow-origin'] == b'https://example.org'
+    assert headers[b'access-control-allow-methods'] == b'GET, POST'
+    assert headers[b'access-control-allow-headers'] == b'accept, accept-language, content-language, content-type, x-token'
+    assert headers[b'access-control-max-age'] == b'60'
+    assert headers[b'vary'] == b'Origin'
+
+
+@pytest.mark.parametrize('scope, body', (
+        (get_preflight_scope(b'https://evil.org'), b'Disallowed CORS origin'),
+        (get_preflight_scope(b'https://example.org', b'DELETE'), b'Disallowed CORS method'),
+        (get_preflight_scope(b'https://example.org', b'GET', b'X-Secret'), b'Disallowed CORS headers'),
+))
+async def test_cors_middleware_disallowed_preflight(scope: dict, body: bytes) -> None:
+    messages = await call_app(CORSMiddleware(App(), allow_origins=['https://example.org']), scope)
+
+    assert messages[0]['status'] == 400
+    assert messages[1]['body'] == body
+
+
+async def test_cors_middleware_allow_all() -> None:
+    middleware = CORSMiddleware(App(), allow_origins=['*'], allow_methods=['*'], allow_headers=['*'])
+
+    simple = await call_app(middleware, make_scope(headers=[(b'origin', b'https://any.org')]))
+    preflight = await call_app(middleware, get_preflight_scope(b'https://any.org', b'PATCH', b'X-Anything'))
+
+    assert dict(simple[0]['headers'])[b'access-control-allow-origin'] == b'*'
+    assert b'vary' not in dict(simple[0]['headers'])
+    headers = dict(preflight[0]['headers'])
+    assert headers[b'access-control-allow-origin'] == b'*'
+    assert headers[b'access-control-allow-headers'] == b'X-Anything'
+    assert b'PATCH' in headers[b'access-control-allow-methods']
+
+
+async def test_cors_middleware_allow_all_with_credentials() -> None:
+    middleware = CORSMiddleware(App(), allow_origins=['*'], allow_credentials=True)
+
+    messages = await call_app(middleware, make_scope(headers=[(b'origin', b'https://any.org')]))
+
+    headers = dict(messages[0]['headers'])
+    assert headers[b'access-control-allow-origin'] == b'https://any.org'
+    assert headers[b'vary'] == b'Origin'
+
+
+async def test_cors_middleware_origin_regex() -> None:
+    middleware = CORSMiddleware(App(), allow_origin_regex=r'https://.*\.example\.org')
+
+    for _ in range(3):
+        allowed = await call_app(middleware, make_scope(headers=[(b'origin', b'https://api.example.org')]))
+    disallowed = await call_app(middleware, make_scope(headers=[(b'origin', b'https://example.org.evil')]))
+
+    assert dict(allowed[0]['headers'])[b'access-control-allow-origin'] == b'https://api.example.org'
+    assert b'access-control-allow-origin' not in dict(disallowed[0]['headers'])
+    assert middleware._match_origin.cache_info().hits == 2
+
+
+@pytest.mark.parametrize(
+    'headers, expected', (
+            (
+                    [(b'content-length', b'2')],
+                    [(b'content-length', b'2'), (b'access-control-allow-origin', b'https://example.org'),
+                     (b'vary', b'Origin')],
+            ),
+            (
+                    [(b'vary', b'Accept-Encoding'), (b'access-control-allow-origin', b'*')],
+                    [(b'vary', b'Accept-Encoding, Origin'), (b'access-control-allow-origin', b'https://example.org')],
+            ),
+            (
+                    [(b'vary', b'origin')],
+                    [(b'vary', b'origin'), (b'access-control-allow-origin', b'https://example.org')],
+            ),
+            (
+                    [(b'vary', b'*')],
+                    [(b'vary', b'*'), (b'access-control-allow-origin', b'https://example.org')],
+            ),
+    )
+)
+def test_merge_headers(headers: list, expected: list) -> None:
+    cors_headers = [(b'access-control-allow-origin', b'https://example.org'), (b'vary', b'Origin')]
+
+    assert merge_headers(headers, cors_headers) == expected
@@ -0,0 +1,99 @@
+import asyncio
+
+import pytest
+
+from speedy.middleware import ServerErrorMiddleware
+from speedy.types import Message
+from tests.helpers import make_scope, call_app
+
+
+async def failing_app(scope, receive, send) -> None:
+    raise RuntimeError('Broken endpoint')
+
+
+async def started_app(scope, receive, send) -> None:
+    await send({'type': 'http.response.start', 'status': 200, 'headers': []})
+    raise RuntimeError('Broken stream')
+
+
+async def test_server_error_middleware() -> None:
+    middleware = ServerErrorMiddleware(failing_app)
+    messages: list[Message] = []
+
+    with pytest.raises(RuntimeError):
+        await call_app(middleware, messages=messages)
+    messages[0]['headers'].append((b'x-mutated', b'1'))
+    with pytest.raises(RuntimeError):
+        await call_app(middleware, messages=messages)
+
+    assert messages[0]['status'] == 500
+    assert messages[1]['body'] == b'Internal Server Error'
+    assert dict(messages[2]['headers']) == {b'content-type': b'text/plain; charset=utf-8', b'content-length': b'21'}
+
+
+async def test_server_error_middleware_debug() -> None:
+    messages: list[Message] = []
+
+    with pytest.raises(RuntimeError):
+        await call_app(ServerErrorMiddleware(failing_app, debug=True), messages=messages)
+
+    assert messages[0]['status'] == 500
+    assert b'RuntimeError: Broken endpoint' in messages[1]['body']
+    assert b'Traceback' in messages[1]['body']
+
+
+async def test_server_error_middleware_started_response() -> None:
+    messages: list[Message] = []
+
+    with pytest.raises(RuntimeError):
+        await call_app(ServerErrorMiddleware(started_app), messages=messages)
+
+    assert [message['status'] for message in messages] == [200]
+
+
+async def test_server_error_middleware_concurrent_requests() -> None:
+    release = asyncio.Event()
+
+    async def app(scope, receive, send) -> None:
+        if scope['path'] == '/started':
+            await send({'type': 'http.response.start', 'status': 200, 'headers': []})
+            await release.wait()
+            await send({'type': 'http.response.body', 'body': b'ok', 'more_body': False})
+        else:
+            await release.wait()
+            raise RuntimeError
+
+    middleware = ServerErrorMiddleware(app)
+    started: list[Message] = []
+    failed: list[Message] = []
+
+    async def send_started(message: Message) -> None:
+        started.append(message)
+
+    async def send_failed(message: Message) -> None:
+        failed.append(message)
+
+    task = asyncio.gather(
+        middleware(make_scope('/started'), None, send_started),
+        middleware(make_scope(), None, send_failed),
+        return_exceptions=True
+    )
+    await asyncio.sleep(0)
+    release.set()
+    results = await task
+
+    assert results[0] is None
+    assert isinstance(results[1], RuntimeError)
+    assert failed[0]['status'] == 500
+
+
+async def test_server_error_middleware_passthrough() -> None:
+    messages: list[Message] = []
+
+    async def app(scope, receive, send) -> None:
+        await send({'type': 'http.response.start', 'status': 200, 'headers': []})
+        await send({'type': 'http.response.body', 'body': b'ok', 'more_body': False})
+
+    await call_app(ServerErrorMiddleware(app), messages=messages)
+
+    assert [message.get('status') for message in messages] == [200, None]
@@ -0,0 +1,126 @@
+import gzip
+import zlib
+
+import pytest
+
+from speedy.middleware import GZipMiddleware
+from speedy.middleware.gzip import get_content_coding
+from speedy.response import FileResponse
+from tests.helpers import make_scope, call_app
+
+BODY = b'x' * 1000
+
+
+def get_app(chunks: list[bytes], headers: list[tuple[bytes, bytes]] | None = None, status: int = 200):
+    async def app(scope, receive, send) -> None:
+        await send({
+            'type': 'http.response.start',
+            'status': status,
+            'headers': headers if headers is not None else [
+                (b'content-type', b'application/json'),
+                (b'content-length', str(sum(map(len, chunks))).encode()),
+                (b'etag', b'"v1"'),
+            ],
+        })
+        for index, chunk in enumerate(chunks):
+            await send({'type': 'http.response.body', 'body': chunk, 'more_body': index < len(chunks) - 1})
+
+    return GZipMiddleware(app)
+
+
+def get_scope(accept_encoding: bytes | None = b'gzip, deflate', **values) -> dict:
+    headers = [] if accept_encoding is None else [(b'accept-encoding', accept_encoding)]
+    return make_scope(headers=headers, **values)
+
+
+@pytest.mark.parametrize(
+    'accept_encoding, content_coding', (
+            ('gzip', 'gzip'),
+            ('deflate', 'deflate'),
+            ('deflate, gzip', 'gzip'),
+            ('gzip;q=0.5, deflate', 'deflate'),
+            ('gzip;q=0, deflate;q=0', None),
+            ('br', None),
+            ('*', 'gzip'),
+            ('*;q=0.1, gzip;q=0', 'deflate'),
+            ('identity', None),
+    )
+)
+def test_get_content_coding(accept_encoding: str, content_coding: str | None) -> None:
+    assert get_content_coding(accept_encoding) == content_coding
+
+
+@pytest.mark.parametrize(
+    'accept_encoding, decompress', (
+            (b'gzip', gzip.decompress),
+            (b'deflate', zlib.decompress),
+    )
+)
+async def test_gzip_middleware_compresses_body(accept_encoding: bytes, decompress) -> None:
+    messages = await call_app(get_app([BODY]), get_scope(accept_encoding))
+
+    headers = dict(messages[0]['headers'])
+    assert headers[b'content-encoding'] == accept_encoding
+    assert headers[b'vary'] == b'Accept-Encoding'
+    assert headers[b'etag'] == b'W/"v1"'
+    assert int(headers[b'content-length']) == len(messages[1]['body'])
+    assert decompress(messages[1]['body']) == BODY
+
+
+async def test_gzip_middleware_compresses_streamed_body() -> None:
+    chunks = [BODY, b'', BODY, b'end']
+    messages = await call_app(get_app(chunks), get_scope())
+
+    headers = dict(messages[0]['headers'])
+    assert headers[b'content-encoding'] == b'gzip'
+    assert b'content-length' not in headers
+    assert messages[-1]['more_body'] is False
+    assert gzip.decompress(b''.join(message['body'] for message in messages[1:])) == b''.join(chunks)
+
+
+@pytest.mark.parametrize(
+    'accept_encoding, chunks, headers, status', (
+            (None, [BODY], None, 200),
+            (b'br', [BODY], None, 200),
+            (b'gzip', [b'small'], None, 200),
+            (b'gzip', [BODY], [(b'content-type', b'image/png')], 200),
+            (b'gzip', [BODY], [(b'content-type', b'video/mp4')], 200),
+            (b'gzip', [BODY], [(b'content-encoding', b'br')], 200),
+            (b'gzip', [BODY], [(b'content-type', b'text/plain')], 206),
+    )
+)
+async def test_gzip_middleware_passthrough(
+        accept_encoding: bytes | None,
+        chunks: list[bytes],
+        headers: list | None,
+        status: int
+) -> None:
+    app = get_app(chunks, headers, status)
+    messages = await call_app(app, get_scope(accept_encoding))
+
+    assert dict(messages[0]['headers']).get(b'content-encoding') in (None, b'br')
+    assert b''.join(message['body'] for message in messages[1:]) == b''.join(chunks)
+
+
+@pytest.mark.parametrize('extension', ('http.response.pathsend', 'http.response.zerocopysend'))
+async def test_gzip_file_response_extension(tmp_path, extension) -> None:
+    path = tmp_path / 'notes.txt'
+    path.write_bytes(b'note\n' * 1000)
+    scope = get_scope(extensions={extension: {}})
+
+    start, message, *rest = await call_app(GZipMiddleware(FileResponse(path)), scope)
+
+    assert start['type'] == 'http.response.start'
+    assert b'content-encoding' not in dict(start['headers'])
+    assert dict(start['headers'])[b'content-length'] == b'5000'
+    assert message['type'] == extension
+
+
+async def test_gzip_file_response(tmp_path) -> None:
+    path = tmp_path / 'notes.txt'
+    path.write_bytes(b'note\n' * 1000)
+
+    start, *bodies = await call_app(GZipMiddleware(FileResponse(path)), get_scope())
+
+    assert dict(start['headers'])[b'content-encoding'] == b'gzip'
+    assert gzip.decompress(b''.join(message['body'] for message in bodies)) == b'note\n' * 1000
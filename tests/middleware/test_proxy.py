@@ -0,0 +1,100 @@
+import pytest
+
+from speedy.connection.request import Request
+from speedy.middleware import ProxyHeadersMiddleware
+from speedy.middleware.proxy import TrustedProxies
+from tests.helpers import make_scope
+
+
+def get_scope(
+        client: tuple[str, int] | None = ('10.0.0.1', 8000),
+        headers: list | None = None,
+        type: str = 'http'
+) -> dict:
+    return make_scope(
+        '/users',
+        headers=[(b'host', b'example.org'), *(headers or [])],
+        type=type,
+        scheme='ws' if type == 'websocket' else 'http',
+        client=client
+    )
+
+
+async def get_request(middleware: ProxyHeadersMiddleware, scope: dict) -> Request:
+    requests: list[Request] = []
+
+    async def app(scope, receive, send) -> None:
+        requests.append(Request(scope, receive, send))
+
+    middleware.app = app
+    await middleware(scope, None, None)
+    return requests[0]
+
+
+def test_trusted_proxies() -> None:
+    proxies = TrustedProxies(['127.0.0.1', '10.0.0.0/8', '::1', 'fd00::/8'])
+
+    assert '127.0.0.1' in proxies
+    assert '10.1.2.3' in proxies
+    assert '::1' in proxies
+    assert 'fd00::1' in proxies
+    assert '192.168.0.1' not in proxies
+    assert 'unix:/tmp/socket' not in proxies
+    assert '192.168.0.1' in TrustedProxies(['*'])
+
+
+async def test_proxy_headers_middleware() -> None:
+    middleware = ProxyHeadersMiddleware(None, trusted_hosts=['10.0.0.0/8'])
+    scope = get_scope(headers=[
+        (b'x-forwarded-for', b'203.0.113.7, 198.51.100.1'),
+        (b'x-forwarded-for', b'10.0.0.2'),
+        (b'x-forwarded-proto', b'https'),
+    ])
+
+    request = await get_request(middleware, scope)
+
+    assert request.client.host == '198.51.100.1'
+    assert str(request.url) == 'https://example.org/users'
+
+
+@pytest.mark.parametrize('client', (('192.168.0.1', 8000), None))
+async def test_proxy_headers_middleware_untrusted_client(client) -> None:
+    middleware = ProxyHeadersMiddleware(None, trusted_hosts=['10.0.0.0/8'])
+    scope = get_scope(client, [(b'x-forwarded-for', b'203.0.113.7'), (b'x-forwarded-proto', b'https')])
+
+    request = await get_request(middleware, scope)
+
+    assert scope['client'] == client
+    assert request.url.scheme == 'http'
+
+
+@pytest.mark.parametrize('forwarded_for, host', (
+        (b'10.0.0.3, 10.0.0.2', '10.0.0.3'),
+        (b' 203.0.113.7 ', '203.0.113.7'),
+))
+def test_get_client_host(forwarded_for: bytes, host: str) -> None:
+    middleware = ProxyHeadersMiddleware(None, trusted_hosts=['10.0.0.0/8'])
+
+    assert middleware.get_client_host(forwarded_for.decode()) == host
+
+
+@pytest.mark.parametrize('proto, scheme', ((b'https', 'wss'), (b'http', 'ws')))
+async def test_proxy_headers_middleware_websocket(proto: bytes, scheme: str) -> None:
+    async def app(scope, receive, send) -> None:
+        pass
+
+    middleware = ProxyHeadersMiddleware(app, trusted_hosts=['10.0.0.1'])
+    scope = get_scope(headers=[(b'x-forwarded-proto', proto)], type='websocket')
+
+    await middleware(scope, None, None)
+
+    assert scope['scheme'] == scheme
+
+
+async def test_proxy_headers_middleware_invalid_proto() -> None:
+    middleware = ProxyHeadersMiddleware(None, trusted_hosts=['10.0.0.1'])
+    scope = get_scope(headers=[(b'x-forwarded-proto', b'gopher')])
+
+    await get_request(middleware, scope)
+
+    assert scope['scheme'] == 'http'
@@ -0,0 +1,109 @@
+import pytest
+
+from speedy.middleware import RateLimitMiddleware
+from tests.helpers import Clock, make_scope, call_app
+
+
+async def app(scope, receive, send) -> None:
+    await send({'type': 'http.response.start', 'status': 200, 'headers': []})
+    await send({'type': 'http.response.body', 'body': b'ok', 'more_body': False})
+
+
+def get_scope(client: str | None = '127.0.0.1', **values) -> dict:
+    return make_scope(client=(client, 5000) if client is not None else None, **values)
+
+
+async def test_rate_limit_middleware() -> None:
+    clock = Clock()
+    middleware = RateLimitMiddleware(app, rate=0.5, burst=2, clock=clock)
+
+    statuses = [(await call_app(middleware, get_scope()))[0]['status'] for _ in range(3)]
+    assert statuses == [200, 200, 429]
+    assert (await call_app(middleware, get_scope('10.0.0.1')))[0]['status'] == 200
+
+    messages = await call_app(middleware, get_scope())
+    assert (b'retry-after', b'2') in messages[0]['headers']
+    assert messages[1]['body'] == b'Too Many Requests'
+
+    clock.now = 1
+    assert (b'retry-after', b'1') in (await call_app(middleware, get_scope()))[0]['headers']
+    clock.now = 2
+    assert (await call_app(middleware, get_scope()))[0]['status'] == 200
+
+
+async def test_rate_limit_middleware_keys() -> None:
+    middleware = RateLimitMiddleware(app, rate=1, burst=1, header='X-Api-Key')
+
+    assert (await call_app(middleware, get_scope(headers=[(b'x-api-key', b'a')])))[0]['status'] == 200
+    assert (await call_app(middleware, get_scope(headers=[(b'x-api-key', b'b')])))[0]['status'] == 200
+    assert (await call_app(middleware, get_scope(headers=[(b'x-api-key', b'a')])))[0]['status'] == 429
+    assert (await call_app(middleware, get_scope()))[0]['status'] == 200
+    assert (await call_app(middleware, get_scope()))[0]['status'] == 200
+
+    middleware = RateLimitMiddleware(app, rate=1, burst=1, key=lambda scope: scope['path'])
+    assert (await call_app(middleware, get_scope('1.1.1.1')))[0]['status'] == 200
+    assert (await call_app(middleware, get_scope('2.2.2.2')))[0]['status'] == 429
+
+
+async def test_rate_limit_middleware_without_client() -> None:
+    middleware = RateLimitMiddleware(app, rate=1, burst=1)
+    for _ in range(3):
+        assert (await call_app(middleware, get_scope(None)))[0]['status'] == 200
+    assert len(middleware) == 0
+
+
+def test_rate_limit_sweep() -> None:
+    clock = Clock()
+    middleware = RateLimitMiddleware(app, rate=1, burst=5, shards=4, clock=clock)
+
+    for index in range(10):
+        clock.now = index
+        middleware.acquire(index)
+
+    clock.now = 12
+    assert middleware.sweep() == 8
+    assert len(middleware) == 2
+
+
+def test_rate_limit_max_keys() -> None:
+    middleware = RateLimitMiddleware(app, rate=1, shards=1, max_keys=3)
+
+    for key in range(5):
+        middleware.acquire(key)
+
+    assert list(middleware.shards[0]) == [2, 3, 4]
+
+
+@pytest.mark.parametrize(
+    'options', (
+            {'rate': 0},
+            {'rate': 1, 'sweep_batch': 0},
+            {'rate': 1, 'header': 'X-Api-Key', 'key': lambda scope: None},
+    )
+)
+def test_rate_limit_middleware_invalid(options: dict) -> None:
+    with pytest.raises(ValueError):
+        RateLimitMiddleware(app, **options)
+
+
+def test_rate_limit_sweep_step() -> None:
+    clock = Clock()
+    middleware = RateLimitMiddleware(app, rate=1, burst=1, shards=2, sweep_batch=2, clock=clock)
+
+    for key in range(8):
+        middleware.shards[key % 2][key] = 1.0, 0.0
+    clock.now = 10
+
+    assert [middleware.sweep_step() for _ in range(5)] == [2, 2, 0, 2, 2]
+    assert len(middleware) == 0
+
+
+async def test_rate_limit_middleware_sweeps_on_request() -> None:
+    clock = Clock()
+    middleware = RateLimitMiddleware(app, rate=1, burst=1, shards=1, clock=clock)
+
+    await call_app(middleware, get_scope('10.0.0.1'))
+    clock.now = 10
+    await call_app(middleware, get_scope('10.0.0.2'))
+
+    assert list(middleware.shards[0]) == ['10.0.0.2']
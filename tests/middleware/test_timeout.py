@@ -0,0 +1,150 @@
+import asyncio
+import time
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockFixture
+
+from speedy.concurrency import (
+    DEADLINE,
+    sync_to_thread,
+    sync_to_thread_before_deadline,
+    check_deadline,
+    get_remaining_time
+)
+from speedy.connection.request import Request
+from speedy.exceptions import DeadlineException
+from speedy.middleware import TimeoutMiddleware
+from speedy.response import FileResponse
+from speedy.response.file import open_file
+from speedy.types import Message
+from tests.helpers import make_scope, call_app
+
+
+async def ok_app(scope, receive, send) -> None:
+    assert 0 < get_remaining_time() <= 1
+    await send({'type': 'http.response.start', 'status': 200, 'headers': []})
+    await send({'type': 'http.response.body', 'body': b'ok', 'more_body': False})
+
+
+async def slow_app(scope, receive, send) -> None:
+    await asyncio.sleep(1)
+
+
+@pytest.mark.parametrize('status_code, body', ((504, b'Gateway Timeout'), (503, b'Service Unavailable')))
+async def test_timeout_middleware(status_code: int, body: bytes) -> None:
+    messages = await call_app(TimeoutMiddleware(slow_app, 0.01, status_code=status_code))
+
+    assert messages[0]['status'] == status_code
+    assert messages[1]['body'] == body
+    assert DEADLINE.get() is None
+
+
+async def test_timeout_middleware_in_time() -> None:
+    messages = await call_app(TimeoutMiddleware(ok_app, 1))
+
+    assert messages[0]['status'] == 200
+    assert DEADLINE.get() is None
+
+
+async def test_timeout_middleware_started_response() -> None:
+    async def app(scope, receive, send) -> None:
+        await send({'type': 'http.response.start', 'status': 200, 'headers': []})
+        await asyncio.sleep(1)
+
+    with pytest.raises(TimeoutError):
+        await call_app(TimeoutMiddleware(app, 0.01))
+
+
+async def test_timeout_middleware_keeps_outer_deadline() -> None:
+    deadlines: list[float] = []
+
+    async def app(scope, receive, send) -> None:
+        deadlines.append(DEADLINE.get())
+        await ok_app(scope, receive, send)
+
+    outer = TimeoutMiddleware(TimeoutMiddleware(app, 10), 0.5)
+    await call_app(outer)
+
+    assert deadlines[0] - time.monotonic() <= 0.5
+
+
+async def test_timeout_middleware_sync_to_thread() -> None:
+    calls: list[int] = []
+
+    async def app(scope, receive, send) -> None:
+        while True:
+            await sync_to_thread_before_deadline(time.sleep, 0.005)
+            calls.append(1)
+
+    messages = await call_app(TimeoutMiddleware(app, 0.02))
+
+    assert messages[0]['status'] == 504
+    assert len(calls) < 10
+
+
+async def test_timeout_middleware_request_stream() -> None:
+    async def receive() -> Message:
+        time.sleep(0.02)
+        return {'type': 'http.request', 'body': b'chunk', 'more_body': True}
+
+    async def app(scope, receive, send) -> None:
+        await Request(scope, receive).body()
+
+    scope = {**make_scope(), 'method': 'POST'}
+    messages: list[Message] = []
+
+    async def send(message: Message) -> None:
+        messages.append(message)
+
+    await TimeoutMiddleware(app, 0.01)(scope, receive, send)
+    assert messages[0]['status'] == 504
+
+
+async def test_sync_to_thread_after_deadline() -> None:
+    token = DEADLINE.set(time.monotonic() - 1)
+    try:
+        assert await sync_to_thread(len, b'ok') == 2
+        with pytest.raises(DeadlineException):
+            await sync_to_thread_before_deadline(len, b'ok')
+    finally:
+        DEADLINE.reset(token)
+
+
+async def test_timeout_middleware_file_response(tmp_path: Path, mocker: MockFixture) -> None:
+    path = tmp_path / 'file.bin'
+    path.write_bytes(b'x' * 64 * 1024)
+    files = []
+
+    def record_open_file(path):
+        file, stat_result = open_file(path)
+        files.append(file)
+        return file, stat_result
+
+    mocker.patch('speedy.response.file.open_file', side_effect=record_open_file)
+
+    async def send(message: Message) -> None:
+        await asyncio.sleep(0.02)
+
+    middleware = TimeoutMiddleware(FileResponse(path, chunk_size=1024), 0.05)
+    with pytest.raises(TimeoutError) as exc_info:
+        await middleware(make_scope(), None, send)
+
+    assert type(exc_info.value) is TimeoutError
+    assert files[0].closed
+
+
+def test_check_deadline() -> None:
+    check_deadline()
+    token = DEADLINE.set(time.monotonic() - 1)
+    try:
+        with pytest.raises(DeadlineException):
+            check_deadline()
+    finally:
+        DEADLINE.reset(token)
+
+
+@pytest.mark.parametrize('options', ({'timeout': 0}, {'timeout': 1, 'status_code': 500}))
+def test_timeout_middleware_invalid(options: dict) -> None:
+    with pytest.raises(ValueError):
+        TimeoutMiddleware(ok_app, **options)
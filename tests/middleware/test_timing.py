@@ -0,0 +1,120 @@
+import pytest
+
+from speedy.connection.request import Request
+from speedy.endpoints import HTTPEndpoint
+from speedy.middleware import ServerTimingMiddleware
+from speedy.response import PlainTextResponse
+from speedy.routing import Router, Route
+from speedy.timing import RequestTiming, TIMING, get_timing
+from speedy.types import Message
+from tests.helpers import make_scope, call_app
+
+
+async def form_endpoint(request: Request) -> PlainTextResponse:
+    form = await request.form()
+    return PlainTextResponse(form['name'])
+
+
+class FormEndpoint(HTTPEndpoint):
+    async def post(self, request: Request) -> PlainTextResponse:
+        form = await request.form()
+        return PlainTextResponse(form['name'])
+
+
+def get_server_timing(message: Message) -> dict[str, float]:
+    value = dict(message['headers'])[b'server-timing'].decode('latin-1')
+    metrics = {}
+    for metric in value.split(', '):
+        name, duration = metric.split(';dur=')
+        metrics[name] = float(duration)
+    return metrics
+
+
+@pytest.mark.parametrize('endpoint', (form_endpoint, FormEndpoint))
+async def test_server_timing_middleware(endpoint) -> None:
+    timings: list[RequestTiming] = []
+    router = Router([Route('/users/{id:int}', endpoint, methods=['POST'])])
+    app = ServerTimingMiddleware(router, callback=timings.append)
+    scope = make_scope('/users/1', 'POST', headers=[(b'content-type', b'application/x-www-form-urlencoded')])
+
+    messages = await call_app(app, scope, b'name=speedy')
+
+    assert messages[1]['body'] == b'speedy'
+    assert list(get_server_timing(messages[0])) == ['route', 'body', 'form', 'handler', 'app']
+    [timing] = timings
+    assert timing.method == 'POST'
+    assert timing.path == '/users/1'
+    assert timing.route == '/users/{id}'
+    assert timing.status == 200
+    assert timing.start <= timing.response_start <= timing.response_end
+    assert timing.duration >= timing.phases['handler'] >= timing.phases['form']
+    assert TIMING.get() is None
+
+
+async def test_server_timing_middleware_without_header() -> None:
+    timings: list[RequestTiming] = []
+
+    async def callback(timing: RequestTiming) -> None:
+        timings.append(timing)
+
+    app = ServerTimingMiddleware(Router([Route('/', form_endpoint)]), header=False, callback=callback)
+
+    messages = await call_app(app, make_scope('/missing', 'POST'))
+
+    assert messages[0]['status'] == 404
+    assert b'server-timing' not in dict(messages[0]['headers'])
+    assert timings[0].route is None
+    assert timings[0].status == 404
+    assert list(timings[0].phases) == ['route']
+
+
+async def test_server_timing_middleware_failure() -> None:
+    timings: list[RequestTiming] = []
+
+    async def app(scope, receive, send) -> None:
+        assert get_timing().path == '/'
+        raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        await call_app(ServerTimingMiddleware(app, callback=timings.append), make_scope(method='POST'))
+
+    assert timings[0].status is None
+    assert timings[0].duration is None
+
+
+async def test_server_timing_middleware_on_start() -> None:
+    events: list[str] = []
+
+    class Callback:
+        def __call__(self, timing: RequestTiming) -> None:
+            events.append('callback')
+
+        def start(self, timing: RequestTiming) -> None:
+            events.append('callback start')
+
+    async def app(scope, receive, send) -> None:
+        events.append('app')
+
+    await call_app(ServerTimingMiddleware(app, callback=Callback()))
+    await call_app(ServerTimingMiddleware(app, callback=Callback(), on_start=lambda timing: events.append('start')))
+
+    assert events == ['app', 'callback', 'start', 'app', 'callback']
+
+
+async def test_request_without_timing() -> None:
+    router = Router([Route('/', form_endpoint, methods=['POST'])])
+    scope = make_scope(method='POST', headers=[(b'content-type', b'application/x-www-form-urlencoded')])
+
+    messages = await call_app(router, scope, b'name=speedy')
+
+    assert messages[1]['body'] == b'speedy'
+    assert b'server-timing' not in dict(messages[0]['headers'])
+
+
+def test_request_timing_server_timing() -> None:
+    timing = RequestTiming('GET', '/', start=1.0)
+    timing.phases['route'] = 0.0005
+    timing.response_start = 1.25
+
+    assert timing.get_server_timing() == 'route;dur=0.500, app;dur=250.000'
+    assert timing.duration is None
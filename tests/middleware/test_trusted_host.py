@@ -0,0 +1,58 @@
+import pytest
+
+from speedy.middleware import TrustedHostMiddleware
+from speedy.middleware.trusted_host import get_hostname
+from tests.helpers import make_scope, call_app
+
+
+async def ok_app(scope, receive, send) -> None:
+    await send({'type': 'http.response.start', 'status': 200, 'headers': []})
+    await send({'type': 'http.response.body', 'body': b'ok', 'more_body': False})
+
+
+def get_scope(host: bytes | None, **values) -> dict:
+    return make_scope(headers=[(b'host', host)] if host is not None else [], **values)
+
+
+@pytest.mark.parametrize('host, status', (
+        (b'example.org', 200),
+        (b'EXAMPLE.org:8000', 200),
+        (b'api.example.org', 200),
+        (b'a.b.example.org', 200),
+        (b'api-1.internal', 200),
+        (b'[::1]:8000', 200),
+        (b'example.org.evil', 400),
+        (b'evil.org', 400),
+        (None, 400),
+))
+async def test_trusted_host_middleware(host: bytes | None, status: int) -> None:
+    middleware = TrustedHostMiddleware(ok_app, allowed_hosts=['example.org', '*.example.org', 'api-*.internal', '[::1]'])
+
+    messages = await call_app(middleware, get_scope(host))
+
+    assert messages[0]['status'] == status
+    if status == 400:
+        assert messages[1]['body'] == b'Invalid host header'
+
+
+async def test_trusted_host_middleware_allow_all() -> None:
+    messages = await call_app(TrustedHostMiddleware(ok_app), get_scope(b'anything'))
+
+    assert messages[0]['status'] == 200
+
+
+async def test_trusted_host_middleware_websocket() -> None:
+    middleware = TrustedHostMiddleware(ok_app, allowed_hosts=['example.org'])
+
+    messages = await call_app(middleware, get_scope(b'evil.org', type='websocket'))
+
+    assert messages == [{'type': 'websocket.close', 'code': 1008}]
+
+
+@pytest.mark.parametrize('host, hostname', (
+        (b'Example.org', 'example.org'),
+        (b'example.org:443', 'example.org'),
+        (b'[::1]:8000', '[::1]'),
+))
+def test_get_hostname(host: bytes, hostname: str) -> None:
+    assert get_hostname(host) == hostname
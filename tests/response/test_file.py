@@ -0,0 +1,228 @@
+import asyncio
+import os
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockFixture
+
+from speedy.response import FileResponse
+from speedy.response.file import StatCache, parse_range_header, open_file
+from speedy.types import Message
+from tests.helpers import Clock, make_scope, call_app
+
+CONTENT = bytes(range(256)) * 40
+
+
+@pytest.fixture(autouse=True)
+def clear_stat_cache() -> None:
+    FileResponse.stat_cache.clear()
+
+
+@pytest.fixture
+def path(tmp_path: Path) -> Path:
+    path = tmp_path / 'video.bin'
+    path.write_bytes(CONTENT)
+    return path
+
+
+def get_body(messages: list[Message]) -> bytes:
+    return b''.join(message['body'] for message in messages if message['type'] == 'http.response.body')
+
+
+@pytest.mark.parametrize('value, expected', (
+        ('bytes=0-99', [(0, 100)]),
+        ('bytes=100-', [(100, 1000)]),
+        ('bytes=-100', [(900, 1000)]),
+        ('bytes=0-9999', [(0, 1000)]),
+        ('bytes=500-599, 0-99', [(0, 100), (500, 600)]),
+        ('bytes=0-99,50-199,200-299', [(0, 300)]),
+        ('bytes=1000-', []),
+        ('bytes=-0', []),
+        ('items=0-99', None),
+        ('bytes=99-0', None),
+        ('bytes=abc', None),
+        ('bytes=' + ','.join(f'{index * 10}-{index * 10 + 1}' for index in range(17)), None),
+))
+def test_parse_range_header(value, expected) -> None:
+    assert parse_range_header(value, 1000) == expected
+
+
+async def test_file_response(path) -> None:
+    start, *bodies = await call_app(FileResponse(path, chunk_size=1000))
+
+    assert start['status'] == 200
+    headers = dict(start['headers'])
+    assert headers[b'content-length'] == str(len(CONTENT)).encode()
+    assert headers[b'accept-ranges'] == b'bytes'
+    assert headers[b'etag'].startswith(b'"')
+    assert b'last-modified' in headers
+    assert len(bodies) == 12
+    assert get_body(bodies) == CONTENT
+    assert bodies[-1]['more_body'] is False
+
+
+async def test_file_response_filename(path) -> None:
+    start, *_ = await call_app(FileResponse(path, filename='résumé.pdf'))
+
+    headers = dict(start['headers'])
+    assert headers[b'content-type'] == b'application/pdf'
+    assert headers[b'content-disposition'] == b"attachment; filename*=utf-8''r%C3%A9sum%C3%A9.pdf"
+
+
+async def test_file_response_not_found(tmp_path) -> None:
+    start, body = await call_app(FileResponse(tmp_path / 'missing.bin'))
+
+    assert start['status'] == 404
+    assert body['body'] == b'Not Found'
+
+
+async def test_file_response_head(path) -> None:
+    start, body = await call_app(FileResponse(path), make_scope(method='HEAD'))
+
+    assert dict(start['headers'])[b'content-length'] == str(len(CONTENT)).encode()
+    assert body == {'type': 'http.response.body', 'body': b'', 'more_body': False}
+
+
+async def test_file_response_not_modified(path) -> None:
+    start, *_ = await call_app(FileResponse(path))
+    etag = dict(start['headers'])[b'etag']
+
+    start, body = await call_app(FileResponse(path), make_scope(headers=[(b'if-none-match', etag)]))
+
+    assert start['status'] == 304
+    assert dict(start['headers'])[b'etag'] == etag
+    assert body['body'] == b''
+
+
+async def test_file_response_range(path) -> None:
+    start, *bodies = await call_app(FileResponse(path), make_scope(headers=[(b'range', b'bytes=100-199')]))
+
+    assert start['status'] == 206
+    headers = dict(start['headers'])
+    assert headers[b'content-range'] == f'bytes 100-199/{len(CONTENT)}'.encode()
+    assert headers[b'content-length'] == b'100'
+    assert get_body(bodies) == CONTENT[100:200]
+
+
+async def test_file_response_multipart_range(path) -> None:
+    start, *bodies = await call_app(FileResponse(path), make_scope(headers=[(b'range', b'bytes=0-9,-10')]))
+
+    assert start['status'] == 206
+    headers = dict(start['headers'])
+    content_type = headers[b'content-type'].decode()
+    assert content_type.startswith('multipart/byteranges; boundary=')
+    boundary = content_type.partition('boundary=')[2].encode()
+    body = get_body(bodies)
+    assert len(body) == int(headers[b'content-length'])
+    assert body == (
+            b'--' + boundary + b'\r\nContent-Type: application/octet-stream\r\n'
+            + f'Content-Range: bytes 0-9/{len(CONTENT)}\r\n\r\n'.encode() + CONTENT[:10]
+            + b'\r\n--' + boundary + b'\r\nContent-Type: application/octet-stream\r\n'
+            + f'Content-Range: bytes {len(CONTENT) - 10}-{len(CONTENT) - 1}/{len(CONTENT)}\r\n\r\n'.encode()
+            + CONTENT[-10:]
+            + b'\r\n--' + boundary + b'--\r\n'
+    )
+
+
+async def test_file_response_range_not_satisfiable(path) -> None:
+    scope = make_scope(headers=[(b'range', f'bytes={len(CONTENT)}-'.encode())])
+    start, body = await call_app(FileResponse(path), scope)
+
+    assert start['status'] == 416
+    assert dict(start['headers'])[b'content-range'] == f'bytes */{len(CONTENT)}'.encode()
+    assert body['body'] == b''
+
+
+async def test_file_response_if_range_mismatch(path) -> None:
+    start, *bodies = await call_app(
+        FileResponse(path),
+        make_scope(headers=[(b'range', b'bytes=0-9'), (b'if-range', b'"outdated"')])
+    )
+
+    assert start['status'] == 200
+    assert get_body(bodies) == CONTENT
+
+
+async def test_file_response_pathsend(path) -> None:
+    start, message = await call_app(FileResponse(path), make_scope(extensions={'http.response.pathsend': {}}))
+
+    assert start['status'] == 200
+    assert message == {'type': 'http.response.pathsend', 'path': os.path.abspath(path)}
+
+
+async def test_file_response_zerocopysend(path) -> None:
+    start, *messages = await call_app(
+        FileResponse(path),
+        make_scope(headers=[(b'range', b'bytes=10-19')], extensions={'http.response.zerocopysend': {}})
+    )
+
+    assert start['status'] == 206
+    zerocopy, end = messages
+    assert zerocopy['type'] == 'http.response.zerocopysend'
+    assert (zerocopy['offset'], zerocopy['count']) == (10, 10)
+    assert zerocopy['file'].name == str(path)
+    assert zerocopy['file'].closed
+    assert end == {'type': 'http.response.body', 'body': b'', 'more_body': False}
+
+
+async def test_file_response_outdated_stat_cache(path) -> None:
+    await call_app(FileResponse(path))
+    path.write_bytes(b'changed')
+
+    start, *bodies = await call_app(FileResponse(path))
+
+    headers = dict(start['headers'])
+    assert headers[b'content-length'] == b'7'
+    assert get_body(bodies) == b'changed'
+    assert FileResponse.stat_cache.get(str(path)).st_size == 7
+
+
+async def test_file_response_outdated_stat_cache_head(path) -> None:
+    await call_app(FileResponse(path))
+    path.write_bytes(b'changed')
+
+    start, body = await call_app(FileResponse(path), make_scope(method='HEAD'))
+
+    assert dict(start['headers'])[b'content-length'] == str(len(CONTENT)).encode()
+    assert body['body'] == b''
+
+
+async def test_stat_cache(path) -> None:
+    clock = Clock()
+    cache = StatCache(ttl=1.0, max_size=2, clock=clock)
+
+    stat_result = await cache.stat(str(path))
+    path.write_bytes(b'changed')
+    assert await cache.stat(str(path)) is stat_result
+
+    clock.now = 1.0
+    assert (await cache.stat(str(path))).st_size == len(b'changed')
+
+    cache.set('a', stat_result)
+    cache.set('b', stat_result)
+    assert len(cache) == 2
+    assert cache.get(str(path)) is None
+
+
+async def test_file_response_cancelled_closes_file(path, mocker: MockFixture) -> None:
+    files = []
+
+    def record_open_file(path):
+        file, stat_result = open_file(path)
+        files.append(file)
+        return file, stat_result
+
+    mocker.patch('speedy.response.file.open_file', side_effect=record_open_file)
+    is_sending = asyncio.Event()
+
+    async def send(message: Message) -> None:
+        is_sending.set()
+        await asyncio.sleep(1)
+
+    task = asyncio.ensure_future(FileResponse(path, chunk_size=100)(make_scope(), None, send))
+    await is_sending.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert files[0].closed
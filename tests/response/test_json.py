@@ -0,0 +1,119 @@
+import dataclasses
+import datetime
+import enum
+import json
+import uuid
+
+import pytest
+
+from speedy.response import JSONResponse
+from speedy.utils.serializers import JSON_BACKENDS, DEFAULT_JSON_BACKEND, get_json_encoder
+
+
+class Color(enum.Enum):
+    RED = 'red'
+
+
+@dataclasses.dataclass
+class User:
+    id: int
+    name: str
+    created: datetime.datetime
+
+
+CONTENT = {
+    'user': User(1, 'Ёлка', datetime.datetime(2024, 5, 1, 12, 30, 15, 250)),
+    'date': datetime.date(2024, 5, 1),
+    'color': Color.RED,
+    'id': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+    'tags': {'a'},
+    'path': '/users',
+    'values': (1, 2.5, None, True),
+}
+EXPECTED = {
+    'user': {'id': 1, 'name': 'Ёлка', 'created': '2024-05-01T12:30:15.000250'},
+    'date': '2024-05-01',
+    'color': 'red',
+    'id': '12345678-1234-5678-1234-567812345678',
+    'tags': ['a'],
+    'path': '/users',
+    'values': [1, 2.5, None, True],
+}
+
+
+def test_default_json_backend() -> None:
+    assert DEFAULT_JSON_BACKEND == JSON_BACKENDS[0]
+    assert JSON_BACKENDS[-1] == 'json'
+
+
+@pytest.mark.parametrize('backend', JSON_BACKENDS)
+def test_json_encoder(backend: str) -> None:
+    encode = get_json_encoder(backend)
+
+    body = encode(CONTENT)
+
+    assert isinstance(body, bytes)
+    assert json.loads(body) == EXPECTED
+    assert 'Ёлка'.encode() in body
+    assert b' ' not in encode([1, {'a': 2}])
+
+
+@pytest.mark.parametrize('backend', JSON_BACKENDS)
+def test_json_encoder_options(backend: str) -> None:
+    encode = get_json_encoder(backend, sort_keys=True, non_str_keys=True)
+
+    assert encode({'b': 1, 'a': 2}) == b'{"a":2,"b":1}'
+    assert encode({1: 'a'}) == b'{"1":"a"}'
+    assert get_json_encoder(backend, sort_keys=True, non_str_keys=True) is encode
+
+
+@pytest.mark.parametrize('backend', JSON_BACKENDS)
+@pytest.mark.parametrize(
+    'content, body', (
+            ({1: 'a', None: 'b', 2.5: 'c'}, b'{"1":"a","null":"b","2.5":"c"}'),
+            ([2 ** 70, -2 ** 64], b'[1180591620717411303424,-18446744073709551616]'),
+            ({'value': None}, b'{"value":null}'),
+    )
+)
+def test_json_encoder_same_output(backend: str, content, body: bytes) -> None:
+    assert get_json_encoder(backend)(content) == body
+
+
+@pytest.mark.parametrize('backend', JSON_BACKENDS)
+@pytest.mark.parametrize('value', (float('nan'), float('inf'), float('-inf')))
+def test_json_encoder_non_finite(backend: str, value: float) -> None:
+    @dataclasses.dataclass
+    class Point:
+        x: float
+
+    body = get_json_encoder(backend)({'value': [value, 1.5], 'point': Point(value)})
+
+    assert body == b'{"value":[null,1.5],"point":{"x":null}}'
+
+
+@pytest.mark.parametrize('backend', JSON_BACKENDS)
+def test_json_encoder_unsupported(backend: str) -> None:
+    with pytest.raises(TypeError):
+        get_json_encoder(backend)({'value': object()})
+
+
+def test_json_encoder_unknown_backend() -> None:
+    with pytest.raises(ValueError):
+        get_json_encoder('simplejson')
+
+
+def test_json_response() -> None:
+    response = JSONResponse({'message': 'ok'})
+
+    assert response.body == b'{"message":"ok"}'
+    assert response.headers['content-type'] == 'application/json'
+    assert response.headers['content-length'] == '16'
+
+
+def test_json_response_subclass() -> None:
+    class SortedJSONResponse(JSONResponse):
+        backend = 'json'
+        sort_keys = True
+
+    assert SortedJSONResponse({'b': 1, 'a': None}).body == b'{"a":null,"b":1}'
+    assert JSONResponse.encoder is get_json_encoder(DEFAULT_JSON_BACKEND)
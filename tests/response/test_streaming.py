@@ -0,0 +1,115 @@
+import asyncio
+import threading
+
+import pytest
+
+from speedy.background import BackgroundTask
+from speedy.response import StreamingResponse
+from speedy.types import Message
+from tests.helpers import call_app
+
+
+async def async_rows(count: int):
+    for index in range(count):
+        yield f'{index},row\n'
+
+
+def sync_rows(count: int):
+    for index in range(count):
+        yield f'{index},row\n'.encode()
+
+
+@pytest.mark.parametrize('content', (async_rows(1000), sync_rows(1000)))
+async def test_streaming_response(content) -> None:
+    messages = await call_app(StreamingResponse(content, media_type='text/csv', buffer_size=1024, batch_size=16))
+
+    start, *bodies = messages
+    assert start['status'] == 200
+    headers = dict(start['headers'])
+    assert headers[b'content-type'] == b'text/csv; charset=utf-8'
+    assert b'content-length' not in headers
+    assert b''.join(body['body'] for body in bodies) == ''.join(f'{index},row\n' for index in range(1000)).encode()
+    assert [body['more_body'] for body in bodies] == [True] * (len(bodies) - 1) + [False]
+    assert all(1024 <= len(body['body']) < 1024 + 16 for body in bodies[:-1])
+
+
+async def test_streaming_response_large_chunks() -> None:
+    chunks = [b'a' * 10, b'b' * 2000, b'c' * 10]
+
+    messages = await call_app(StreamingResponse(iter(chunks), buffer_size=1024))
+
+    assert [message['body'] for message in messages[1:]] == [b'a' * 10 + b'b' * 2000, b'c' * 10]
+
+
+async def test_streaming_response_empty() -> None:
+    messages = await call_app(StreamingResponse([]))
+
+    assert messages[1:] == [{'type': 'http.response.body', 'body': b'', 'more_body': False}]
+
+
+async def test_streaming_response_sync_batches() -> None:
+    threads = set()
+
+    def rows():
+        for index in range(100):
+            threads.add(threading.current_thread())
+            yield b'x'
+
+    messages = await call_app(StreamingResponse(rows(), batch_size=10))
+
+    assert threading.current_thread() not in threads
+    assert messages[-1]['body'] == b'x' * 100
+
+
+async def test_streaming_response_disconnect() -> None:
+    disconnect = asyncio.Event()
+    is_closed = False
+    tasks = []
+
+    async def endless():
+        nonlocal is_closed
+        try:
+            index = 0
+            while True:
+                index += 1
+                if index == 10:
+                    disconnect.set()
+                await asyncio.sleep(0)
+                yield b'x' * 100
+        finally:
+            is_closed = True
+
+    async def receive() -> Message:
+        await disconnect.wait()
+        return {'type': 'http.disconnect'}
+
+    response = StreamingResponse(endless(), buffer_size=100, background=BackgroundTask(tasks.append, 1))
+    messages = await asyncio.wait_for(call_app(response, receive=receive), 1)
+
+    assert is_closed
+    assert 0 < len(messages) < 20
+    assert messages[-1]['more_body'] is True
+    assert tasks == []
+
+
+async def test_streaming_response_error() -> None:
+    async def broken():
+        yield b'x'
+        raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        await call_app(StreamingResponse(broken()))
+
+
+async def test_streaming_response_background() -> None:
+    tasks = []
+
+    await call_app(StreamingResponse(async_rows(1), background=BackgroundTask(tasks.append, 1)))
+
+    assert tasks == [1]
+
+
+@pytest.mark.parametrize('kwargs', ({'buffer_size': 0}, {'batch_size': 0}))
+def test_streaming_response_invalid_sizes(kwargs: dict) -> None:
+    with pytest.raises(ValueError):
+        StreamingResponse([], **kwargs)
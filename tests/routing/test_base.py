@@ -0,0 +1,61 @@
+import uuid
+
+import pytest
+
+from speedy.exceptions import ConvertorTypeException, EmptyException, PathException
+from speedy.routing.base import CompilePath
+
+
+@pytest.mark.parametrize(
+    'path, path_format', (
+            ('/', '/'),
+            ('/users/{user_id:int}', '/users/{user_id}'),
+            ('/users/{user_id:int}/posts/{slug}', '/users/{user_id}/posts/{slug}'),
+            ('/files/{name}.{ext}', '/files/{name}.{ext}'),
+            ('{subdomain}.example.com', '{subdomain}.example.com'),
+    )
+)
+def test_compile_path_format(path: str, path_format: str) -> None:
+    assert CompilePath(path).path_format == path_format
+
+
+@pytest.mark.parametrize(
+    'path, path_params, expected', (
+            ('/', {}, '/'),
+            ('/users/{user_id:int}', {'user_id': 42}, '/users/42'),
+            ('/users/{user_id:int}/posts/{slug}', {'user_id': '7', 'slug': 'hello'}, '/users/7/posts/hello'),
+            ('/files/{name}.{ext}', {'name': 'report', 'ext': 'pdf'}, '/files/report.pdf'),
+            ('/files/{path:path}', {'path': 'a/b/c'}, '/files/a/b/c'),
+            ('/price/{value:float}', {'value': 1.5}, '/price/1.5'),
+            ('/items/{item_id:uuid}', {'item_id': uuid.UUID(int=1)}, '/items/00000000-0000-0000-0000-000000000001'),
+    )
+)
+def test_compile_path_formatter(path: str, path_params: dict, expected: str) -> None:
+    path_formatter = CompilePath(path).path_formatter
+    assert path_formatter.accepts(path_params)
+    assert path_formatter(path_params) == expected
+
+
+def test_compile_path_formatter_accepts() -> None:
+    path_formatter = CompilePath('/users/{user_id:int}').path_formatter
+    assert not path_formatter.accepts({})
+    assert not path_formatter.accepts({'user_id': 1, 'extra': 2})
+
+
+@pytest.mark.parametrize(
+    'path, path_params, exception', (
+            ('/users/{username}', {'username': 'a/b'}, PathException),
+            ('/users/{username}', {'username': ''}, EmptyException),
+            ('/users/{user_id:int}', {'user_id': -1}, EmptyException),
+    )
+)
+def test_compile_path_formatter_invalid_params(path: str, path_params: dict, exception: type[Exception]) -> None:
+    with pytest.raises(exception):
+        CompilePath(path).path_formatter(path_params)
+
+
+def test_compile_path_errors() -> None:
+    with pytest.raises(ValueError):
+        CompilePath('/users/{user_id}/{user_id}')
+    with pytest.raises(ConvertorTypeException):
+        CompilePath('/users/{user_id:unknown}')
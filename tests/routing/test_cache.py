@@ -0,0 +1,99 @@
+import pytest
+
+from speedy import Match
+from speedy.response import PlainTextResponse
+from speedy.routing import Router, Route
+from speedy.routing.cache import RouteCache, CacheInfo
+from tests.helpers import make_scope
+
+
+def endpoint(request):
+    return PlainTextResponse('endpoint')
+
+
+def get_scope(path: str, method: str = 'GET', host: bytes = b'example.com', **values) -> dict:
+    return make_scope(path, method, [(b'host', host)], **values)
+
+
+def test_route_cache_hits_and_misses() -> None:
+    router = Router([Route('/users/{user_id:int}', endpoint)], cache_size=2)
+
+    first = router.match(get_scope('/users/1'))
+    second = router.match(get_scope('/users/1'))
+
+    assert first is second
+    assert first[2]['path_params'] == {'user_id': 1}
+    assert router.cache.cache_info() == CacheInfo(hits=1, misses=1, maxsize=2, currsize=1)
+
+
+def test_route_cache_key() -> None:
+    router = Router([Route('/users/{user_id:int}', endpoint, methods=['GET', 'POST'])], cache_size=8)
+
+    router.match(get_scope('/users/1'))
+    router.match(get_scope('/users/1', method='POST'))
+    router.match(get_scope('/users/1', host=b'api.example.com:8000'))
+
+    assert router.cache.cache_info().misses == 3
+    assert len(router.cache) == 3
+
+
+def test_route_cache_route_path() -> None:
+    router = Router([Route('/users/{user_id:int}', endpoint)], cache_size=8)
+
+    first = router.match(get_scope('/api/users/1', root_path='/api'))
+    second = router.match(get_scope('/v2/users/1', root_path='/v2'))
+
+    assert first[0] is second[0] is Match.FULL
+    assert router.cache.get_key(get_scope('/api/users/1', root_path='/api'))[3] == '/users/1'
+    assert router.cache.cache_info().misses == 2
+
+
+def test_route_cache_host_case() -> None:
+    router = Router([Route('/users', endpoint)], cache_size=8)
+
+    router.match(get_scope('/users', host=b'Example.com'))
+    router.match(get_scope('/users', host=b'example.com:443'))
+
+    assert router.cache.cache_info().hits == 1
+
+
+def test_route_cache_skips_not_found() -> None:
+    router = Router([Route('/users', endpoint)], cache_size=8)
+
+    assert router.match(get_scope('/unknown'))[0] is Match.NONE
+    assert len(router.cache) == 0
+
+
+def test_route_cache_eviction() -> None:
+    router = Router([Route('/users/{user_id:int}', endpoint)], cache_size=2)
+
+    router.match(get_scope('/users/1'))
+    router.match(get_scope('/users/2'))
+    router.match(get_scope('/users/1'))
+    router.match(get_scope('/users/3'))
+
+    assert router.cache.get(router.cache.get_key(get_scope('/users/1'))) is not None
+    assert router.cache.get(router.cache.get_key(get_scope('/users/2'))) is None
+
+
+def test_route_cache_invalidation() -> None:
+    router = Router([Route('/users/{username}', endpoint, name='username')], cache_size=8)
+    assert router.match(get_scope('/users/me'))[1].name == 'username'
+
+    router.add_route('/users/me', endpoint, name='me')
+
+    assert len(router.cache) == 0
+    assert router.match(get_scope('/users/me'))[1].name == 'me'
+
+
+def test_route_cache_shared_child_scope() -> None:
+    router = Router([Route('/users/{user_id:int}', endpoint)], cache_size=8)
+    _, _, child_scope = router.match(get_scope('/users/1'))
+
+    with pytest.raises(TypeError):
+        child_scope['path_params']['user_id'] = 2
+
+
+def test_route_cache_size() -> None:
+    with pytest.raises(ValueError):
+        RouteCache(0)
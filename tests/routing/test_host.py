@@ -0,0 +1,95 @@
+import pytest
+
+from speedy import Match
+from speedy.exceptions import NoMatchFound
+from speedy.response import PlainTextResponse
+from speedy.routing import Router, Route, Host
+from speedy.types import Message
+from tests.helpers import make_scope
+
+
+def endpoint(request):
+    return PlainTextResponse(f'{request.url.hostname} {request.path_params}')
+
+
+def get_scope(host: bytes, path: str = '/') -> dict:
+    return make_scope(path, headers=[(b'host', host)])
+
+
+@pytest.fixture
+def router() -> Router:
+    api = Router([Route('/users/{user_id:int}', endpoint, name='user')])
+    tenant = Router([Route('/', endpoint, name='index')])
+    return Router(
+        [
+            Host('api.example.com', api, name='api'),
+            Host('{tenant}.example.com', tenant, name='tenant'),
+        ]
+    )
+
+
+@pytest.mark.parametrize(
+    'host, app_index, path_params', (
+            (b'api.example.com', 0, {}),
+            (b'api.example.com:8000', 0, {}),
+            (b'API.Example.com', 0, {}),
+            (b'shop.example.com', 1, {'tenant': 'shop'}),
+            (b'shop.EXAMPLE.com:8000', 1, {'tenant': 'shop'}),
+    )
+)
+def test_host_match(router: Router, host: bytes, app_index: int, path_params: dict) -> None:
+    match, route, child_scope = router.match(get_scope(host))
+    assert match is Match.FULL
+    assert route is router.routes[app_index]
+    assert child_scope['path_params'] == path_params
+
+
+def test_host_match_none(router: Router) -> None:
+    assert router.match(get_scope(b'example.org'))[0] is Match.NONE
+
+
+def test_host_path_for(router: Router) -> None:
+    assert router.path_for('api:user', user_id=1) == '/users/1'
+    assert router.path_for('tenant:index', tenant='shop') == '/'
+    with pytest.raises(NoMatchFound):
+        router.path_for('user', user_id=1)
+
+
+def test_host_invalid() -> None:
+    with pytest.raises(ValueError):
+        Host('/example.com', Router())
+
+
+async def test_host_call(router: Router) -> None:
+    messages: list[Message] = []
+
+    async def receive() -> Message:
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(message: Message) -> None:
+        messages.append(message)
+
+    await router(get_scope(b'api.example.com', '/users/1'), receive, send)
+    await router(get_scope(b'shop.example.com'), receive, send)
+    await router(get_scope(b'api.example.com', '/unknown'), receive, send)
+
+    assert messages[1]['body'] == b"api.example.com {'user_id': 1}"
+    assert messages[3]['body'] == b"shop.example.com {'tenant': 'shop'}"
+    assert messages[4]['status'] == 404
+
+
+@pytest.mark.parametrize(
+    'routes, host, path, index', (
+            ([Host('api.example.com', Router()), Route('/', endpoint)], b'api.example.com', '/', 0),
+            ([Host('api.example.com', Router()), Route('/', endpoint)], b'www.example.com', '/', 1),
+            ([Route('/', endpoint), Host('api.example.com', Router())], b'api.example.com', '/', 0),
+            ([Host('{tenant}.example.com', Router()), Route('/{page}', endpoint)], b'shop.example.com', '/home', 0),
+            ([Route('/{page}', endpoint), Host('{tenant}.example.com', Router())], b'shop.example.com', '/home', 0),
+            ([Route('/', endpoint, methods=['POST']), Host('api.example.com', Router())], b'api.example.com', '/', 1),
+    )
+)
+def test_host_registration_order(routes: list, host: bytes, path: str, index: int) -> None:
+    match, route, _ = Router(routes).match(get_scope(host, path))
+
+    assert match is Match.FULL
+    assert route is routes[index]
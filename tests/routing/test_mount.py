@@ -0,0 +1,120 @@
+import pytest
+
+from speedy import Match
+from speedy.exceptions import NoMatchFound, PathException
+from speedy.response import PlainTextResponse
+from speedy.routing import Router, Route, Mount, Host
+from speedy.types import Message
+from tests.helpers import make_scope
+
+
+def endpoint(request):
+    return PlainTextResponse(f'{request.scope["root_path"]} {request.path_params}')
+
+
+@pytest.fixture
+def router() -> Router:
+    return Router(
+        [
+            Route('/health', endpoint, name='health'),
+            Mount('/api', routes=[Route('/users/{user_id:int}', endpoint, name='user')], name='api'),
+            Mount('/api/v2', routes=[Route('/users', endpoint, name='users')], name='v2'),
+            Mount('/orgs/{org}', routes=[Route('/members', endpoint, name='members')], name='orgs'),
+            Mount('', routes=[Route('/', endpoint, name='index')], name='root'),
+        ]
+    )
+
+
+@pytest.mark.parametrize(
+    'path, root_path, mount_path, child_root_path', (
+            ('/api/users/1', '', '/api', '/api'),
+            ('/api', '', '/api', '/api'),
+            ('/api/v2/users', '', '/api/v2', '/api/v2'),
+            ('/prefix/api/users/1', '/prefix', '/api', '/prefix/api'),
+            ('/orgs/speedy/members', '', '/orgs/{org}', '/orgs/speedy'),
+            ('/', '', '', ''),
+            ('/apiv2', '', '', ''),
+    )
+)
+def test_mount_match(
+        router: Router,
+        path: str,
+        root_path: str,
+        mount_path: str,
+        child_root_path: str
+) -> None:
+    match, route, child_scope = router.match(make_scope(path, root_path=root_path))
+    assert match is Match.FULL
+    assert route.path == mount_path
+    assert child_scope['root_path'] == child_root_path
+    assert child_scope['app_root_path'] == root_path
+
+
+@pytest.mark.parametrize(
+    'name, path_params, path', (
+            ('api:user', {'user_id': 1}, '/api/users/1'),
+            ('v2:users', {}, '/api/v2/users'),
+            ('orgs:members', {'org': 'speedy'}, '/orgs/speedy/members'),
+            ('root:index', {}, '/'),
+    )
+)
+def test_mount_path_for(router: Router, name: str, path_params: dict, path: str) -> None:
+    assert router.path_for(name, **path_params) == path
+
+
+@pytest.mark.parametrize('name, path_params', (('user', {'user_id': 1}), ('orgs:members', {})))
+def test_mount_path_for_no_match(router: Router, name: str, path_params: dict) -> None:
+    with pytest.raises(NoMatchFound):
+        router.path_for(name, **path_params)
+
+
+@pytest.mark.parametrize(
+    'path, kwargs, exception', (
+            ('api', {'routes': []}, PathException),
+            ('/api/', {'routes': []}, PathException),
+            ('/api', {}, ValueError),
+            ('/api', {'routes': [], 'app': Router()}, ValueError),
+    )
+)
+def test_mount_invalid(path: str, kwargs: dict, exception: type[Exception]) -> None:
+    with pytest.raises(exception):
+        Mount(path, **kwargs)
+
+
+async def test_mount_call(router: Router) -> None:
+    messages: list[Message] = []
+
+    async def receive() -> Message:
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(message: Message) -> None:
+        messages.append(message)
+
+    await router(make_scope('/api/users/1'), receive, send)
+    await router(make_scope('/orgs/speedy/members'), receive, send)
+    await router(make_scope('/api/unknown'), receive, send)
+
+    assert messages[1]['body'] == b"/api {'user_id': 1}"
+    assert messages[3]['body'] == b"/orgs/speedy {'org': 'speedy'}"
+    assert messages[4]['status'] == 404
+
+
+@pytest.mark.parametrize(
+    'routes, path, index', (
+            ([Host('api.example.com', Router([Route('/', endpoint)])), Mount('', routes=[])], '/', 0),
+            ([Mount('', routes=[]), Host('api.example.com', Router([Route('/', endpoint)]))], '/', 0),
+            ([Host('{t}.example.com', Router([Route('/users', endpoint)])), Mount('/users', routes=[])], '/users', 0),
+            ([Mount('/users', routes=[]), Host('{t}.example.com', Router([Route('/users', endpoint)]))], '/users', 0),
+            ([Mount('/users', routes=[]), Route('/users', endpoint)], '/users', 0),
+            ([Route('/users/{name}', endpoint), Mount('/users', routes=[])], '/users/me', 0),
+            ([Mount('/users', routes=[]), Route('/users/{name}', endpoint)], '/users/me', 0),
+    )
+)
+def test_mount_registration_order(routes: list, path: str, index: int) -> None:
+    router = Router(routes)
+    scope = make_scope(path, headers=[(b'host', b'api.example.com')])
+
+    match, route, _ = router.match(scope)
+
+    assert match is Match.FULL
+    assert route is routes[index]
@@ -0,0 +1,170 @@
+import uuid
+
+import pytest
+
+from speedy import Match, Speedy
+from speedy.connection.request import Request
+from speedy.datastructures import URL
+from speedy.exceptions import NoMatchFound
+from speedy.response import PlainTextResponse
+from speedy.routing import Router, Route, Mount, Host
+from speedy.types import Message
+from tests.helpers import make_scope
+
+
+def endpoint(request):
+    return PlainTextResponse('endpoint')
+
+
+def user_endpoint(request):
+    return PlainTextResponse(f'user {request.path_params["user_id"]}')
+
+
+@pytest.fixture
+def router() -> Router:
+    return Router(
+        [
+            Route('/', endpoint, name='index'),
+            Route('/users', endpoint, name='users'),
+            Route('/users/me', endpoint, name='me'),
+            Route('/users/{user_id:int}', user_endpoint, name='user'),
+            Route('/users/{user_id:int}/posts/{post_id:uuid}', endpoint, name='post'),
+            Route('/users/{username}', endpoint, name='username', methods=['POST']),
+            Route('/files/{name}.{ext}', endpoint, name='file'),
+            Route('/static/{path:path}', endpoint, name='static'),
+        ]
+    )
+
+
+@pytest.mark.parametrize(
+    'path, name, path_params', (
+            ('/', 'index', {}),
+            ('/users', 'users', {}),
+            ('/users/me', 'me', {}),
+            ('/users/1', 'user', {'user_id': 1}),
+            ('/users/1/posts/bf4b8ad4-5e64-4f54-b3e9-1c5c1c5d9b3a',
+             'post', {'user_id': 1, 'post_id': uuid.UUID('bf4b8ad4-5e64-4f54-b3e9-1c5c1c5d9b3a')}),
+            ('/files/report.tar.gz', 'file', {'name': 'report.tar', 'ext': 'gz'}),
+            ('/static/css/main.css', 'static', {'path': 'css/main.css'}),
+            ('/static/', 'static', {'path': ''}),
+    )
+)
+def test_router_match(router: Router, path: str, name: str, path_params: dict) -> None:
+    match, route, child_scope = router.match(make_scope(path))
+    assert match is Match.FULL
+    assert route.name == name
+    assert child_scope['path_params'] == path_params
+
+
+@pytest.mark.parametrize('path', ('/user', '/users/', '/users/1/posts/1', '/files/report', '/unknown'))
+def test_router_match_none(router: Router, path: str) -> None:
+    assert router.match(make_scope(path)) == (Match.NONE, None, {})
+
+
+def test_router_match_partial(router: Router) -> None:
+    match, route, child_scope = router.match(make_scope('/users/john'))
+    assert match is Match.PARTIAL
+    assert route.name == 'username'
+    assert child_scope['path_params'] == {'username': 'john'}
+
+
+def test_router_match_method_fallback(router: Router) -> None:
+    match, route, _ = router.match(make_scope('/users/me', method='POST'))
+    assert match is Match.FULL
+    assert route.name == 'username'
+
+
+def test_router_match_same_path_methods() -> None:
+    router = Router()
+    router.add_route('/items/{item_id:int}', endpoint, name='get_item')
+    router.add_route('/items/{item_id:int}', endpoint, name='delete_item', methods=['DELETE'])
+    _, route, _ = router.match(make_scope('/items/1', method='DELETE'))
+    assert route.name == 'delete_item'
+
+
+@pytest.mark.parametrize(
+    'routes, path, host, index', (
+            ([Route('/users/{user_id}', endpoint), Route('/users/me', endpoint)], '/users/me', b'example.com', 1),
+            ([Route('/{page}/me', endpoint), Route('/users/{name}', endpoint)], '/users/me', b'example.com', 1),
+            ([Mount('/api', Router()), Mount('/api/v1', Router())], '/api/v1/users', b'example.com', 1),
+            ([Mount('/{version}', Router()), Mount('/api', Router())], '/api/users', b'example.com', 1),
+            ([Mount('', Router()), Mount('/api', Router())], '/api/users', b'example.com', 1),
+            ([Mount('', Router()), Mount('/{version}', Router())], '/api/users', b'example.com', 1),
+            ([Host('{sub}.example.com', Router()), Host('api.example.com', Router())], '/', b'api.example.com', 1),
+            ([Mount('/api', Router()), Route('/api/users', endpoint)], '/api/users', b'example.com', 0),
+            ([Route('/api/users', endpoint), Mount('/api', Router())], '/api/users', b'example.com', 0),
+    )
+)
+def test_router_match_precedence(routes: list, path: str, host: bytes, index: int) -> None:
+    match, route, _ = Router(routes).match(make_scope(path, headers=[(b'host', host)]))
+
+    assert match is Match.FULL
+    assert route is routes[index]
+
+
+def test_router_route_decorator() -> None:
+    router = Router()
+
+    @router.route('/items', methods=['POST'])
+    def items(request):
+        return PlainTextResponse('items')
+
+    assert [route.name for route in router.routes] == ['items']
+    assert router.match(make_scope('/items', method='POST'))[0] is Match.FULL
+
+
+async def test_router_call(router: Router) -> None:
+    messages: list[Message] = []
+
+    async def receive() -> Message:
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(message: Message) -> None:
+        messages.append(message)
+
+    await router(make_scope('/users/42'), receive, send)
+    await router(make_scope('/unknown'), receive, send)
+    await router(make_scope('/users/john'), receive, send)
+
+    assert [message['status'] for message in messages if 'status' in message] == [200, 404, 405]
+    assert messages[1]['body'] == b'user 42'
+    assert (b'allow', b'POST') in messages[4]['headers']
+
+
+@pytest.mark.parametrize(
+    'name, path_params, path', (
+            ('index', {}, '/'),
+            ('user', {'user_id': 1}, '/users/1'),
+            ('username', {'username': 'john'}, '/users/john'),
+            ('file', {'name': 'report', 'ext': 'pdf'}, '/files/report.pdf'),
+            ('static', {'path': 'css/main.css'}, '/static/css/main.css'),
+    )
+)
+def test_router_path_for(router: Router, name: str, path_params: dict, path: str) -> None:
+    assert router.path_for(name, **path_params) == path
+    assert str(router.url_path_for(name, **path_params)) == path
+
+
+def test_router_path_for_same_name() -> None:
+    router = Router(
+        [
+            Route('/users', endpoint, name='users'),
+            Route('/users/{user_id:int}', endpoint, name='users'),
+        ]
+    )
+    assert router.path_for('users') == '/users'
+    assert router.path_for('users', user_id=1) == '/users/1'
+
+
+@pytest.mark.parametrize('name, path_params', (('unknown', {}), ('user', {}), ('user', {'user_id': 1, 'extra': 1})))
+def test_router_path_for_no_match(router: Router, name: str, path_params: dict) -> None:
+    with pytest.raises(NoMatchFound):
+        router.path_for(name, **path_params)
+
+
+def test_request_url_for(router: Router) -> None:
+    app = Speedy(routes=router.routes)
+    request = Request({'type': 'http', 'app': app, 'root_path': '/api', 'headers': []})
+
+    assert request.path_for('user', user_id=1) == '/api/users/1'
+    assert request.url_for('user', user_id=1) == URL('/api/users/1')
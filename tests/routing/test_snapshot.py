@@ -0,0 +1,116 @@
+import json
+
+import pytest
+
+from speedy import Match
+from speedy.response import PlainTextResponse
+from speedy.routing import Router, Route, Mount, Host, RouteSnapshot
+from speedy.routing.base import PRELOADED_PATHS
+from tests.helpers import make_scope
+
+
+def endpoint(request):
+    return PlainTextResponse('endpoint')
+
+
+def get_routes() -> list:
+    return [
+        Route('/users/{user_id:int}', endpoint, name='user'),
+        Route('/files/{name}.{ext}', endpoint, name='file'),
+        Mount('/api', routes=[Route('/items/{item_id:uuid}', endpoint, name='item')], name='api'),
+        Host('{tenant}.example.com', Router([Route('/', endpoint, name='home')]), name='tenant'),
+    ]
+
+
+def test_route_snapshot_build(tmp_path) -> None:
+    snapshot_path = tmp_path / 'routes.snapshot'
+    snapshot = RouteSnapshot(snapshot_path)
+    assert not snapshot.load()
+    snapshot.build(lambda: Router(get_routes()))
+    assert snapshot_path.exists()
+
+    loaded_snapshot = RouteSnapshot(snapshot_path)
+    assert loaded_snapshot.load()
+    assert set(loaded_snapshot.paths) == {
+        '/users/{user_id:int}', '/files/{name}.{ext}', '/api/{path:path}', '/api',
+        '/items/{item_id:uuid}', '{tenant}.example.com', '/',
+    }
+    assert loaded_snapshot.paths['/files/{name}.{ext}'].segments == (('files', ()), ('{name}.{ext}', ('name', 'ext')))
+
+    with loaded_snapshot.preload():
+        router = Router(get_routes())
+    assert PRELOADED_PATHS.get() is None
+    assert loaded_snapshot.is_current(router)
+    assert not loaded_snapshot.sync(router)
+    assert router.routes[0].compiled_path.path is loaded_snapshot.paths['/users/{user_id:int}']
+    assert Router(get_routes()).routes[0].compiled_path.path is not loaded_snapshot.paths['/users/{user_id:int}']
+
+    match, _, child_scope = router.match(make_scope('/files/report.pdf'))
+    assert match is Match.FULL
+    assert child_scope['path_params'] == {'name': 'report', 'ext': 'pdf'}
+    assert router.path_for('api:item', item_id='bf4b8ad4-5e64-4f54-b3e9-1c5c1c5d9b3a') == (
+        '/api/items/bf4b8ad4-5e64-4f54-b3e9-1c5c1c5d9b3a'
+    )
+
+
+def test_route_snapshot_load_definitions_hash(tmp_path) -> None:
+    snapshot = RouteSnapshot(tmp_path / 'routes.snapshot')
+    snapshot.dump(Router(get_routes()))
+
+    assert RouteSnapshot(snapshot.path).load(snapshot.definitions_hash)
+    assert not RouteSnapshot(snapshot.path).load('outdated')
+
+
+def test_route_snapshot_outdated_definitions(tmp_path) -> None:
+    snapshot = RouteSnapshot(tmp_path / 'routes.snapshot')
+    snapshot.dump(Router(get_routes()))
+    preloaded: list[dict | None] = []
+
+    def get_router() -> Router:
+        preloaded.append(PRELOADED_PATHS.get())
+        return Router([*get_routes(), Route('/health', endpoint)])
+
+    router = snapshot.build(get_router)
+
+    assert len(preloaded) == 2
+    assert preloaded[0] and preloaded[1] is None
+    assert snapshot.is_current(router)
+    assert RouteSnapshot(snapshot.path).load(snapshot.definitions_hash)
+
+    preloaded.clear()
+    snapshot.build(get_router)
+    assert len(preloaded) == 1 and preloaded[0]
+
+
+def test_route_snapshot_sync(tmp_path) -> None:
+    snapshot = RouteSnapshot(tmp_path / 'routes.snapshot')
+    snapshot.dump(Router(get_routes()))
+
+    router = Router([*get_routes(), Route('/health', endpoint)])
+    assert not snapshot.is_current(router)
+    assert snapshot.sync(router)
+    assert snapshot.is_current(router)
+
+
+@pytest.mark.parametrize(
+    'field, value', (
+            ('version', 0),
+            ('convertors', 'unknown'),
+    )
+)
+def test_route_snapshot_invalid(tmp_path, field: str, value: object) -> None:
+    snapshot_path = tmp_path / 'routes.snapshot'
+    RouteSnapshot(snapshot_path).dump(Router(get_routes()))
+    snapshot = json.loads(snapshot_path.read_text())
+    snapshot[field] = value
+    snapshot_path.write_text(json.dumps(snapshot))
+
+    loaded_snapshot = RouteSnapshot(snapshot_path)
+    assert not loaded_snapshot.load()
+    assert loaded_snapshot.paths == {}
+
+
+def test_route_snapshot_corrupted(tmp_path) -> None:
+    snapshot_path = tmp_path / 'routes.snapshot'
+    snapshot_path.write_text('{')
+    assert not RouteSnapshot(snapshot_path).load()
@@ -0,0 +1,114 @@
+import pytest
+
+from speedy import Speedy
+from speedy.exceptions import MiddlewareException
+from speedy.middleware import Middleware
+from speedy.response import PlainTextResponse
+from speedy.routing import Route
+from speedy.types import Message
+from tests.helpers import make_scope, call_app
+
+
+def endpoint(request):
+    return PlainTextResponse('endpoint')
+
+
+class TraceMiddleware:
+    def __init__(self, app, name: str, *, trace: list[str]) -> None:
+        self.app = app
+        self.name = name
+        self.trace = trace
+
+    async def __call__(self, scope, receive, send) -> None:
+        self.trace.append(self.name)
+        await self.app(scope, receive, send)
+
+
+class SyncMiddleware:
+    def __init__(self, app) -> None:
+        self.app = app
+
+    def __call__(self, scope, receive, send) -> None:
+        pass
+
+
+async def test_speedy_middleware_stack() -> None:
+    trace: list[str] = []
+    app = Speedy(
+        middleware=[
+            Middleware(TraceMiddleware, 'outer', trace=trace),
+            Middleware(TraceMiddleware, 'inner', trace=trace),
+        ],
+        routes=[Route('/', endpoint)]
+    )
+    app.add_middleware(TraceMiddleware, 'first', trace=trace)
+
+    scope = make_scope('/')
+    messages = await call_app(app, scope)
+
+    assert trace == ['first', 'outer', 'inner']
+    assert scope['app'] is app
+    assert messages[1]['body'] == b'endpoint'
+    assert app.middleware_stack.app.app.app is app.router
+    assert [middleware.args for middleware in app.user_middleware] == [('first',), ('outer',), ('inner',)]
+
+
+def test_speedy_without_middleware() -> None:
+    app = Speedy()
+    assert app.middleware_stack is app.router
+
+
+@pytest.mark.parametrize(
+    'middleware', (
+            Middleware(object),
+            Middleware(SyncMiddleware),
+            Middleware(TraceMiddleware, 'name'),
+            Middleware(TraceMiddleware, 'name', trace=[], unknown=True),
+    )
+)
+def test_speedy_invalid_middleware(middleware: Middleware) -> None:
+    with pytest.raises(MiddlewareException):
+        Speedy(middleware=[middleware])
+
+
+def test_middleware_repr() -> None:
+    assert repr(Middleware(TraceMiddleware, 'name', trace=[])) == "Middleware(TraceMiddleware, 'name', trace=[])"
+
+
+async def test_speedy_lifespan() -> None:
+    messages: list[Message] = []
+    received = iter(({'type': 'lifespan.startup'}, {'type': 'lifespan.shutdown'}))
+    app = Speedy(routes=[Route('/', endpoint)])
+
+    async def receive() -> Message:
+        return next(received)
+
+    async def send(message: Message) -> None:
+        messages.append(message)
+
+    await app({'type': 'lifespan', 'asgi': {'version': '3.0'}}, receive, send)
+
+    assert messages == [{'type': 'lifespan.startup.complete'}, {'type': 'lifespan.shutdown.complete'}]
+
+
+class OutermostMiddleware(TraceMiddleware):
+    outermost = True
+
+
+def test_speedy_add_middleware_keeps_stack() -> None:
+    app = Speedy(middleware=[
+        Middleware(OutermostMiddleware, 'limit', trace=[]),
+        Middleware(TraceMiddleware, 'inner', trace=[]),
+    ])
+    limit, inner = app.middleware_stack, app.middleware_stack.app
+
+    app.add_middleware(TraceMiddleware, 'added', trace=[])
+    app.add_middleware(OutermostMiddleware, 'first', trace=[])
+
+    stack = [app.middleware_stack]
+    while len(stack) < 4:
+        stack.append(stack[-1].app)
+    assert [layer.name for layer in stack] == ['first', 'limit', 'added', 'inner']
+    assert stack[1] is limit
+    assert stack[3] is inner
+    assert stack[3].app is app.router
@@ -0,0 +1,95 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from speedy.conditional import conditional, format_http_date, is_not_modified, make_etag, quote_etag
+from speedy.response import PlainTextResponse
+from speedy.routing import Router, Route
+from speedy.types import Message
+
+LAST_MODIFIED = 'Wed, 21 Oct 2015 07:28:00 GMT'
+
+
+def test_make_etag() -> None:
+    etag = make_etag(b'body')
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag == make_etag(b'body')
+    assert etag != make_etag(b'other')
+
+
+@pytest.mark.parametrize(
+    'etag, expected', (
+            ('v1', '"v1"'),
+            ('"v1"', '"v1"'),
+            ('W/"v1"', 'W/"v1"'),
+    )
+)
+def test_quote_etag(etag: str, expected: str) -> None:
+    assert quote_etag(etag) == expected
+
+
+@pytest.mark.parametrize(
+    'value', (
+            datetime(2015, 10, 21, 7, 28, tzinfo=timezone.utc),
+            datetime(2015, 10, 21, 7, 28),
+            1445412480,
+            LAST_MODIFIED,
+    )
+)
+def test_format_http_date(value) -> None:
+    assert format_http_date(value) == LAST_MODIFIED
+
+
+@pytest.mark.parametrize(
+    'headers, etag, last_modified, expected', (
+            ({'if-none-match': '"v1"'}, '"v1"', None, True),
+            ({'if-none-match': '"v0", W/"v1"'}, '"v1"', None, True),
+            ({'if-none-match': '"v1"'}, 'W/"v1"', None, True),
+            ({'if-none-match': '*'}, '"v1"', None, True),
+            ({'if-none-match': '*'}, None, None, False),
+            ({'if-none-match': '"v0"'}, '"v1"', None, False),
+            ({'if-none-match': '"v0"', 'if-modified-since': LAST_MODIFIED}, '"v1"', LAST_MODIFIED, False),
+            ({'if-modified-since': LAST_MODIFIED}, None, LAST_MODIFIED, True),
+            ({'if-modified-since': 'Wed, 21 Oct 2015 07:27:59 GMT'}, None, LAST_MODIFIED, False),
+            ({'if-modified-since': 'invalid'}, None, LAST_MODIFIED, False),
+            ({}, '"v1"', LAST_MODIFIED, False),
+    )
+)
+def test_is_not_modified(headers: dict, etag: str | None, last_modified: str | None, expected: bool) -> None:
+    assert is_not_modified(headers, etag, last_modified) is expected
+
+
+@pytest.mark.parametrize(
+    'headers, status, rendered', (
+            ([], 200, True),
+            ([(b'if-none-match', b'"v2"')], 200, True),
+            ([(b'if-none-match', b'"v1"')], 304, False),
+            ([(b'if-modified-since', LAST_MODIFIED.encode())], 304, False),
+    )
+)
+async def test_conditional(headers: list, status: int, rendered: bool) -> None:
+    renders: list[str] = []
+    messages: list[Message] = []
+
+    @conditional(etag=lambda request: 'v1', last_modified=lambda request: 1445412480)
+    async def article(request):
+        renders.append(request.path_params['article_id'])
+        return PlainTextResponse('article')
+
+    router = Router([Route('/articles/{article_id}', article)])
+
+    async def receive() -> Message:
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(message: Message) -> None:
+        messages.append(message)
+
+    scope = {'type': 'http', 'method': 'GET', 'path': '/articles/1', 'root_path': '', 'query_string': b'', 'headers': headers}
+    await router(scope, receive, send)
+
+    response_headers = dict(messages[0]['headers'])
+    assert messages[0]['status'] == status
+    assert response_headers[b'etag'] == b'"v1"'
+    assert response_headers[b'last-modified'] == LAST_MODIFIED.encode()
+    assert bool(renders) is rendered
+    assert messages[1]['body'] == (b'article' if rendered else b'')
@@ -1,6 +1,8 @@
 import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
-from speedy.concurrency import sync_to_thread
+from speedy.concurrency import sync_to_thread, get_thread_pool_queue_size, _State
 
 
 def func():
@@ -10,3 +12,25 @@ def func():
 def test_sync_to_thread():
     loop = asyncio.new_event_loop()
     assert loop.run_until_complete(sync_to_thread(func)) == 1
+
+
+async def test_thread_pool_queue_size():
+    event = threading.Event()
+    executor = _State.EXECUTOR = ThreadPoolExecutor(max_workers=1)
+    try:
+        running = asyncio.ensure_future(sync_to_thread(event.wait))
+        queued = [asyncio.ensure_future(sync_to_thread(func)) for _ in range(2)]
+        await asyncio.sleep(0.05)
+        assert get_thread_pool_queue_size() == 2
+
+        queued[0].cancel()
+        await asyncio.sleep(0)
+        assert get_thread_pool_queue_size() == 1
+
+        event.set()
+        assert await running is True
+        assert await queued[1] == 1
+        assert get_thread_pool_queue_size() == 0
+    finally:
+        _State.EXECUTOR = None
+        executor.shutdown()
@@ -0,0 +1,43 @@
+import re
+import uuid
+
+import pytest
+
+from speedy.utils.convertors import CONVERTOR_TYPES
+
+
+@pytest.mark.parametrize(
+    'convertor_type, value, expected', (
+            ('str', 'name', 'name'),
+            ('str', '', None),
+            ('path', 'a/b', 'a/b'),
+            ('int', '42', 42),
+            ('int', '-42', None),
+            ('int', '4.2', None),
+            ('int', '²', None),
+            ('int', '', None),
+            ('float', '4.2', 4.2),
+            ('float', '42', 42.0),
+            ('float', '4.', None),
+            ('float', '.2', None),
+            ('float', 'nan', None),
+            ('uuid', 'bf4b8ad4-5e64-4f54-b3e9-1c5c1c5d9b3a', uuid.UUID('bf4b8ad4-5e64-4f54-b3e9-1c5c1c5d9b3a')),
+            ('uuid', 'BF4B8AD4-5E64-4F54-B3E9-1C5C1C5D9B3A', None),
+            ('uuid', 'bf4b8ad45e644f54b3e91c5c1c5d9b3a', None),
+            ('uuid', 'bf4b8ad4-5e64-4f54-b3e9-1c5c1c5d9b3-', None),
+    )
+)
+def test_convertor_match(convertor_type: str, value: str, expected: object) -> None:
+    assert CONVERTOR_TYPES[convertor_type].match(value) == expected
+
+
+@pytest.mark.parametrize('convertor_type', ('str', 'int', 'float', 'uuid'))
+@pytest.mark.parametrize(
+    'value', ('1', '0.5', 'abc', '', '1e5', ' 1', 'bf4b8ad4-5e64-4f54-b3e9-1c5c1c5d9b3a', '00000000-0000-0000-0000-000000000000')
+)
+def test_convertor_match_agrees_with_regex(convertor_type: str, value: str) -> None:
+    convertor = CONVERTOR_TYPES[convertor_type]
+    matched = convertor.match(value)
+    assert (matched is not None) == (re.fullmatch(convertor.regex, value) is not None)
+    if matched is not None:
+        assert matched == convertor.convert(value)
@@ -1,6 +1,8 @@
 import functools
 
-from speedy.utils.helpers import unwrap_partial
+import pytest
+
+from speedy.utils.helpers import unwrap_partial, get_host, get_route_path
 
 
 def test_unwrap_partial() -> None:
@@ -11,3 +13,33 @@ def test_unwrap_partial() -> None:
 
     assert wrapped() == 3
     assert unwrap_partial(wrapped) is func
+
+
+@pytest.mark.parametrize(
+    'scope, host', (
+            ({'headers': [(b'host', b'example.com:8000')]}, 'example.com'),
+            ({'headers': [(b'host', b'Example.COM')]}, 'example.com'),
+            ({'headers': [(b'host', b'[::1]:8000')]}, '[::1]'),
+            ({'headers': [(b'host', b'[::1]')]}, '[::1]'),
+            ({'headers': [(b'host', b'example.com:')]}, 'example.com:'),
+            ({'headers': [], 'server': ('127.0.0.1', 8000)}, '127.0.0.1'),
+            ({'headers': []}, ''),
+    )
+)
+def test_get_host(scope: dict, host: str) -> None:
+    assert get_host(scope) == host
+
+
+@pytest.mark.parametrize(
+    'path, root_path, route_path', (
+            ('/api/users', '', '/api/users'),
+            ('/api/users', '/api', '/users'),
+            ('/api', '/api', ''),
+            ('/apiv2/users', '/api', '/apiv2/users'),
+            ('/v1.0/users', '/v1.0', '/users'),
+            ('/v1x0/users', '/v1.0', '/v1x0/users'),
+            ('/users', '/api', '/users'),
+    )
+)
+def test_get_route_path(path: str, root_path: str, route_path: str) -> None:
+    assert get_route_path({'path': path, 'root_path': root_path}) == route_path